@@ -5,6 +5,7 @@ Exposes ML endpoints for classification, summarization, and clustering
 from typing import List, Optional
 from fastapi import FastAPI, HTTPException, status, File, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from loguru import logger
 import uvicorn
@@ -17,9 +18,19 @@ from ai_service.pipelines.cluster import ClusteringPipeline
 from ai_service.pipelines.verification import VerificationPipeline
 from ai_service.pipelines.fact_check import FactCheckPipeline
 from ai_service.pipelines.processor import UnifiedProcessor
+from ai_service.fetchers.orchestrator import MultiSourceFetcher
+from ai_service.models.generation_profiles import GENERATION_PROFILES, DEFAULT_PROFILE
+from ai_service.models.registry import model_registry
 from ai_service.utils import setup_logging
+from ai_service.utils.memory import MemoryGovernor
+from ai_service.utils.batching import batching_metrics
+from ai_service.utils.http_client import http_client
+from ai_service.utils.inference import InferenceExecutor, ServiceOverloaded, parse_endpoint_limits
+from ai_service.utils.process_pool import ProcessInferencePool, RemotePipeline
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
 import json
+import threading
 
 
 # Initialize logging
@@ -48,9 +59,29 @@ clustering_pipeline = None
 verification_pipeline = None
 factcheck_pipeline = None
 unified_processor = None
+multi_source_fetcher = None
+inference_pool = None
+# The poll cycle in progress; concurrent /api/fetch/all calls and the
+# background refresh await this task instead of starting their own
+fetch_cycle_task = None
+# NewsData key the running cycle was started with (None: the configured one)
+fetch_cycle_key = None
+next_background_refresh = None
+# Preload/warm-up progress reported by /ready
+readiness = {"ready": False, "models": {}}
 REALTIME_DATA_FILE = "ai_service/data/realtime_news.json"
 REFRESH_INTERVAL_SECONDS = 86400 # Refresh news every 24 hours (24 * 3600)
 
+# Model work runs on a bounded pool so the event loop stays free for /health and
+# light requests; slow endpoints get lower caps (override with AI_ENDPOINT_LIMITS)
+ENDPOINT_LIMITS = {"summarize": 8, "cluster": 2, "factcheck": 4, "process": 8, "fetch": 1}
+inference = InferenceExecutor(
+    max_workers=int(os.getenv("AI_INFERENCE_WORKERS", "4")),
+    max_pending=int(os.getenv("AI_INFERENCE_MAX_PENDING", "64")),
+    endpoint_limits={**ENDPOINT_LIMITS, **parse_endpoint_limits(os.getenv("AI_ENDPOINT_LIMITS"))},
+    retry_after=int(os.getenv("AI_RETRY_AFTER_SECONDS", "5"))
+)
+
 
 # Request/Response Models
 class ClassifyRequest(BaseModel):
@@ -78,6 +109,7 @@ class SummarizeRequest(BaseModel):
     text: str = Field(..., description="Text to summarize", min_length=50)
     max_length: int = Field(150, description="Maximum summary length", ge=30, le=500)
     min_length: int = Field(30, description="Minimum summary length", ge=10, le=200)
+    profile: str = Field(DEFAULT_PROFILE, description="Decoding profile: 'extractive', 'fast', 'balanced' or 'quality'")
 
 
 class SummarizeResponse(BaseModel):
@@ -86,6 +118,7 @@ class SummarizeResponse(BaseModel):
     original_length: Optional[int]
     summary_length: Optional[int]
     compression_ratio: Optional[float]
+    profile: Optional[str] = None
     error: Optional[str] = None
 
 
@@ -93,6 +126,7 @@ class BatchSummarizeRequest(BaseModel):
     texts: List[str] = Field(..., description="List of texts to summarize")
     max_length: int = Field(150, ge=30, le=500)
     min_length: int = Field(30, ge=10, le=200)
+    profile: str = Field(DEFAULT_PROFILE, description="Decoding profile: 'extractive', 'fast', 'balanced' or 'quality'")
 
 
 class ClusterRequest(BaseModel):
@@ -116,6 +150,13 @@ class SimilarityRequest(BaseModel):
     threshold: float = Field(0.5, description="Minimum similarity threshold", ge=0.0, le=1.0)
 
 
+class BatchSimilarityRequest(BaseModel):
+    query_texts: List[str] = Field(..., description="Query texts", min_items=1)
+    corpus_texts: List[str] = Field(..., description="Corpus of texts to search")
+    top_k: int = Field(5, description="Number of similar texts to return per query", ge=1, le=50)
+    threshold: float = Field(0.5, description="Minimum similarity threshold", ge=0.0, le=1.0)
+
+
 class VerificationRequest(BaseModel):
     text: str = Field(..., description="Text to verify", min_length=10)
     source_url: Optional[str] = Field(None, description="URL of the news source")
@@ -129,6 +170,9 @@ class VerificationResponse(BaseModel):
     error: Optional[str] = None
     details: Optional[dict] = None
 
+class ProcessReportRequest(VerificationRequest):
+    summary_profile: Optional[str] = Field(None, description="Summarizer decoding profile override")
+
 class UnifiedProcessResponse(BaseModel):
     success: bool
     data: Optional[dict] = None
@@ -137,50 +181,221 @@ class UnifiedProcessResponse(BaseModel):
 
 
 # Helper functions
+# One lock per pipeline so a burst of cold requests (or the preloader racing a
+# request) initializes each pipeline exactly once
+_init_locks = {
+    name: threading.Lock()
+    for name in ("classify", "summarize", "cluster", "verify", "factcheck", "process", "fetch")
+}
+
+
 def get_classification_pipeline():
     global classification_pipeline
-    if classification_pipeline is None:
-        logger.info("Initializing classification pipeline")
-        classification_pipeline = ClassificationPipeline()
+    with _init_locks["classify"]:
+        if classification_pipeline is None:
+            logger.info("Initializing classification pipeline")
+            classification_pipeline = ClassificationPipeline()
     return classification_pipeline
 
 
 def get_summarization_pipeline():
     global summarization_pipeline
-    if summarization_pipeline is None:
-        logger.info("Initializing summarization pipeline")
-        summarization_pipeline = SummarizationPipeline()
+    with _init_locks["summarize"]:
+        if summarization_pipeline is None:
+            logger.info("Initializing summarization pipeline")
+            summarization_pipeline = SummarizationPipeline()
     return summarization_pipeline
 
 
 def get_clustering_pipeline():
     global clustering_pipeline
-    if clustering_pipeline is None:
-        logger.info("Initializing clustering pipeline")
-        clustering_pipeline = ClusteringPipeline()
+    with _init_locks["cluster"]:
+        if clustering_pipeline is None:
+            logger.info("Initializing clustering pipeline")
+            clustering_pipeline = ClusteringPipeline()
     return clustering_pipeline
 
 def get_verification_pipeline():
     global verification_pipeline
-    if verification_pipeline is None:
-        logger.info("Initializing Verification Pipeline (Lazy Loading)...")
-        verification_pipeline = VerificationPipeline()
+    with _init_locks["verify"]:
+        if verification_pipeline is None:
+            logger.info("Initializing Verification Pipeline (Lazy Loading)...")
+            verification_pipeline = VerificationPipeline()
     return verification_pipeline
 
 def get_factcheck_pipeline():
     global factcheck_pipeline
-    if factcheck_pipeline is None:
-        logger.info("Initializing Fact-Check Pipeline (Lazy Loading)...")
-        factcheck_pipeline = FactCheckPipeline()
+    with _init_locks["factcheck"]:
+        if factcheck_pipeline is None:
+            logger.info("Initializing Fact-Check Pipeline (Lazy Loading)...")
+            factcheck_pipeline = FactCheckPipeline()
     return factcheck_pipeline
 
 def get_unified_processor():
     global unified_processor
-    if unified_processor is None:
-        logger.info("Initializing Unified Processor (Lazy Loading)...")
-        unified_processor = UnifiedProcessor()
+    with _init_locks["process"]:
+        if unified_processor is None:
+            logger.info("Initializing Unified Processor (Lazy Loading)...")
+            high_water_mb = os.getenv("AI_MEMORY_HIGH_WATER_MB", "4096")
+            collect_every = os.getenv("AI_GC_EVERY_N_REQUESTS", "100")
+            unified_processor = UnifiedProcessor(
+                # Every inference worker may be running a report at once
+                max_concurrent_reports=inference.max_workers,
+                memory_governor=MemoryGovernor(
+                    high_water_mb=float(high_water_mb) if high_water_mb else None,
+                    collect_every=int(collect_every) if collect_every else None
+                )
+            )
     return unified_processor
 
+def get_multi_source_fetcher():
+    """
+    Long-lived fetcher for /api/fetch/all and the background refresh.
+    News is analysed with the API's own unified processor, so poll cycles
+    reuse the models the endpoints already hold.
+    """
+    global multi_source_fetcher
+    with _init_locks["fetch"]:
+        if multi_source_fetcher is None:
+            from dotenv import load_dotenv
+
+            load_dotenv() # Load variables from .env
+            key = os.getenv("NEWSDATA_API_KEY")
+            if not key or key == "your_api_key_here":
+                logger.warning("Using free tier/public APIs where possible. NewsData.io requires a valid key.")
+            logger.info("Initializing Multi-Source Fetcher")
+            # Production Mode: Fetches all available news stories
+            multi_source_fetcher = MultiSourceFetcher(
+                news_api_key=key,
+                test_mode=False,
+                processor=get_unified_processor()
+            )
+    return multi_source_fetcher
+
+# Pipelines by the name used in AI_PRELOAD and AI_POOL_PIPELINES
+PIPELINE_TARGETS = {
+    "classify": ("classification_pipeline", get_classification_pipeline),
+    "summarize": ("summarization_pipeline", get_summarization_pipeline),
+    "cluster": ("clustering_pipeline", get_clustering_pipeline),
+    "verify": ("verification_pipeline", get_verification_pipeline),
+    "factcheck": ("factcheck_pipeline", get_factcheck_pipeline),
+    "process": ("unified_processor", get_unified_processor)
+}
+
+
+def parse_pipeline_names(spec: str) -> List[str]:
+    """Split a comma-separated pipeline list, rejecting unknown names"""
+    names = [name.strip() for name in spec.split(",") if name.strip()]
+    unknown = [name for name in names if name not in PIPELINE_TARGETS]
+    if unknown:
+        raise ValueError(f"Unknown pipeline names: {', '.join(unknown)} (use {', '.join(PIPELINE_TARGETS)})")
+    return names
+
+
+def preload_pipelines(names: List[str], warm_up: bool = True) -> None:
+    """
+    Load the given pipelines concurrently and run one warm-up inference
+    through each, recording progress for /ready.
+    With warm_up=False (before forking the inference workers) they are only
+    loaded, one after another on the calling thread, so no inference or
+    extra thread runs before the fork; they stay "warming" until warmed up.
+    """
+    for name in names:
+        readiness["models"][name] = "pending"
+
+    def load(name: str) -> None:
+        readiness["models"][name] = "loading"
+        try:
+            _, getter = PIPELINE_TARGETS[name]
+            pipeline = getter()
+            readiness["models"][name] = "warming"
+            if not warm_up:
+                if hasattr(pipeline, "preload"):
+                    pipeline.preload()
+                return
+            if hasattr(pipeline, "warm_up"):
+                pipeline.warm_up()
+            readiness["models"][name] = "ready"
+        except Exception as e:
+            logger.error(f"Preloading '{name}' failed: {e}")
+            readiness["models"][name] = f"failed: {e}"
+
+    if names and not warm_up:
+        logger.info(f"Loading pipelines before forking the inference workers: {', '.join(names)}")
+        for name in names:
+            load(name)
+        return
+    if names:
+        logger.info(f"Preloading pipelines: {', '.join(names)}")
+        with ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="preload") as executor:
+            list(executor.map(load, names))
+    readiness["ready"] = all(state == "ready" for state in readiness["models"].values())
+    logger.info(f"Preload finished, ready={readiness['ready']}")
+
+
+def start_inference_pool():
+    """
+    Load the configured pipelines in this process, then fork worker
+    processes that share their weights copy-on-write. The module-level
+    pipelines are replaced by proxies that dispatch to the workers.
+    Must run before any request spawns threads.
+    """
+    global inference_pool
+    names = parse_pipeline_names(os.getenv("AI_POOL_PIPELINES", "classify,summarize,verify,process"))
+
+    targets = {}
+    for name in names:
+        _, getter = PIPELINE_TARGETS[name]
+        targets[name] = getter()
+        if name == "process":
+            targets[name].preload()
+
+    inference_pool = ProcessInferencePool(
+        targets,
+        workers=int(os.getenv("AI_POOL_WORKERS", "2")),
+        threads_per_worker=int(os.getenv("AI_POOL_THREADS_PER_WORKER", "4"))
+    )
+    inference_pool.start()
+    for name in names:
+        global_name, _ = PIPELINE_TARGETS[name]
+        globals()[global_name] = RemotePipeline(inference_pool, name)
+
+
+def warm_up_after_fork(names: List[str]) -> None:
+    """
+    Finish preloading in process serving mode: wait for the workers to warm
+    up the pooled pipelines, then warm up the others in this process
+    """
+    pooled = [name for name in names if name in inference_pool.targets]
+    errors = inference_pool.wait_warm()
+    for name in pooled:
+        readiness["models"][name] = f"failed: {errors[name]}" if name in errors else "ready"
+    preload_pipelines([name for name in names if name not in inference_pool.targets])
+
+
+async def run_inference(endpoint: str, fn, *args, **kwargs):
+    """
+    Run blocking model work on the inference pool.
+    Raises 503 with a Retry-After header when the endpoint or pool is full.
+    """
+    try:
+        return await inference.run(endpoint, fn, *args, **kwargs)
+    except ServiceOverloaded as e:
+        logger.warning(str(e))
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
+
+def check_summary_profile(profile: Optional[str]):
+    if profile is not None and profile not in GENERATION_PROFILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid summary profile. Use one of: {', '.join(GENERATION_PROFILES)}"
+        )
+
 
 # API Endpoints
 @app.get("/")
@@ -196,6 +411,7 @@ async def root():
             "batch_summarize": "/api/summarize/batch",
             "cluster": "/api/cluster",
             "similarity": "/api/similarity",
+            "batch_similarity": "/api/similarity/batch",
             "verify_news": "/api/verify/news",
             "verify_report": "/api/verify/report",
             "process_report": "/api/process/report"
@@ -209,19 +425,108 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness endpoint: 200 once the preloaded pipelines are loaded and warm,
+    503 while they are still loading or if one failed
+    """
+    body = {"ready": readiness["ready"], "models": dict(readiness["models"])}
+    if not readiness["ready"]:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=body)
+    return body
+
+
+@app.get("/api/models/memory")
+async def model_memory():
+    """
+    Memory held by each model in the shared model registry
+    """
+    models = model_registry.memory_report()
+    return {
+        "models": models,
+        "total_memory_mb": round(sum(m["memory_bytes"] for m in models) / (1024 * 1024), 1)
+    }
+
+
+@app.get("/api/metrics/memory")
+async def memory_metrics():
+    """
+    Memory governor decisions and current process memory
+    """
+    if unified_processor is None:
+        return {"success": False, "message": "Unified processor not initialized yet"}
+    return {"success": True, "metrics": unified_processor.memory_metrics()}
+
+
+@app.get("/api/metrics/cache")
+async def cache_metrics():
+    """
+    Result cache counters of the loaded pipelines
+    """
+    caches = {}
+    for name, pipeline in (
+        ("classify", classification_pipeline),
+        ("summarize", summarization_pipeline),
+        ("verify", verification_pipeline)
+    ):
+        if pipeline is not None and pipeline.cache is not None:
+            caches[name] = pipeline.cache.stats()
+    if clustering_pipeline is not None and clustering_pipeline.embedding_store is not None:
+        caches["embeddings"] = clustering_pipeline.embedding_store.info()
+
+    processor_caches = unified_processor.cache_stats() if unified_processor is not None else {}
+    return {"success": True, "caches": caches, "processor": processor_caches}
+
+
+@app.get("/api/metrics/inference")
+async def inference_metrics():
+    """
+    Admission counters and load of the inference executor
+    """
+    return {"success": True, "metrics": inference.metrics()}
+
+
+@app.get("/api/metrics/workers")
+async def worker_metrics():
+    """
+    Load and memory of the inference worker processes (process serving mode)
+    """
+    if inference_pool is None:
+        return {"success": False, "message": "Process-pool serving is not enabled (AI_SERVING_MODE=process)"}
+    return {"success": True, "metrics": inference_pool.metrics()}
+
+
+@app.get("/api/metrics/batching")
+async def batching_metrics_endpoint():
+    """
+    Queue depth and batch-size histograms of the micro-batchers
+    """
+    return {"success": True, "batchers": batching_metrics()}
+
+
+@app.get("/api/metrics/http")
+async def http_metrics():
+    """
+    Connection reuse, retries and latency of outbound HTTP calls per host
+    """
+    return {"success": True, "metrics": http_client.metrics()}
+
+
 @app.post("/api/classify", response_model=ClassifyResponse)
 async def classify_text(request: ClassifyRequest):
     """
     Classify a single text into categories
     """
     try:
-        pipeline = get_classification_pipeline()
-        result = pipeline.process(
+        result = await run_inference("classify", lambda: get_classification_pipeline().submit(
             text=request.text,
             top_k=request.top_k,
             threshold=request.threshold
-        )
+        ))
         return ClassifyResponse(**result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Classification endpoint error: {e}")
         raise HTTPException(
@@ -236,8 +541,10 @@ async def batch_classify_texts(request: BatchClassifyRequest):
     Classify multiple texts
     """
     try:
-        pipeline = get_classification_pipeline()
-        results = pipeline.batch_process(
+        pipeline = await run_inference("classify", get_classification_pipeline)
+        results = await run_inference(
+            "classify",
+            pipeline.batch_process,
             texts=request.texts,
             top_k=request.top_k,
             threshold=request.threshold
@@ -248,6 +555,8 @@ async def batch_classify_texts(request: BatchClassifyRequest):
             "results": results,
             "statistics": statistics
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Batch classification endpoint error: {e}")
         raise HTTPException(
@@ -261,14 +570,17 @@ async def summarize_text(request: SummarizeRequest):
     """
     Summarize a single text
     """
+    check_summary_profile(request.profile)
     try:
-        pipeline = get_summarization_pipeline()
-        result = pipeline.process(
+        result = await run_inference("summarize", lambda: get_summarization_pipeline().submit(
             text=request.text,
             max_length=request.max_length,
-            min_length=request.min_length
-        )
+            min_length=request.min_length,
+            profile=request.profile
+        ))
         return SummarizeResponse(**result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Summarization endpoint error: {e}")
         raise HTTPException(
@@ -282,12 +594,16 @@ async def batch_summarize_texts(request: BatchSummarizeRequest):
     """
     Summarize multiple texts
     """
+    check_summary_profile(request.profile)
     try:
-        pipeline = get_summarization_pipeline()
-        results = pipeline.batch_process(
+        pipeline = await run_inference("summarize", get_summarization_pipeline)
+        results = await run_inference(
+            "summarize",
+            pipeline.batch_process,
             texts=request.texts,
             max_length=request.max_length,
-            min_length=request.min_length
+            min_length=request.min_length,
+            profile=request.profile
         )
         statistics = pipeline.get_statistics(results)
         
@@ -295,6 +611,8 @@ async def batch_summarize_texts(request: BatchSummarizeRequest):
             "results": results,
             "statistics": statistics
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Batch summarization endpoint error: {e}")
         raise HTTPException(
@@ -309,10 +627,12 @@ async def cluster_texts(request: ClusterRequest):
     Cluster similar texts together
     """
     try:
-        pipeline = get_clustering_pipeline()
+        pipeline = await run_inference("cluster", get_clustering_pipeline)
         
         if request.method == "hdbscan":
-            result = pipeline.cluster_hdbscan(
+            result = await run_inference(
+                "cluster",
+                pipeline.cluster_hdbscan,
                 texts=request.texts,
                 min_cluster_size=request.min_cluster_size
             )
@@ -322,7 +642,9 @@ async def cluster_texts(request: ClusterRequest):
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="n_clusters is required for kmeans method"
                 )
-            result = pipeline.cluster_kmeans(
+            result = await run_inference(
+                "cluster",
+                pipeline.cluster_kmeans,
                 texts=request.texts,
                 n_clusters=request.n_clusters
             )
@@ -353,8 +675,10 @@ async def find_similar_texts(request: SimilarityRequest):
     Find similar texts to a query
     """
     try:
-        pipeline = get_clustering_pipeline()
-        results = pipeline.find_similar(
+        pipeline = await run_inference("similarity", get_clustering_pipeline)
+        results = await run_inference(
+            "similarity",
+            pipeline.find_similar,
             query_text=request.query_text,
             corpus_texts=request.corpus_texts,
             top_k=request.top_k,
@@ -367,6 +691,8 @@ async def find_similar_texts(request: SimilarityRequest):
             "similar_texts": results,
             "num_results": len(results)
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Similarity endpoint error: {e}")
         raise HTTPException(
@@ -375,18 +701,56 @@ async def find_similar_texts(request: SimilarityRequest):
         )
 
 
+@app.post("/api/similarity/batch")
+async def find_similar_texts_batch(request: BatchSimilarityRequest):
+    """
+    Find similar texts for several queries against one corpus
+    """
+    try:
+        pipeline = await run_inference("similarity", get_clustering_pipeline)
+        results = await run_inference(
+            "similarity",
+            pipeline.find_similar_batch,
+            query_texts=request.query_texts,
+            corpus_texts=request.corpus_texts,
+            top_k=request.top_k,
+            threshold=request.threshold
+        )
+        
+        return {
+            "success": True,
+            "results": [
+                {
+                    "query": query,
+                    "similar_texts": matches,
+                    "num_results": len(matches)
+                }
+                for query, matches in zip(request.query_texts, results)
+            ]
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Batch similarity endpoint error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
 @app.post("/api/verify/news", response_model=VerificationResponse)
 async def verify_news_credibility(request: VerificationRequest):
     """
     Verify the credibility of a news article
     """
     try:
-        pipeline = get_verification_pipeline()
-        result = pipeline.verify_news(
+        result = await run_inference("verify", lambda: get_verification_pipeline().submit_news(
             text=request.text,
             source_url=request.source_url
-        )
+        ))
         return VerificationResponse(**result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"News verification error: {e}")
         raise HTTPException(
@@ -401,8 +765,7 @@ async def verify_civic_report(request: VerificationRequest):
     Verify if a civic report is valid (Actionable) or Spam/Nonsense
     """
     try:
-        pipeline = get_verification_pipeline()
-        result = pipeline.verify_report(request.text)
+        result = await run_inference("verify", lambda: get_verification_pipeline().verify_report(request.text))
         
         return VerificationResponse(
             success=True,
@@ -411,6 +774,8 @@ async def verify_civic_report(request: VerificationRequest):
             confidence=result.get("confidence", 0.0),
             explanation=result.get("explanation", None)
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Report verification error: {e}")
         raise HTTPException(
@@ -425,9 +790,10 @@ async def fact_check_news(request: VerificationRequest):
     Returns found sources and verification status.
     """
     try:
-        pipeline = get_factcheck_pipeline()
-        result = pipeline.verify_claim(request.text)
+        result = await run_inference("factcheck", lambda: get_factcheck_pipeline().verify_claim(request.text))
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Fact-checking endpoint error: {e}")
         raise HTTPException(
@@ -437,22 +803,26 @@ async def fact_check_news(request: VerificationRequest):
 
 
 @app.post("/api/process/report", response_model=UnifiedProcessResponse, tags=["Unified"], status_code=status.HTTP_201_CREATED)
-async def process_full_report(request: VerificationRequest):
+async def process_full_report(request: ProcessReportRequest):
     """
     Unified endpoint that runs classification, summarization, NER, and verification
     in a single call. Returns structured data for DB storage and frontend.
     Accepts raw text or a news link in the text field.
     """
     logger.info(f"Received process report request. Text length: {len(request.text if request.text else '')}")
+    check_summary_profile(request.summary_profile)
     try:
-        processor = get_unified_processor()
-        result = processor.process_report(
+        # Concurrent reports meet in the pipelines' micro-batchers
+        result = await run_inference("process", lambda: get_unified_processor().process_report(
             text=request.text,
-            source_url=request.source_url
-        )
+            source_url=request.source_url,
+            summary_profile=request.summary_profile
+        ))
         if "error" in result:
              return UnifiedProcessResponse(success=False, error=result["error"])
         return UnifiedProcessResponse(success=True, data=result, report_id=result.get("report_id"))
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Unified processing endpoint error: {e}")
         raise HTTPException(
@@ -470,101 +840,144 @@ async def process_upload(file: UploadFile = File(...)):
         
     try:
         content = await file.read()
-        processor = get_unified_processor()
-        result = processor.process_report(file_bytes=content)
+        result = await run_inference("process", lambda: get_unified_processor().process_report(file_bytes=content))
         
         if "error" in result:
              return UnifiedProcessResponse(success=False, error=result["error"])
              
         return UnifiedProcessResponse(success=True, data=result, report_id=result.get("report_id"))
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"File upload processing failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _fetch_and_store(news_api_key: Optional[str] = None) -> dict:
+    """Run one poll cycle on the inference pool and save it to the realtime cache"""
+    def poll():
+        # Priority: Function Argument -> Env Var -> Placeholder; a caller's
+        # key applies to this cycle only, never to the shared fetcher
+        return get_multi_source_fetcher().poll_all_sources(news_api_key=news_api_key)
+
+    results = await run_inference("fetch", poll)
+    output = {
+        "success": True,
+        "last_updated": datetime.datetime.now().isoformat(),
+        "data": results
+    }
+
+    # Ensure data dir exists
+    os.makedirs(os.path.dirname(REALTIME_DATA_FILE), exist_ok=True)
+    with open(REALTIME_DATA_FILE, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2)
+    logger.info(f"Fetch cycle saved to {REALTIME_DATA_FILE}")
+    return output
+
+
+async def run_fetch_cycle(news_api_key: Optional[str] = None) -> dict:
+    """
+    Start a poll cycle, or join the one already in progress (single flight)
+
+    Args:
+        news_api_key: NewsData.io key for this cycle only. A running cycle
+                      is joined only when it uses the same key; otherwise
+                      this call waits for it and then runs its own
+
+    Returns:
+        The cycle's output, as saved to the realtime cache
+    """
+    global fetch_cycle_task, fetch_cycle_key
+    while fetch_cycle_task is not None and not fetch_cycle_task.done():
+        if fetch_cycle_key == news_api_key:
+            logger.info("Fetch cycle already in progress, joining it")
+            break
+        logger.info("Fetch cycle with another NewsData key in progress, waiting for it")
+        await asyncio.wait([fetch_cycle_task])
+    else:
+        fetch_cycle_task = asyncio.ensure_future(_fetch_and_store(news_api_key))
+        fetch_cycle_key = news_api_key
+    # Shielded so a caller that goes away does not cancel the cycle for the others
+    return await asyncio.shield(fetch_cycle_task)
+
+
 @app.get("/api/fetch/all", tags=["Fetching"])
 async def fetch_all_intelligence(news_api_key: Optional[str] = None):
     """
     Trigger the 4-Level Multi-Source Fetcher.
     Polls BIPAD, ReliefWeb, USGS, and NewsData.io,
     then runs AI verification on the news.
+    Calls made while a cycle is running wait for that cycle's result.
     """
-    from ai_service.fetchers.orchestrator import MultiSourceFetcher
-    from dotenv import load_dotenv
-    
-    load_dotenv() # Load variables from .env
-    
-    # Priority: Function Argument -> Env Var -> Placeholder
-    key = news_api_key or os.getenv("NEWSDATA_API_KEY")
-    
-    if not key or key == "your_api_key_here":
-        logger.warning("Using free tier/public APIs where possible. NewsData.io requires a valid key.")
-        
-    # TEST_MODE enabled for faster manual testing
-    # Production Mode: Fetches all available news stories
-    fetcher = MultiSourceFetcher(news_api_key=key, test_mode=False)
     try:
-        results = fetcher.poll_all_sources()
-        output = {
-            "success": True, 
-            "last_updated": datetime.datetime.now().isoformat(),
-            "data": results
-        }
-        
-        # Save to cache immediately if manual trigger
-        os.makedirs(os.path.dirname(REALTIME_DATA_FILE), exist_ok=True)
-        with open(REALTIME_DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=2)
-            
-        return output
+        return await run_fetch_cycle(news_api_key)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Fetch Cycle Failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@app.get("/api/fetch/status", tags=["Fetching"])
+async def fetch_status():
+    """
+    Progress of the current poll cycle (stage, per-source results, news
+    articles analysed so far) and a summary of the last finished one
+    """
+    fetcher = await asyncio.to_thread(get_multi_source_fetcher)
+    return {
+        "in_progress": fetch_cycle_task is not None and not fetch_cycle_task.done(),
+        "next_background_refresh": next_background_refresh,
+        **fetcher.status()
+    }
+
 async def background_refresh_task():
     """
     Periodic task to refresh disaster intelligence from all sources.
     Saves to a local file so the frontend can read results instantly.
     """
+    global next_background_refresh
     while True:
         logger.info("Background Refresh: Starting fetch cycle...")
         try:
-            from ai_service.fetchers.orchestrator import MultiSourceFetcher
-            from dotenv import load_dotenv
-            load_dotenv()
-            
-            key = os.getenv("NEWSDATA_API_KEY")
-            # Production Mode: Fetches all available news stories
-            fetcher = MultiSourceFetcher(news_api_key=key, test_mode=False)
-            
-            # Run synchronous blocking code in a separate thread to avoid blocking the event loop
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(None, fetcher.poll_all_sources)
-            
-            output = {
-                "success": True,
-                "last_updated": datetime.datetime.now().isoformat(),
-                "data": results
-            }
-            
-            # Ensure data dir exists
-            os.makedirs(os.path.dirname(REALTIME_DATA_FILE), exist_ok=True)
-            
-            with open(REALTIME_DATA_FILE, "w", encoding="utf-8") as f:
-                json.dump(output, f, indent=2)
-                
+            await run_fetch_cycle()
             logger.info(f"Background Refresh: Successfully updated {REALTIME_DATA_FILE}")
             
         except Exception as e:
             logger.error(f"Background Refresh ERROR: {e}")
             
+        next_background_refresh = (
+            datetime.datetime.now() + datetime.timedelta(seconds=REFRESH_INTERVAL_SECONDS)
+        ).isoformat()
         await asyncio.sleep(REFRESH_INTERVAL_SECONDS)
 
 @app.on_event("startup")
 async def startup_event():
-    """Start the background task when API begins"""
+    """Preload models, start the inference workers (if enabled) and the background task when API begins"""
+    # Opt-in: by default models load on first use
+    preload = parse_pipeline_names(os.getenv("AI_PRELOAD", ""))
+    if os.getenv("AI_SERVING_MODE", "thread") == "process":
+        # The pooled pipelines are loaded before the fork regardless, so
+        # /ready also waits for the workers to warm them up
+        pooled = parse_pipeline_names(os.getenv("AI_POOL_PIPELINES", "classify,summarize,verify,process"))
+        preload += [name for name in pooled if name not in preload]
+        # Load (without inference) before forking so the workers share the
+        # weights; they warm up after the fork, and /ready waits for them
+        preload_pipelines(preload, warm_up=False)
+        start_inference_pool()
+        asyncio.create_task(asyncio.to_thread(warm_up_after_fork, preload))
+    else:
+        # Serve /health while loading; /ready flips once everything is warm
+        asyncio.create_task(asyncio.to_thread(preload_pipelines, preload))
     asyncio.create_task(background_refresh_task())
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the inference workers and close pooled HTTP connections"""
+    if inference_pool is not None:
+        inference_pool.close()
+    http_client.close()
+
 @app.get("/api/realtime/news", tags=["Fetching"])
 async def get_realtime_news():
     """
@@ -0,0 +1,4 @@
+"""
+Benchmarks package
+Standalone scripts for measuring latency and quality of the AI service
+"""
@@ -0,0 +1,142 @@
+"""
+Anchor Matching Benchmark
+Times cross-referencing news items against BIPAD incidents with a scan over
+every incident (the previous matcher) and with AnchorIndex, on synthetic
+incident feeds of growing size, and checks both find the same incidents.
+
+Usage:
+    python -m ai_service.benchmarks.anchor_matching [--anchors N ...] [--news N]
+                                                    [--places N] [--seed N] [--json]
+"""
+import argparse
+import json
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from ai_service.fetchers.anchor_index import AnchorIndex
+
+INCIDENT_TYPES = [
+    "Flood", "Landslide", "Fire", "Earthquake", "Lightning", "Heavy Rainfall",
+    "Windstorm", "Hailstorm", "Cold Wave", "Epidemic", "Snake Bite", "Animal Incidents"
+]
+NEWS_TYPES = ["Flood", "Landslide", "Fire", "Earthquake", "Storm", "Extreme Weather", "Unknown"]
+SYLLABLES = ["ka", "ma", "ri", "pa", "sa", "ta", "lu", "dho", "khu", "ga", "nja", "chok", "pur", "bha", "li"]
+
+
+def place_names(count: int, rng: random.Random) -> List[str]:
+    """
+    Distinct synthetic place names, none inside another (the linear scan
+    would match "Kama" in "Kamari", which the index deliberately does not)
+    """
+    names: List[str] = []
+    while len(names) < count:
+        name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+        if not any(name in other or other in name for other in names):
+            names.append(name)
+    return sorted(names)
+
+
+def make_anchors(count: int, places: List[str], rng: random.Random) -> List[Dict[str, Any]]:
+    """Incidents shaped like BIPADFetcher's output"""
+    return [
+        {
+            "id": i,
+            "type": rng.choice(INCIDENT_TYPES),
+            "location": rng.choice(places),
+            "timestamp": f"2025-{rng.randint(6, 9):02d}-{rng.randint(1, 28):02d}",
+            "title": "Synthetic incident"
+        }
+        for i in range(count)
+    ]
+
+
+def make_news(count: int, places: List[str], rng: random.Random) -> List[Dict[str, Any]]:
+    """AI results of news items: one to three locations and a disaster type"""
+    return [
+        {
+            # Some locations are not in the anchor feed at all
+            "location_entities": [rng.choice(places) if rng.random() < 0.8 else f"Unlisted{i}" for _ in range(rng.randint(1, 3))],
+            "disaster_type": rng.choice(NEWS_TYPES)
+        }
+        for i in range(count)
+    ]
+
+
+def linear_match(anchors: List[Dict[str, Any]], ai_locs: List[str], ai_type: str) -> Optional[Dict[str, Any]]:
+    """The scan the orchestrator used before AnchorIndex"""
+    for anchor in anchors:
+        anchor_loc = anchor.get("location", "")
+        anchor_type = anchor.get("type", "")
+        if (anchor_loc in ai_locs or any(l in anchor_loc for l in ai_locs)) and \
+           (ai_type.lower() in anchor_type.lower() or anchor_type.lower() in ai_type.lower()):
+            return anchor
+    return None
+
+
+def benchmark(anchor_count: int, news: List[Dict[str, Any]], places: List[str], rng: random.Random) -> Dict[str, Any]:
+    """Time both matchers on one feed size"""
+    anchors = make_anchors(anchor_count, places, rng)
+
+    start = time.perf_counter()
+    linear = [linear_match(anchors, item["location_entities"], item["disaster_type"]) for item in news]
+    linear_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = AnchorIndex(anchors, window_hours=0, fuzzy_cutoff=0)
+    build_s = time.perf_counter() - start
+    start = time.perf_counter()
+    indexed = [index.match(item["location_entities"], item["disaster_type"]) for item in news]
+    match_s = time.perf_counter() - start
+
+    return {
+        "anchors": anchor_count,
+        "news": len(news),
+        "linear_ms": 1000 * linear_s,
+        "index_build_ms": 1000 * build_s,
+        "index_match_ms": 1000 * match_s,
+        "speedup": linear_s / max(build_s + match_s, 1e-9),
+        "matched": sum(anchor is not None for anchor in indexed),
+        "agreement": sum(a is b for a, b in zip(linear, indexed)) / max(len(news), 1)
+    }
+
+
+def run_benchmark(anchor_counts: List[int], news_count: int = 500, place_count: int = 750, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Benchmark every feed size
+
+    Returns:
+        Timings, speedup of the index (build included) and the share of
+        news items both matchers resolve to the same incident, per size
+    """
+    rng = random.Random(seed)
+    places = place_names(place_count, rng)
+    news = make_news(news_count, places, rng)
+    return [benchmark(count, news, places, rng) for count in anchor_counts]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--anchors", type=int, nargs="+", default=[100, 1000, 5000, 20000], help="Incident feed sizes")
+    parser.add_argument("--news", type=int, default=500, help="News items matched per feed")
+    parser.add_argument("--places", type=int, default=750, help="Distinct incident locations")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON instead of a table")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.anchors, args.news, args.places, args.seed)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'anchors':>8}{'news':>6}{'linear ms':>11}{'build ms':>10}{'match ms':>10}{'speedup':>9}{'matched':>9}{'agree':>7}")
+    for row in results:
+        print(
+            f"{row['anchors']:>8}{row['news']:>6}{row['linear_ms']:>11.1f}{row['index_build_ms']:>10.1f}"
+            f"{row['index_match_ms']:>10.1f}{row['speedup']:>8.0f}x{row['matched']:>9}{row['agreement']:>7.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
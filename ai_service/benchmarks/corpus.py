@@ -0,0 +1,151 @@
+"""
+Fixed benchmark corpus
+Small, stable set of disaster reports shared by the benchmark scripts
+"""
+from typing import List, Dict
+
+REPORTS: List[Dict[str, str]] = [
+    {
+        "id": "bench-1",
+        "label": "Landslide",
+        "text": (
+            "Heavy Monsoon Rainfall Causes Multiple Landslides in Taplejung. "
+            "Continuous rainfall over the last 24 hours has triggered landslides in several villages "
+            "of Taplejung district, blocking rural roads. Local authorities report that the Mechi "
+            "Highway has been partially blocked due to debris falling from the hills. Resident "
+            "awareness is advised as the rainfall continues. No casualties have been reported yet, "
+            "but property damage is significant and three houses were swept away near the river bank."
+        )
+    },
+    {
+        "id": "bench-2",
+        "label": "Flood",
+        "text": (
+            "Flood Warning Issued for Koshi River Settlements. The water level in the Koshi river has "
+            "crossed the danger mark at the Saptari station following heavy rains in the catchment area. "
+            "Government officials have issued a red alert for downstream settlements. Emergency response "
+            "teams are on standby. Evacuation centers are being prepared in Sunsari and Saptari districts "
+            "to house displaced families if the breach continues through the night."
+        )
+    },
+    {
+        "id": "bench-3",
+        "label": "Earthquake",
+        "text": (
+            "A magnitude 5.2 earthquake struck western Nepal early on Tuesday morning, with its epicentre "
+            "in Jajarkot district. Residents of Jajarkot and Rukum West rushed out of their homes as the "
+            "tremor shook buildings. The National Earthquake Monitoring and Research Center said the quake "
+            "occurred at a depth of 10 kilometres. Police said several old mud houses developed cracks and "
+            "two people were injured by falling debris. Rescue teams have been dispatched to remote villages."
+        )
+    },
+    {
+        "id": "bench-4",
+        "label": "Fire",
+        "text": (
+            "A fire broke out at a timber warehouse in Biratnagar on Sunday afternoon, destroying stock worth "
+            "millions of rupees. Fire engines from Biratnagar Metropolitan City and nearby municipalities "
+            "were deployed to control the blaze, which took nearly four hours to bring under control. "
+            "According to the District Police Office Morang, the cause of the fire is suspected to be an "
+            "electrical short circuit. No human casualties have been reported."
+        )
+    },
+    {
+        "id": "bench-5",
+        "label": "Flood",
+        "text": (
+            "Melamchi river flooding has once again damaged the drinking water project intake in "
+            "Sindhupalchok. Officials said the flood swept away a temporary diversion and sections of the "
+            "access road, cutting off supply to the Kathmandu valley for at least a week. Families living "
+            "along the river banks in Melamchi bazaar have been relocated to safer places, and the district "
+            "administration has asked locals to stay alert as more rain is forecast."
+        )
+    },
+    {
+        "id": "bench-6",
+        "label": "Storm",
+        "text": (
+            "A windstorm accompanied by hail hit several villages of Bara and Parsa districts on Friday "
+            "evening, uprooting trees and blowing away the roofs of more than two hundred houses. The storm "
+            "also damaged standing wheat crops across large areas. Local representatives said relief "
+            "distribution has begun, but many families are spending nights in the open. The Nepal Army "
+            "and police have been mobilised to clear roads blocked by fallen trees."
+        )
+    }
+]
+
+# Held-out news items labelled for the fake/real news model ("Real" or "Fake")
+NEWS_SAMPLES: List[Dict[str, str]] = [
+    {
+        "id": "news-1",
+        "label": "Real",
+        "text": (
+            "The Department of Hydrology and Meteorology said on Monday that the monsoon entered Nepal from "
+            "Koshi Province four days later than normal. Meteorologists forecast heavy rainfall in the eastern "
+            "and central hills over the next three days and advised caution in landslide-prone areas."
+        )
+    },
+    {
+        "id": "news-2",
+        "label": "Real",
+        "text": (
+            "The National Disaster Risk Reduction and Management Authority said 38 people have died in floods "
+            "and landslides since mid-June. According to its latest update, 12 people remain missing and more "
+            "than 600 families have been displaced, most of them in Sindhupalchok and Taplejung districts."
+        )
+    },
+    {
+        "id": "news-3",
+        "label": "Real",
+        "text": (
+            "Nepal Electricity Authority restored power to most of Jajarkot district on Thursday, three days "
+            "after the earthquake damaged a substation. Officials said technicians were still repairing "
+            "distribution lines in two rural municipalities where supply is expected to resume next week."
+        )
+    },
+    {
+        "id": "news-4",
+        "label": "Real",
+        "text": (
+            "Kathmandu Metropolitan City has started an awareness campaign on fire safety ahead of the dry "
+            "season. The campaign includes inspections of fire extinguishers in markets and training for "
+            "ward volunteers, a city spokesperson told reporters at a press conference on Sunday."
+        )
+    },
+    {
+        "id": "news-5",
+        "label": "Fake",
+        "text": (
+            "SHOCKING!!! Scientists confirm a giant earthquake will destroy Kathmandu next Tuesday at 3 PM. "
+            "The government is hiding the truth from you. Share this message with everyone you know before "
+            "it gets deleted, and withdraw all your money from the banks immediately!"
+        )
+    },
+    {
+        "id": "news-6",
+        "label": "Fake",
+        "text": (
+            "Secret documents reveal that the floods in the Terai were caused by a foreign weather machine "
+            "controlled by aliens. Doctors hate this one simple trick that protects your house from any "
+            "natural disaster. Click the link now to learn what they don't want you to know."
+        )
+    },
+    {
+        "id": "news-7",
+        "label": "Fake",
+        "text": (
+            "BREAKING: Drinking hot lemon water every hour makes you immune to the new virus, says anonymous "
+            "doctor. Hospitals are refusing to tell patients about this miracle cure because big pharma pays "
+            "them millions. Forward to 10 groups to save lives!!!"
+        )
+    },
+    {
+        "id": "news-8",
+        "label": "Fake",
+        "text": (
+            "Mount Everest has shrunk by 500 metres overnight after a mysterious explosion, according to a "
+            "viral video. Experts who wish to remain unnamed claim the mountain is hollow and the government "
+            "has banned all climbers to cover up the discovery."
+        )
+    }
+]
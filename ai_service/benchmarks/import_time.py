@@ -0,0 +1,141 @@
+"""
+Import-Time Benchmark
+Measures how long importing the service modules takes in a fresh interpreter,
+using CPython's -X importtime tracing, and checks that the heavy ML libraries
+are not pulled in at import time.
+
+Usage:
+    python -m ai_service.benchmarks.import_time [--module NAME ...] [--runs N]
+                                                [--top N] [--budget-ms MS] [--json]
+
+Exits with status 1 if a module takes longer than --budget-ms or imports one
+of the libraries that must stay lazy, so it can be used as a regression check.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+DEFAULT_MODULES = [
+    "ai_service.api",
+    "ai_service.pipelines.processor",
+    "ai_service.fetchers.orchestrator"
+]
+
+# Only loaded once a pipeline is constructed
+HEAVY_MODULES = ["torch", "transformers", "sentence_transformers", "sklearn", "hdbscan", "umap"]
+
+
+def parse_importtime(stderr: str) -> Dict[str, Dict[str, float]]:
+    """
+    Parse -X importtime output
+
+    Args:
+        stderr: Standard error of an interpreter run with -X importtime
+
+    Returns:
+        Mapping of module name to self and cumulative import time in ms
+        (the first import of each module)
+    """
+    modules: Dict[str, Dict[str, float]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # column header
+        name = fields[2].strip()
+        modules.setdefault(name, {"self_ms": self_us / 1000, "cumulative_ms": cumulative_us / 1000})
+    return modules
+
+
+def measure_import(module: str) -> Dict[str, Dict[str, float]]:
+    """
+    Import a module in a fresh interpreter with import tracing
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        Per-module timings as returned by parse_importtime
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def run_benchmark(modules: List[str], runs: int = 3, top: int = 10) -> Dict[str, Dict]:
+    """
+    Time the import of each module, keeping the fastest run
+
+    Returns:
+        Per module: total import time, the heavy libraries it loaded and the
+        slowest imported modules by cumulative time
+    """
+    report = {}
+    for module in modules:
+        best: Optional[Dict[str, Dict[str, float]]] = None
+        for _ in range(max(1, runs)):
+            timings = measure_import(module)
+            if best is None or timings[module]["cumulative_ms"] < best[module]["cumulative_ms"]:
+                best = timings
+
+        slowest = sorted(
+            (name for name in best if name != module),
+            key=lambda name: best[name]["cumulative_ms"],
+            reverse=True
+        )[:top]
+        report[module] = {
+            "total_ms": round(best[module]["cumulative_ms"], 1),
+            "modules_imported": len(best),
+            "heavy_imports": [name for name in HEAVY_MODULES if name in best],
+            "slowest": {name: round(best[name]["cumulative_ms"], 1) for name in slowest}
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", action="append", help="Module to import (repeatable; default: service entry points)")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per module; the fastest run is kept")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imported modules to list")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if any module takes longer than this")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON instead of a table")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.module or DEFAULT_MODULES, runs=args.runs, top=args.top)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for module, metrics in report.items():
+            heavy = ", ".join(metrics["heavy_imports"]) or "none"
+            print(f"{module}: {metrics['total_ms']:.1f} ms, {metrics['modules_imported']} modules, heavy imports: {heavy}")
+            for name, cumulative_ms in metrics["slowest"].items():
+                print(f"    {cumulative_ms:>9.1f} ms  {name}")
+
+    failed = False
+    for module, metrics in report.items():
+        if metrics["heavy_imports"]:
+            print(f"FAIL: {module} imports {', '.join(metrics['heavy_imports'])} at import time", file=sys.stderr)
+            failed = True
+        if args.budget_ms is not None and metrics["total_ms"] > args.budget_ms:
+            print(f"FAIL: {module} took {metrics['total_ms']:.1f} ms (budget {args.budget_ms:.0f} ms)", file=sys.stderr)
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
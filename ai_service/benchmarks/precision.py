@@ -0,0 +1,208 @@
+"""
+Precision Benchmark
+Compares accuracy and CPU latency of the zero-shot classifier and the
+fake/real news model loaded in fp32, bf16 and dynamic int8, on a labelled
+sample kept out of any tuning, and recommends the cheapest precision that
+keeps accuracy. With --backend onnx the models run through ONNX Runtime
+(fp32 and int8 only).
+
+Usage:
+    python -m ai_service.benchmarks.precision [--classifier-model NAME] [--news-model NAME]
+                                              [--sample FILE] [--runs N] [--max-drop X]
+                                              [--backend torch|onnx] [--json]
+
+--sample reads JSON lines {"task": "classify" | "news", "text": ..., "label": ...}
+instead of the built-in corpus; news labels are "Real" or "Fake".
+"""
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from ai_service.benchmarks.corpus import REPORTS, NEWS_SAMPLES
+from ai_service.models.registry import PRECISIONS, model_registry
+
+NEWS_LABELS = {0: "Fake", 1: "Real"}
+
+
+def _precisions(backend: str) -> List[str]:
+    return [precision for precision in PRECISIONS if backend == "torch" or precision != "bf16"]
+
+
+def load_sample(path: Optional[str]) -> Dict[str, List[Dict[str, str]]]:
+    """Labelled texts per task, from a JSON lines file or the built-in corpus"""
+    if path is None:
+        return {"classify": REPORTS, "news": NEWS_SAMPLES}
+    sample: Dict[str, List[Dict[str, str]]] = {"classify": [], "news": []}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                item = json.loads(line)
+                sample.setdefault(item["task"], []).append(item)
+    return sample
+
+
+def _timed(predict: Callable[[str], Any], texts: List[str], runs: int) -> Dict[str, Any]:
+    """Predict every text one at a time (the serving pattern), keeping the last run's outputs"""
+    predict(texts[0])  # warm-up
+    latencies, outputs = [], []
+    for _ in range(max(1, runs)):
+        outputs = []
+        for text in texts:
+            start = time.perf_counter()
+            outputs.append(predict(text))
+            latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return {
+        "outputs": outputs,
+        "mean_latency_ms": 1000 * sum(latencies) / len(latencies),
+        "p90_latency_ms": 1000 * latencies[int(0.9 * (len(latencies) - 1))]
+    }
+
+
+def _memory_mb(model_name: str, precision: str, backend: str) -> Optional[float]:
+    for entry in model_registry.memory_report():
+        if entry["model_name"] == model_name and entry["precision"] == precision and entry["backend"] == backend:
+            return entry["memory_mb"]
+    return None
+
+
+def benchmark_classifier(
+    model_name: str,
+    items: List[Dict[str, str]],
+    runs: int,
+    backend: str = "torch"
+) -> Dict[str, Dict[str, Any]]:
+    """Zero-shot classification over the sample's labels with every precision"""
+    from ai_service.models.classifier import CategoryClassifier
+
+    categories = sorted({item["label"] for item in items})
+    texts = [item["text"] for item in items]
+    report = {}
+    for precision in _precisions(backend):
+        classifier = CategoryClassifier(
+            model_name, categories=categories, device="cpu", precision=precision, backend=backend
+        )
+        try:
+            timing = _timed(lambda text: classifier.classify(text, top_k=1), texts, runs)
+            report[precision] = {
+                "predictions": [result["category"] for result in timing.pop("outputs")],
+                "memory_mb": _memory_mb(model_name, precision, backend),
+                **timing
+            }
+        finally:
+            classifier.close()
+    return report
+
+
+def benchmark_news(
+    model_name: str,
+    items: List[Dict[str, str]],
+    runs: int,
+    backend: str = "torch"
+) -> Dict[str, Dict[str, Any]]:
+    """Fake/real news verdicts of the news model with every precision"""
+    from transformers import AutoModelForSequenceClassification
+    from ai_service.pipelines.verification import news_model_probs
+
+    texts = [item["text"] for item in items]
+    report = {}
+    for precision in _precisions(backend):
+        tokenizer, model = model_registry.acquire(
+            model_name, AutoModelForSequenceClassification, "cpu", precision, backend
+        )
+        try:
+            timing = _timed(lambda text: news_model_probs(tokenizer, model, [text], "cpu")[0], texts, runs)
+            report[precision] = {
+                "predictions": [NEWS_LABELS.get(int(probs.argmax()), str(int(probs.argmax()))) for probs in timing.pop("outputs")],
+                "memory_mb": _memory_mb(model_name, precision, backend),
+                **timing
+            }
+        finally:
+            model_registry.release(model_name, AutoModelForSequenceClassification, "cpu", precision, backend)
+    return report
+
+
+def score(report: Dict[str, Dict[str, Any]], labels: List[str], max_drop: float) -> Optional[str]:
+    """
+    Add accuracy and agreement with fp32 to each precision's entry
+
+    Returns:
+        The fastest precision whose accuracy is within max_drop of fp32
+    """
+    reference = report["fp32"]["predictions"]
+    for metrics in report.values():
+        predictions = metrics.pop("predictions")
+        metrics["accuracy"] = sum(p == l for p, l in zip(predictions, labels)) / len(labels)
+        metrics["agreement_with_fp32"] = sum(p == r for p, r in zip(predictions, reference)) / len(labels)
+
+    baseline = report["fp32"]["accuracy"]
+    eligible = [p for p, metrics in report.items() if metrics["accuracy"] >= baseline - max_drop]
+    return min(eligible, key=lambda p: report[p]["mean_latency_ms"])
+
+
+def run_benchmark(
+    classifier_model: str,
+    news_model: str,
+    sample_path: Optional[str] = None,
+    runs: int = 1,
+    max_drop: float = 0.0,
+    backend: str = "torch"
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Benchmark both tasks in every precision
+
+    Returns:
+        Per task: metrics per precision and the recommended precision
+    """
+    sample = load_sample(sample_path)
+    results = {}
+    tasks = (("classify", classifier_model, benchmark_classifier), ("news", news_model, benchmark_news))
+    for task, model_name, benchmark in tasks:
+        items = sample.get(task) or []
+        if not items:
+            continue
+        report = benchmark(model_name, items, runs, backend)
+        recommended = score(report, [item["label"] for item in items], max_drop)
+        results[task] = {
+            "model": model_name,
+            "backend": backend,
+            "samples": len(items),
+            "precisions": report,
+            "recommended": recommended
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--classifier-model", default="valhalla/distilbart-mnli-12-1", help="Zero-shot classifier to benchmark")
+    parser.add_argument("--news-model", default="hamzab/roberta-fake-news-classification", help="Fake/real news model to benchmark")
+    parser.add_argument("--sample", default=None, help="JSON lines file of labelled texts (default: built-in corpus)")
+    parser.add_argument("--runs", type=int, default=1, help="Passes over the sample per precision")
+    parser.add_argument("--max-drop", type=float, default=0.0, help="Accuracy loss vs fp32 accepted for a recommendation")
+    parser.add_argument("--backend", choices=["torch", "onnx"], default="torch", help="Inference backend")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON instead of a table")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.classifier_model, args.news_model, args.sample, args.runs, args.max_drop, args.backend)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for task, result in results.items():
+        print(f"{task}: {result['model']} on {result['backend']} ({result['samples']} samples)")
+        print(f"  {'precision':<10}{'accuracy':>10}{'agree':>8}{'mean ms':>10}{'p90 ms':>10}{'MB':>8}")
+        for precision, metrics in result["precisions"].items():
+            memory = f"{metrics['memory_mb']:.1f}" if metrics["memory_mb"] is not None else "-"
+            print(
+                f"  {precision:<10}{metrics['accuracy']:>10.3f}{metrics['agreement_with_fp32']:>8.3f}"
+                f"{metrics['mean_latency_ms']:>10.1f}{metrics['p90_latency_ms']:>10.1f}{memory:>8}"
+            )
+        print(f"  recommended: {result['recommended']} (set AI_MODEL_PRECISION, e.g. "
+              f"\"{'classifier' if task == 'classify' else 'news'}={result['recommended']}\")")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Summarization Profile Benchmark
+Reports latency and ROUGE agreement with the "quality" profile for every
+decoding profile in TextSummarizer.GENERATION_PROFILES on a fixed corpus.
+
+Usage:
+    python -m ai_service.benchmarks.summary_profiles [--model NAME] [--runs N]
+"""
+import argparse
+import json
+import re
+import time
+from typing import List, Dict, Optional
+
+from ai_service.benchmarks.corpus import REPORTS
+from ai_service.models.summarizer import TextSummarizer
+
+
+def _tokens(text: str) -> List[str]:
+    return re.findall(r"\w+", text.lower())
+
+
+def rouge_n(candidate: str, reference: str, n: int = 1) -> float:
+    """ROUGE-N F1 between two texts"""
+    def ngrams(tokens):
+        counts = {}
+        for i in range(len(tokens) - n + 1):
+            gram = tuple(tokens[i:i + n])
+            counts[gram] = counts.get(gram, 0) + 1
+        return counts
+
+    cand, ref = ngrams(_tokens(candidate)), ngrams(_tokens(reference))
+    overlap = sum(min(count, ref.get(gram, 0)) for gram, count in cand.items())
+    if not overlap:
+        return 0.0
+    precision = overlap / sum(cand.values())
+    recall = overlap / sum(ref.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def rouge_l(candidate: str, reference: str) -> float:
+    """ROUGE-L F1 (longest common subsequence) between two texts"""
+    cand, ref = _tokens(candidate), _tokens(reference)
+    if not cand or not ref:
+        return 0.0
+    prev = [0] * (len(ref) + 1)
+    for c in cand:
+        curr = [0]
+        for j, r in enumerate(ref):
+            curr.append(prev[j] + 1 if c == r else max(prev[j + 1], curr[j]))
+        prev = curr
+    lcs = prev[-1]
+    if not lcs:
+        return 0.0
+    precision = lcs / len(cand)
+    recall = lcs / len(ref)
+    return 2 * precision * recall / (precision + recall)
+
+
+def run_benchmark(
+    model_name: str,
+    runs: int = 1,
+    max_length: int = 150,
+    min_length: int = 30,
+    device: Optional[str] = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Summarize the corpus with every profile and compare against "quality"
+
+    Returns:
+        Mapping of profile name to latency and ROUGE metrics
+    """
+    summarizer = TextSummarizer(model_name=model_name, device=device)
+    texts = [report["text"] for report in REPORTS]
+
+    outputs: Dict[str, List[str]] = {}
+    latencies: Dict[str, List[float]] = {}
+    for profile in summarizer.GENERATION_PROFILES:
+        latencies[profile] = []
+        for _ in range(runs):
+            for text in texts:
+                start = time.perf_counter()
+                result = summarizer.summarize(text, max_length=max_length, min_length=min_length, profile=profile)
+                latencies[profile].append(time.perf_counter() - start)
+                outputs.setdefault(profile, []).append(result["summary"])
+        outputs[profile] = outputs[profile][:len(texts)]
+
+    references = outputs[TextSummarizer.DEFAULT_PROFILE]
+    report = {}
+    for profile, summaries in outputs.items():
+        samples = sorted(latencies[profile])
+        report[profile] = {
+            "mean_latency_ms": 1000 * sum(samples) / len(samples),
+            "p90_latency_ms": 1000 * samples[int(0.9 * (len(samples) - 1))],
+            "rouge1_vs_quality": sum(rouge_n(s, r, 1) for s, r in zip(summaries, references)) / len(texts),
+            "rouge2_vs_quality": sum(rouge_n(s, r, 2) for s, r in zip(summaries, references)) / len(texts),
+            "rougeL_vs_quality": sum(rouge_l(s, r) for s, r in zip(summaries, references)) / len(texts)
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="sshleifer/distilbart-cnn-6-6", help="Summarization model to benchmark")
+    parser.add_argument("--runs", type=int, default=1, help="Passes over the corpus per profile")
+    parser.add_argument("--device", default=None, help="Device override ('cpu' or 'cuda')")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON instead of a table")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.model, runs=args.runs, device=args.device)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{'profile':<12}{'mean ms':>10}{'p90 ms':>10}{'R-1':>8}{'R-2':>8}{'R-L':>8}")
+    for profile, metrics in report.items():
+        print(
+            f"{profile:<12}{metrics['mean_latency_ms']:>10.1f}{metrics['p90_latency_ms']:>10.1f}"
+            f"{metrics['rouge1_vs_quality']:>8.3f}{metrics['rouge2_vs_quality']:>8.3f}{metrics['rougeL_vs_quality']:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Anchor Index
+Lookup tables over the BIPAD incidents of a poll cycle (the Level 1
+anchors), so matching a news item against them costs a few dict lookups
+instead of a scan over every incident.
+"""
+import datetime
+import difflib
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# Administrative words that do not identify a place
+GENERIC_LOCATION_WORDS = {"district", "municipality", "metropolitan", "sub", "rural", "city", "ward"}
+
+
+def location_tokens(name: str) -> List[str]:
+    """Lower-cased word tokens of a place name, without administrative words"""
+    return [
+        token for token in re.split(r"[^0-9a-z]+", (name or "").lower())
+        if token and token not in GENERIC_LOCATION_WORDS
+    ]
+
+
+def parse_timestamp(value: Any) -> Optional[datetime.datetime]:
+    """ISO date/time (as served by BIPAD and NewsData) as naive UTC, or None"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _env_float(name: str) -> Optional[float]:
+    value = os.getenv(name, "").strip()
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class AnchorIndex:
+    """
+    BIPAD incidents indexed by location token and disaster type.
+
+    A news item matches an incident when every token of one of its locations
+    appears in the incident's location (so "Saptari" matches "Saptari
+    District" and "Kathmandu" matches "Kathmandu-10"), the disaster types
+    contain one another ("Flood" and "Flash Flood"), and, with a time window,
+    the two are close enough in time. The first matching incident in feed
+    order wins.
+    """
+
+    def __init__(
+        self,
+        anchors: Iterable[Dict[str, Any]],
+        window_hours: Optional[float] = None,
+        fuzzy_cutoff: Optional[float] = None
+    ):
+        """
+        Build the index
+
+        Args:
+            anchors: Normalised BIPAD incidents (location, type, timestamp, id)
+            window_hours: Only match incidents within this many hours of the
+                          news item (defaults to AI_ANCHOR_WINDOW_HOURS; unset
+                          or 0 ignores time, as does a missing timestamp)
+            fuzzy_cutoff: Similarity (0-1) at which a location token absent
+                          from the anchors is matched to the closest known
+                          token, for spellings like "Sindhupalchowk" (defaults
+                          to AI_ANCHOR_FUZZY_CUTOFF; unset or 0 disables it)
+        """
+        self.anchors = list(anchors)
+        self.window_hours = window_hours if window_hours is not None else _env_float("AI_ANCHOR_WINDOW_HOURS")
+        self.fuzzy_cutoff = fuzzy_cutoff if fuzzy_cutoff is not None else _env_float("AI_ANCHOR_FUZZY_CUTOFF")
+
+        # Anchor positions per location token and per disaster type
+        self.by_token: Dict[str, Set[int]] = {}
+        self.by_type: Dict[str, Set[int]] = {}
+        self.times: List[Optional[datetime.datetime]] = []
+        for position, anchor in enumerate(self.anchors):
+            for token in location_tokens(anchor.get("location", "")):
+                self.by_token.setdefault(token, set()).add(position)
+            self.by_type.setdefault((anchor.get("type") or "").strip().lower(), set()).add(position)
+            self.times.append(parse_timestamp(anchor.get("timestamp")))
+
+        # Per-cycle memo of resolved types and fuzzy tokens
+        self._type_matches: Dict[str, Set[int]] = {}
+        self._fuzzy_tokens: Dict[str, Optional[str]] = {}
+
+    def _resolve_token(self, token: str) -> Optional[str]:
+        if token in self.by_token:
+            return token
+        if not self.fuzzy_cutoff:
+            return None
+        if token not in self._fuzzy_tokens:
+            close = difflib.get_close_matches(token, list(self.by_token), n=1, cutoff=self.fuzzy_cutoff)
+            self._fuzzy_tokens[token] = close[0] if close else None
+        return self._fuzzy_tokens[token]
+
+    def _location_candidates(self, locations: Iterable[str]) -> Set[int]:
+        candidates: Set[int] = set()
+        for location in locations:
+            tokens = [self._resolve_token(token) for token in location_tokens(location)]
+            if not tokens or None in tokens:
+                continue
+            postings = sorted((self.by_token[token] for token in tokens), key=len)
+            candidates |= postings[0].intersection(*postings[1:])
+        return candidates
+
+    def _type_candidates(self, disaster_type: str) -> Set[int]:
+        key = (disaster_type or "").strip().lower()
+        if key not in self._type_matches:
+            # Few distinct types per feed, so containment is checked against each
+            matches: Set[int] = set()
+            for name, positions in self.by_type.items():
+                if key in name or name in key:
+                    matches |= positions
+            self._type_matches[key] = matches
+        return self._type_matches[key]
+
+    def match(
+        self,
+        locations: List[str],
+        disaster_type: str,
+        timestamp: Any = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        First incident confirming a news item
+
+        Args:
+            locations: Locations the AI extracted from the item
+            disaster_type: Disaster type the AI assigned to it
+            timestamp: When the item was published (used with a time window)
+
+        Returns:
+            The matching incident, or None
+        """
+        candidates = self._location_candidates(locations)
+        if not candidates:
+            return None
+        candidates &= self._type_candidates(disaster_type)
+
+        published = parse_timestamp(timestamp) if self.window_hours else None
+        if published is not None:
+            window = datetime.timedelta(hours=self.window_hours)
+            candidates = {
+                position for position in candidates
+                if self.times[position] is None or abs(self.times[position] - published) <= window
+            }
+        return self.anchors[min(candidates)] if candidates else None
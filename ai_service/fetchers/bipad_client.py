@@ -1,9 +1,11 @@
 
-import requests
 from typing import List, Dict, Optional
 import datetime
 from loguru import logger
 
+from ai_service.fetchers.poll_state import conditional_headers, record_validators
+from ai_service.utils.http_client import HttpClient, http_client
+
 class BIPADFetcher:
     """
     Level 1: The Anchor (Official Government Data)
@@ -11,12 +13,20 @@ class BIPADFetcher:
     """
     BASE_URL = "https://bipadportal.gov.np/api/v1/incident/"
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, http: Optional[HttpClient] = None):
         self.timeout = timeout
+        self.http = http or http_client
         
-    def fetch_recent_incidents(self, days: int = 2) -> List[Dict]:
+    def fetch_recent_incidents(self, days: int = 2, strict: bool = False, cursor: Optional[Dict] = None) -> List[Dict]:
         """
         Fetch confirmed incidents from the last N days.
+        
+        Args:
+            days: How far back to look
+            strict: Raise on network or API errors instead of returning []
+            cursor: Source cursor for a conditional request; updated in place
+                    with the response's validators, and "not_modified" is set
+                    (with [] returned) when nothing changed
         """
         params = {
             "ordering": "-created_on",
@@ -28,7 +38,13 @@ class BIPADFetcher:
         try:
             # Note: This is an example call. Actual BIPAD API might require auth or exact params.
             # Assuming public access or using a placeholder if auth needed.
-            response = requests.get(self.BASE_URL, params=params, timeout=self.timeout)
+            response = self.http.get(
+                self.BASE_URL, source=True, params=params, headers=conditional_headers(cursor), timeout=self.timeout
+            )
+            if record_validators(cursor, response):
+                return []
+            if strict:
+                response.raise_for_status()
             
             if response.status_code == 200:
                 data = response.json()
@@ -41,6 +57,8 @@ class BIPADFetcher:
                 
         except Exception as e:
             logger.error(f"BIPAD Fetch Failed: {e}")
+            if strict:
+                raise
             return []
 
     def _normalize(self, raw_data: List[Dict]) -> List[Dict]:
@@ -1,9 +1,10 @@
 
-import requests
-from typing import List, Dict
+from typing import List, Dict, Optional
 from loguru import logger
 import urllib.parse
 
+from ai_service.utils.http_client import HttpClient, http_client
+
 class NewsFetcher:
     """
     Level 4: The Speed (News API)
@@ -12,14 +13,22 @@ class NewsFetcher:
     # Using NewsData.io as discussed, standard free endpoint style
     BASE_URL = "https://newsdata.io/api/1/news"
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, timeout: int = 10, http: Optional[HttpClient] = None):
         self.api_key = api_key
+        self.timeout = timeout
+        self.http = http or http_client
         
-    def fetch_disaster_news(self) -> List[Dict]:
+    def fetch_disaster_news(self, strict: bool = False, api_key: Optional[str] = None) -> List[Dict]:
         """
         Polls for recent disaster news in Nepal.
+        
+        Args:
+            strict: Raise when every query fails to reach the API instead of
+                    falling back to the demo articles
+            api_key: Key for this call only (defaults to the fetcher's)
         """
-        if self.api_key == "PLACEHOLDER":
+        api_key = api_key or self.api_key
+        if api_key == "PLACEHOLDER":
              logger.warning("NewsFetcher: No API Key provided")
              return []
 
@@ -27,6 +36,7 @@ class NewsFetcher:
             # Aggregate and deduplicate
             news_results = []
             seen_links = set()
+            query_errors = []
             
             # Use broad queries - rely on country=np filter
             queries = [
@@ -36,7 +46,7 @@ class NewsFetcher:
 
             for q in queries:
                 params = {
-                    "apikey": self.api_key,
+                    "apikey": api_key,
                     "q": q,
                     "language": "en",
                     "country": "np",
@@ -44,7 +54,7 @@ class NewsFetcher:
                 }
                 
                 try:
-                    response = requests.get(self.BASE_URL, params=params, timeout=10)
+                    response = self.http.get(self.BASE_URL, source=True, params=params, timeout=self.timeout)
                     if response.status_code == 200:
                         results = response.json().get("results", [])
                         for item in results:
@@ -54,6 +64,10 @@ class NewsFetcher:
                                 seen_links.add(link)
                 except Exception as e:
                     logger.warning(f"Query '{q}' failed: {e}")
+                    query_errors.append(e)
+
+            if strict and len(query_errors) == len(queries):
+                raise query_errors[-1]
 
             # FALLBACK/MOCK MODE: If still empty (e.g. invalid API key or zero matches), 
             # provide highly relevant simulated disaster news for hackfest demonstration.
@@ -66,6 +80,8 @@ class NewsFetcher:
                  
         except Exception as e:
             logger.error(f"News Fetch Failed: {e}")
+            if strict:
+                raise
             return []
 
     def _get_mock_data(self) -> List[Dict]:
@@ -1,14 +1,61 @@
-
-from typing import List, Dict, Optional
+from typing import Any, Callable, List, Dict, Optional, Tuple, Union
+import copy
+import datetime
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from loguru import logger
 import asyncio
 
+from ai_service.fetchers.anchor_index import AnchorIndex
 from ai_service.fetchers.bipad_client import BIPADFetcher
 from ai_service.fetchers.reliefweb_client import ReliefWebFetcher
 from ai_service.fetchers.usgs_client import USGSFetcher
 from ai_service.fetchers.news_client import NewsFetcher
+from ai_service.fetchers.poll_state import item_digest, item_key, open_poll_state
 from ai_service.pipelines.processor import UnifiedProcessor
+from ai_service.utils.http_client import HttpClient
+
+# Seconds each source may take within a poll cycle before it is reported as
+# timed out and the cycle continues without it. NewsData runs two queries
+# back to back, so it gets the longest budget.
+SOURCES = ("usgs", "bipad", "reliefweb", "news")
+DEFAULT_SOURCE_DEADLINES = {"usgs": 8.0, "bipad": 15.0, "reliefweb": 15.0, "news": 25.0}
+
+
+def resolve_source_deadlines(spec: Optional[str] = None) -> Dict[str, float]:
+    """
+    Per-source poll deadlines
+    
+    Args:
+        spec: Comma-separated seconds such as "10" or "10,news=30"; a bare
+              number sets every source, "source=seconds" overrides one.
+              None falls back to AI_SOURCE_DEADLINES
+    
+    Returns:
+        Deadline in seconds for each of SOURCES
+    """
+    deadlines = dict(DEFAULT_SOURCE_DEADLINES)
+    if spec is None:
+        spec = os.getenv("AI_SOURCE_DEADLINES", "")
+    for item in spec.split(","):
+        name, _, value = item.rpartition("=")
+        name = name.strip()
+        if not value.strip():
+            continue
+        try:
+            seconds = float(value)
+        except ValueError:
+            logger.warning(f"Ignoring invalid source deadline '{item}'")
+            continue
+        if name and name not in SOURCES:
+            logger.warning(f"Ignoring deadline for unknown source '{name}' (use one of {', '.join(SOURCES)})")
+            continue
+        for source in ([name] if name else SOURCES):
+            deadlines[source] = seconds
+    return deadlines
+
 
 class MultiSourceFetcher:
     """
@@ -16,33 +63,236 @@ class MultiSourceFetcher:
     Combines Levels 1-4 to produce verifiable intelligence.
     """
     
-    def __init__(self, news_api_key: str = "PLACEHOLDER", test_mode: bool = False):
-        self.bipad = BIPADFetcher()
-        self.relief = ReliefWebFetcher()
-        self.usgs = USGSFetcher()
-        self.news = NewsFetcher(api_key=news_api_key)
+    def __init__(
+        self,
+        news_api_key: str = "PLACEHOLDER",
+        test_mode: bool = False,
+        source_deadlines: Optional[Dict[str, float]] = None,
+        processor: Optional[UnifiedProcessor] = None,
+        analysis_batch_size: int = 32,
+        state_path: Optional[str] = None,
+        anchor_window_hours: Optional[float] = None,
+        anchor_fuzzy_cutoff: Optional[float] = None,
+        http: Optional[HttpClient] = None
+    ):
+        """
+        Args:
+            news_api_key: NewsData.io API key
+            test_mode: Limit news to 5 articles per cycle
+            source_deadlines: Per-source deadline overrides in seconds
+                              (see resolve_source_deadlines)
+            processor: Shared UnifiedProcessor to analyse news with; a
+                       private one is created on first use when omitted
+            analysis_batch_size: News articles analysed per batch; progress
+                                 is reported after each batch
+            state_path: SQLite file of source cursors and already analysed
+                        items (see poll_state; defaults to AI_POLL_STATE_PATH,
+                        an empty value reprocesses everything every cycle)
+            anchor_window_hours: Only confirm news with BIPAD incidents this
+                                 close in time (see AnchorIndex)
+            anchor_fuzzy_cutoff: Similarity for fuzzy location matching
+                                 against BIPAD incidents (see AnchorIndex)
+            http: HTTP client the source clients share (defaults to the
+                  process-wide pooled client)
+        """
+        self.bipad = BIPADFetcher(http=http)
+        self.relief = ReliefWebFetcher(http=http)
+        self.usgs = USGSFetcher(http=http)
+        self.news = NewsFetcher(api_key=news_api_key, http=http)
         self.test_mode = test_mode  # Limits news to 5 articles for faster testing
+        self.source_deadlines = {**resolve_source_deadlines(), **(source_deadlines or {})}
+        
+        self.analysis_batch_size = max(1, analysis_batch_size)
+        self.state = open_poll_state(state_path)
+        self.anchor_window_hours = anchor_window_hours
+        self.anchor_fuzzy_cutoff = anchor_fuzzy_cutoff
+        
+        # Our fine-tuned AI brain, loaded on the first verification
+        self._ai = processor
+        
+        # Progress of the running cycle and outcome of the last one (see status())
+        self._progress_lock = threading.Lock()
+        self._progress: Dict[str, Any] = {
+            "state": "idle",
+            "cycle": 0,
+            "started_at": None,
+            "sources": {},
+            "news_total": 0,
+            "news_processed": 0,
+            "news_reused": 0,
+            "last_cycle": None
+        }
+        
+    @property
+    def ai(self) -> UnifiedProcessor:
+        if self._ai is None:
+            self._ai = UnifiedProcessor()
+        return self._ai
+        
+    def _update_progress(self, **changes: Any) -> None:
+        with self._progress_lock:
+            self._progress.update(changes)
+        
+    def status(self) -> Dict[str, Any]:
+        """
+        Progress of the poll cycle
+        
+        Returns:
+            state ("idle", "fetching" or "analysing"), the cycle number, when
+            it started, per-source summary once fetched, news articles analysed
+            so far out of news_total, and a summary of the last finished cycle
+        """
+        with self._progress_lock:
+            return copy.deepcopy(self._progress)
+        
+    def fetch_sources(self, news_api_key: Optional[str] = None) -> Tuple[Dict[str, List], Dict[str, Dict[str, Any]]]:
+        """
+        Poll the four sources concurrently, each under its own deadline.
+        A source that fails or misses its deadline contributes no items;
+        the others are returned regardless (partial results).
+        
+        With a state store, each source is polled from its cursor: an
+        unchanged source (HTTP 304) serves its last snapshot and ReliefWeb
+        only returns reports newer than the last one seen.
+        
+        Args:
+            news_api_key: NewsData.io key for this poll only (defaults to
+                          the fetcher's)
+        
+        Returns:
+            Tuple of (items per source, summary per source with status
+            "ok" / "error" / "timeout", item count, latency_ms, error and
+            whether the source was unchanged)
+        """
+        cursors = {source: self.state.get_cursor(source) if self.state else None for source in SOURCES}
+        calls: Dict[str, Callable[[], List[Dict]]] = {
+            "usgs": lambda: self.usgs.fetch_triggers(strict=True, cursor=cursors["usgs"]),
+            "bipad": lambda: self.bipad.fetch_recent_incidents(strict=True, cursor=cursors["bipad"]),
+            "reliefweb": lambda: self.relief.fetch_nepal_reports(strict=True, cursor=cursors["reliefweb"]),
+            "news": lambda: self.news.fetch_disaster_news(strict=True, api_key=news_api_key)
+        }
+        
+        def timed(call: Callable[[], List[Dict]]) -> Tuple[List[Dict], float]:
+            start = time.perf_counter()
+            items = call()
+            return items, time.perf_counter() - start
+        
+        # A fresh pool per cycle: a source stuck past its deadline keeps its
+        # thread until its HTTP timeout fires, without holding up the next cycle
+        pool = ThreadPoolExecutor(max_workers=len(calls), thread_name_prefix="source-poll")
+        started = time.perf_counter()
+        futures = {source: pool.submit(timed, call) for source, call in calls.items()}
+        
+        results: Dict[str, List] = {}
+        summary: Dict[str, Dict[str, Any]] = {}
+        try:
+            for source, future in futures.items():
+                deadline = self.source_deadlines[source]
+                remaining = max(0.0, started + deadline - time.perf_counter())
+                entry = {"status": "ok", "items": 0, "latency_ms": None, "deadline_s": deadline, "error": None}
+                try:
+                    items, elapsed = future.result(timeout=remaining)
+                    if cursors[source] is not None:
+                        items = self._advance_cursor(source, cursors[source], items)
+                        entry["not_modified"] = bool(cursors[source].get("not_modified"))
+                    results[source] = items
+                    entry["items"] = len(items)
+                    entry["latency_ms"] = round(1000 * elapsed, 1)
+                except FutureTimeoutError:
+                    results[source] = []
+                    entry.update(status="timeout", latency_ms=round(1000 * deadline, 1),
+                                 error=f"No response within {deadline:g}s")
+                    logger.warning(f"Poll: {source} missed its {deadline:g}s deadline, continuing without it")
+                except Exception as e:
+                    results[source] = []
+                    entry.update(status="error", latency_ms=round(1000 * (time.perf_counter() - started), 1),
+                                 error=str(e))
+                    logger.warning(f"Poll: {source} failed, continuing without it: {e}")
+                summary[source] = entry
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
         
-        # Load our fine-tuned AI brain
-        self.ai = UnifiedProcessor()
+        return results, summary
         
-    def poll_all_sources(self) -> Dict[str, List]:
+    def _advance_cursor(self, source: str, cursor: Dict[str, Any], items: List[Dict]) -> List[Dict]:
+        """
+        Resolve a source's current items from an incremental fetch and
+        store its new cursor
+        
+        Returns:
+            The items the source currently serves
+        """
+        if cursor.get("not_modified"):
+            # Unchanged since the last poll: serve the stored snapshot
+            return cursor.get("items", [])
+        if source == "reliefweb" and cursor.get("last_timestamp"):
+            # Only new reports were requested; merge them into the snapshot
+            merged = {item["id"]: item for item in cursor.get("items", [])}
+            merged.update({item["id"]: item for item in items})
+            items = sorted(merged.values(), key=lambda item: str(item.get("timestamp") or ""), reverse=True)
+            items = items[:self.relief.LIMIT]
+        self.state.save_cursor(source, cursor, items)
+        return items
+        
+    def poll_all_sources(self, news_api_key: Optional[str] = None) -> Dict[str, Any]:
         """
         Execute the full 4-Level polling cycle.
+        
+        Args:
+            news_api_key: NewsData.io key for this cycle only (defaults to
+                          the fetcher's)
+        
+        Returns:
+            Items per level plus a "sources" entry with each source's
+            status, item count and latency (see fetch_sources)
         """
-        logger.info("Starting Multi-Source Poll Cycle...")
+        with self._progress_lock:
+            cycle = self._progress["cycle"] + 1
+            started_at = datetime.datetime.now().isoformat()
+            self._progress.update(
+                state="fetching",
+                cycle=cycle,
+                started_at=started_at,
+                sources={},
+                news_total=0,
+                news_processed=0,
+                news_reused=0
+            )
+        started = time.perf_counter()
         
-        # 1. Level 3 (Speed/Triggers) - Check first!
-        triggers = self.usgs.fetch_triggers()
+        outcome: Dict[str, Any] = {"cycle": cycle, "started_at": started_at}
+        try:
+            result = self._poll_cycle(started, news_api_key)
+            outcome.update(
+                success=True,
+                sources={source: entry["status"] for source, entry in result["sources"].items()},
+                news_intelligence=len(result["news_intelligence"])
+            )
+            return result
+        except Exception as e:
+            outcome.update(success=False, error=str(e))
+            raise
+        finally:
+            outcome.update(
+                finished_at=datetime.datetime.now().isoformat(),
+                duration_ms=round(1000 * (time.perf_counter() - started), 1)
+            )
+            self._update_progress(state="idle", last_cycle=outcome)
         
-        # 2. Level 1 (The Anchor)
-        official_data = self.bipad.fetch_recent_incidents()
+    def _poll_cycle(self, started: float, news_api_key: Optional[str] = None) -> Dict[str, Any]:
+        logger.info("Starting Multi-Source Poll Cycle...")
         
-        # 3. Level 2 (Context)
-        context_reports = self.relief.fetch_nepal_reports()
+        # Levels 3 (Triggers), 1 (Anchor), 2 (Context) and 4 (Analysis
+        # candidates) are independent, so they are fetched concurrently
+        results, sources = self.fetch_sources(news_api_key)
+        triggers = results["usgs"]
+        official_data = results["bipad"]
+        context_reports = results["reliefweb"]
+        news_reports = results["news"]
         
-        # 4. Level 4 (Analysis candidates)
-        news_reports = self.news.fetch_disaster_news()
+        failed = [source for source, entry in sources.items() if entry["status"] != "ok"]
+        if failed:
+            logger.warning(f"Poll cycle continuing with partial results (unavailable: {', '.join(failed)})")
         
         # TEST MODE: Limit to 5 articles for faster testing
         # TO REMOVE THIS LIMIT: Set test_mode=False when creating MultiSourceFetcher
@@ -50,37 +300,120 @@ class MultiSourceFetcher:
             logger.info(f"TEST MODE: Limiting news from {len(news_reports)} to 5 articles")
             news_reports = news_reports[:5]
         
+        self._update_progress(state="analysing", sources=copy.deepcopy(sources), news_total=len(news_reports))
+        
         # 5. The "Intelligence" Layer: Cross-Reference
-        # We process news reports through our AI to see if they match Level 1
+        # We process news reports through our AI (in batches of articles)
+        # to see if they match Level 1, indexed once for the whole cycle
+        anchors = self._anchor_index(official_data)
         processed_news = []
-        for report in news_reports:
-            verified_report = self._verify_against_anchor(report, official_data)
-            
-            # ONLY include it if it's a real disaster (not skipped or rejected)
-            if verified_report.get("status") not in ["Skipped (Not a Disaster)", "Rejected (AI Detected Fake)", "Skipped (No Text)", "Skipped (Not Nepal Related)"]:
-                processed_news.append(verified_report)
+        for start in range(0, len(news_reports), self.analysis_batch_size):
+            batch = news_reports[start:start + self.analysis_batch_size]
+            for verified_report in self._verify_batch_against_anchor(batch, anchors):
+                # ONLY include it if it's a real disaster (not skipped or rejected)
+                if verified_report.get("status") not in ["Skipped (Not a Disaster)", "Rejected (AI Detected Fake)", "Skipped (No Text)", "Skipped (Not Nepal Related)"]:
+                    processed_news.append(verified_report)
+            self._update_progress(news_processed=start + len(batch))
             
         return {
             "triggers": triggers,
             "official_incidents": official_data,
             "context": context_reports,
-            "news_intelligence": processed_news
+            "news_intelligence": processed_news,
+            "sources": sources,
+            "cycle_ms": round(1000 * (time.perf_counter() - started), 1)
         }
         
-    def _verify_against_anchor(self, news_item: Dict, anchor_data: List[Dict]) -> Dict:
+    def _anchor_index(self, anchor_data: Union[List[Dict], AnchorIndex]) -> AnchorIndex:
+        if isinstance(anchor_data, AnchorIndex):
+            return anchor_data
+        return AnchorIndex(anchor_data, self.anchor_window_hours, self.anchor_fuzzy_cutoff)
+        
+    def _verify_against_anchor(self, news_item: Dict, anchor_data: Union[List[Dict], AnchorIndex]) -> Dict:
         """
         Uses trained AI models to extract details from news,
         then cross-references against BIPAD data.
         """
+        return self._verify_batch_against_anchor([news_item], anchor_data)[0]
+        
+    def _verify_batch_against_anchor(
+        self,
+        news_items: List[Dict],
+        anchor_data: Union[List[Dict], AnchorIndex]
+    ) -> List[Dict]:
+        """
+        Run the AI analysis over all new or changed news items in one batched
+        call (UnifiedProcessor.process_reports), then cross-reference each
+        item, new or previously analysed, against BIPAD data (incidents, or
+        an AnchorIndex built over them).
+        """
+        with_text = []
+        for news_item in news_items:
+            if news_item.get("text", ""):
+                with_text.append(news_item)
+            else:
+                news_item["status"] = "Skipped (No Text)"
+        
+        if not with_text:
+            return news_items
+        
+        # Articles analysed in an earlier cycle with the same content reuse
+        # their stored AI result; only new or changed ones reach the models
+        keys = [item_key(news_item) for news_item in with_text]
+        digests = [item_digest(news_item) for news_item in with_text]
+        seen = self.state.seen("news", keys) if self.state else {}
+        ai_results: List[Optional[Dict]] = [None] * len(with_text)
+        fresh = []
+        for i, (key, digest) in enumerate(zip(keys, digests)):
+            known = seen.get(key)
+            if known and known["digest"] == digest and known["result"]:
+                ai_results[i] = known["result"]
+            else:
+                fresh.append(i)
+        if len(fresh) < len(with_text):
+            logger.info(f"Reusing AI results for {len(with_text) - len(fresh)} previously seen articles")
+            with self._progress_lock:
+                self._progress["news_reused"] += len(with_text) - len(fresh)
+        
+        if fresh:
+            try:
+                # A. AI Analysis (Classification, NER, Verification)
+                fresh_results = self.ai.process_reports(
+                    [with_text[i]["text"] for i in fresh],
+                    [with_text[i].get("url") for i in fresh]
+                )
+            except Exception as e:
+                logger.error(f"Error in AI verification: {e}")
+                for i in fresh:
+                    with_text[i]["status"] = "Unverified (Processing Error)"
+                    with_text[i]["error"] = str(e)
+                fresh_results = None
+            
+            if fresh_results is not None:
+                for i, ai_result in zip(fresh, fresh_results):
+                    ai_results[i] = ai_result
+                if self.state:
+                    # Failed analyses are not recorded, so they are retried next cycle
+                    self.state.mark_seen("news", [
+                        {"key": keys[i], "digest": digests[i], "result": ai_result}
+                        for i, ai_result in zip(fresh, fresh_results)
+                        if ai_result.get("success", False)
+                    ])
+        
+        anchors = self._anchor_index(anchor_data)
+        for news_item, ai_result in zip(with_text, ai_results):
+            if ai_result is not None:
+                self._cross_reference(news_item, ai_result, anchors)
+        
+        return news_items
+        
+    def _cross_reference(self, news_item: Dict, ai_result: Dict, anchors: AnchorIndex) -> Dict:
+        """
+        Filter a news item on its AI analysis and match it against BIPAD data
+        """
         text = news_item.get("text", "")
-        if not text: 
-            news_item["status"] = "Skipped (No Text)"
-            return news_item
         
         try:
-            # A. AI Analysis (Classification, NER, Verification)
-            ai_result = self.ai.process_report(text=text, source_url=news_item.get("url"))
-            
             if not ai_result.get("success", False):
                 logger.warning(f"AI processing failed for {news_item.get('title')}: {ai_result.get('error')}")
                 news_item["status"] = "Unverified (AI Processing Failed)"
@@ -121,23 +454,10 @@ class MultiSourceFetcher:
 
             # B. Cross-Reference Logic
             # Does this location and type appear in official BIPAD data?
-            match_found = False
-            matching_anchor = None
-            
-            for anchor in anchor_data:
-                anchor_loc = anchor.get("location", "")
-                anchor_type = anchor.get("type", "")
-                
-                # Simple heuristic matching
-                # In production, use fuzzy string matching or geo-coordinates
-                if (anchor_loc in ai_locs or any(l in anchor_loc for l in ai_locs)) and \
-                   (ai_type.lower() in anchor_type.lower() or anchor_type.lower() in ai_type.lower()):
-                    match_found = True
-                    matching_anchor = anchor
-                    break
+            matching_anchor = anchors.match(ai_locs, ai_type, news_item.get("timestamp"))
             
             # C. Assign Trust Status
-            if match_found:
+            if matching_anchor is not None:
                 news_item["status"] = "Verified (Official Confirmation)"
                 news_item["anchor_id"] = matching_anchor["id"]
             else:
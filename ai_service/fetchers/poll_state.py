@@ -0,0 +1,255 @@
+"""
+Poll State Store
+Persistent state that makes poll cycles incremental: a cursor per source
+(HTTP validators, last seen id/timestamp and the last item snapshot) and an
+index of items already analysed, keyed by article id or link digest, with
+the content digest and AI result they were analysed with.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+from ai_service.utils import DATA_DIR
+from ai_service.utils.result_cache import _json_default, reconnect_after_fork
+
+DEFAULT_POLL_STATE_PATH = os.path.join(DATA_DIR, "poll_state.sqlite")
+
+
+def item_key(item: Dict[str, Any]) -> str:
+    """Stable identity of a fetched item: its id, else a digest of its link"""
+    if item.get("id"):
+        return str(item["id"])
+    link = item.get("url") or item.get("link") or ""
+    return "link:" + hashlib.sha256(link.encode("utf-8")).hexdigest()
+
+
+def item_digest(item: Dict[str, Any], fields: tuple = ("title", "text", "timestamp")) -> str:
+    """Digest of the fields that decide whether an item changed"""
+    payload = json.dumps([item.get(field) for field in fields], default=_json_default)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def conditional_headers(cursor: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """If-None-Match / If-Modified-Since headers from a source cursor"""
+    headers = {}
+    if cursor:
+        if cursor.get("etag"):
+            headers["If-None-Match"] = cursor["etag"]
+        if cursor.get("last_modified"):
+            headers["If-Modified-Since"] = cursor["last_modified"]
+    return headers
+
+
+def record_validators(cursor: Optional[Dict[str, Any]], response: Any) -> bool:
+    """
+    Update a cursor in place from a response
+
+    Args:
+        cursor: Source cursor, or None when polling without one
+        response: requests response
+
+    Returns:
+        True if the server answered 304 Not Modified
+    """
+    if cursor is None:
+        return False
+    cursor["not_modified"] = response.status_code == 304
+    if response.status_code == 200:
+        cursor["etag"] = response.headers.get("ETag")
+        cursor["last_modified"] = response.headers.get("Last-Modified")
+    return cursor["not_modified"]
+
+
+class PollStateStore:
+    """
+    SQLite-backed cursors and seen-item index.
+    WAL mode lets several worker processes share the file; each thread
+    keeps its own connection.
+    """
+
+    def __init__(self, path: str, max_items: int = 50_000):
+        """
+        Open (or create) the store
+
+        Args:
+            path: SQLite database file
+            max_items: Seen items kept before the least recently seen are pruned
+        """
+        self.path = path
+        self.max_items = max_items
+        self._local = threading.local()
+        reconnect_after_fork(self)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cursors ("
+            "source TEXT PRIMARY KEY, state TEXT NOT NULL, updated REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_items ("
+            "source TEXT NOT NULL, item_key TEXT NOT NULL, digest TEXT NOT NULL, "
+            "result TEXT, first_seen REAL NOT NULL, last_seen REAL NOT NULL, "
+            "PRIMARY KEY (source, item_key))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS seen_items_last_seen ON seen_items(last_seen)")
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get_cursor(self, source: str) -> Dict[str, Any]:
+        """
+        Cursor of a source
+
+        Returns:
+            Dict with etag, last_modified, last_id, last_timestamp and the
+            items of the last successful fetch (empty on first poll)
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT state FROM cursors WHERE source = ?", (source,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Poll state read failed: {e}")
+            return {}
+        return json.loads(row[0]) if row else {}
+
+    def save_cursor(self, source: str, cursor: Dict[str, Any], items: List[Dict[str, Any]]) -> None:
+        """
+        Store a source's cursor and snapshot after a successful fetch
+
+        Args:
+            source: Source name
+            cursor: Validators returned by the fetch (etag, last_modified)
+            items: Normalised items the source currently serves
+        """
+        latest = max(items, key=lambda item: str(item.get("timestamp") or ""), default=None)
+        state = {
+            "etag": cursor.get("etag"),
+            "last_modified": cursor.get("last_modified"),
+            "last_id": latest.get("id") if latest else cursor.get("last_id"),
+            "last_timestamp": latest.get("timestamp") if latest else cursor.get("last_timestamp"),
+            "items": items
+        }
+        try:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO cursors (source, state, updated) VALUES (?, ?, ?)",
+                (source, json.dumps(state, default=_json_default), time.time())
+            )
+            conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Poll state write failed: {e}")
+
+    def seen(self, source: str, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up previously analysed items
+
+        Args:
+            source: Source name
+            keys: Item keys (see item_key)
+
+        Returns:
+            Mapping of key to {"digest", "result"} for the keys found
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        try:
+            conn = self._connection()
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT item_key, digest, result FROM seen_items "
+                    f"WHERE source = ? AND item_key IN ({','.join('?' * len(chunk))})",
+                    (source, *chunk)
+                ).fetchall()
+                for key, digest, result in rows:
+                    found[key] = {"digest": digest, "result": json.loads(result) if result else None}
+            if found:
+                conn.execute(
+                    f"UPDATE seen_items SET last_seen = ? "
+                    f"WHERE source = ? AND item_key IN ({','.join('?' * len(found))})",
+                    (time.time(), source, *found)
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Poll state read failed: {e}")
+        return found
+
+    def mark_seen(self, source: str, entries: List[Dict[str, Any]]) -> None:
+        """
+        Record analysed items
+
+        Args:
+            source: Source name
+            entries: Dicts with key, digest and the JSON-serialisable result
+        """
+        if not entries:
+            return
+        now = time.time()
+        try:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT INTO seen_items (source, item_key, digest, result, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(source, item_key) DO UPDATE SET "
+                "digest = excluded.digest, result = excluded.result, last_seen = excluded.last_seen",
+                [
+                    (source, entry["key"], entry["digest"], json.dumps(entry["result"], default=_json_default), now, now)
+                    for entry in entries
+                ]
+            )
+            conn.execute(
+                "DELETE FROM seen_items WHERE rowid IN ("
+                "SELECT rowid FROM seen_items ORDER BY last_seen DESC LIMIT -1 OFFSET ?)",
+                (self.max_items,)
+            )
+            conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Poll state write failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        try:
+            conn = self._connection()
+            cursors = conn.execute("SELECT COUNT(*) FROM cursors").fetchone()[0]
+            items = conn.execute("SELECT COUNT(*) FROM seen_items").fetchone()[0]
+        except sqlite3.Error:
+            cursors = items = None
+        return {"cursors": cursors, "seen_items": items, "path": self.path}
+
+
+def open_poll_state(path: Optional[str] = None) -> Optional[PollStateStore]:
+    """
+    Open the poll state store
+
+    Args:
+        path: SQLite file (defaults to AI_POLL_STATE_PATH, then
+              DEFAULT_POLL_STATE_PATH; an empty value disables incremental
+              polling)
+
+    Returns:
+        The store, or None when disabled or the file cannot be opened
+    """
+    if path is None:
+        path = os.getenv("AI_POLL_STATE_PATH", DEFAULT_POLL_STATE_PATH)
+    if not path:
+        return None
+    try:
+        return PollStateStore(path)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Poll state unavailable ({e}); every cycle reprocesses all items")
+        return None
@@ -1,22 +1,30 @@
 
-import requests
-from typing import List, Dict
+from typing import List, Dict, Optional
 import datetime
 from loguru import logger
 
+from ai_service.utils.http_client import HttpClient, http_client
+
 class ReliefWebFetcher:
     """
     Level 2: The Context (NGO Situational Reports)
     Fetches SitReps for aids and gaps.
     """
     BASE_URL = "https://api.reliefweb.int/v1/reports"
+    LIMIT = 10
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, http: Optional[HttpClient] = None):
         self.timeout = timeout
+        self.http = http or http_client
         
-    def fetch_nepal_reports(self) -> List[Dict]:
+    def fetch_nepal_reports(self, strict: bool = False, cursor: Optional[Dict] = None) -> List[Dict]:
         """
         Fetch specialized situation reports for Nepal.
+        
+        Args:
+            strict: Raise on network or API errors instead of returning []
+            cursor: Source cursor; when it has a last_timestamp only reports
+                    created since then are requested
         """
         # ReliefWeb recommends identifying your app
         headers = {
@@ -28,7 +36,7 @@ class ReliefWebFetcher:
             "appname": "mama-bhanjas-hackfest",
             "profile": "list",
             "preset": "latest",
-            "limit": 10,
+            "limit": self.LIMIT,
             "filter": {
                 "operator": "AND",
                 "conditions": [
@@ -41,8 +49,16 @@ class ReliefWebFetcher:
             }
         }
         
+        if cursor and cursor.get("last_timestamp"):
+            # Incremental poll: only reports newer than the last one seen
+            payload["filter"]["conditions"].append(
+                {"field": "date.created", "value": {"from": cursor["last_timestamp"]}}
+            )
+        
         try:
-            response = requests.post(self.BASE_URL, json=payload, headers=headers, timeout=self.timeout)
+            response = self.http.post(self.BASE_URL, source=True, json=payload, headers=headers, timeout=self.timeout)
+            if strict:
+                response.raise_for_status()
             
             if response.status_code == 200:
                 data = response.json()
@@ -55,6 +71,8 @@ class ReliefWebFetcher:
                 
         except Exception as e:
             logger.error(f"ReliefWeb Fetch Failed: {e}")
+            if strict:
+                raise
             return []
             
     def _normalize(self, raw_data: List[Dict]) -> List[Dict]:
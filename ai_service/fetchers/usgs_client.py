@@ -1,8 +1,10 @@
 
-import requests
-from typing import List, Dict
+from typing import List, Dict, Optional
 from loguru import logger
 
+from ai_service.fetchers.poll_state import conditional_headers, record_validators
+from ai_service.utils.http_client import HttpClient, http_client
+
 class USGSFetcher:
     """
     Level 3: The Trigger (Earthquake Sensors)
@@ -14,9 +16,26 @@ class USGSFetcher:
     LAT_MIN, LAT_MAX = 26.0, 31.0
     LON_MIN, LON_MAX = 80.0, 89.0
     
-    def fetch_triggers(self) -> List[Dict]:
+    def __init__(self, timeout: int = 5, http: Optional[HttpClient] = None):
+        self.timeout = timeout
+        self.http = http or http_client
+        
+    def fetch_triggers(self, strict: bool = False, cursor: Optional[Dict] = None) -> List[Dict]:
+        """
+        Fetch significant earthquakes in the Nepal region from the last hour.
+        
+        Args:
+            strict: Raise on network or API errors instead of returning []
+            cursor: Source cursor for a conditional request; updated in place
+                    with the feed's validators, and "not_modified" is set
+                    (with [] returned) when the feed is unchanged
+        """
         try:
-            response = requests.get(self.URL, timeout=5)
+            response = self.http.get(self.URL, source=True, headers=conditional_headers(cursor), timeout=self.timeout)
+            if record_validators(cursor, response):
+                return []
+            if strict:
+                response.raise_for_status()
             if response.status_code == 200:
                 data = response.json()
                 features = data.get("features", [])
@@ -49,4 +68,6 @@ class USGSFetcher:
             
         except Exception as e:
             logger.error(f"USGS Fetch Failed: {e}")
+            if strict:
+                raise
             return []
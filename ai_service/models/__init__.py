@@ -1,7 +1,23 @@
 """
 AI Models package
+Model classes are imported on first access, so importing the package (or a
+light submodule such as generation_profiles) does not load torch
 """
-from .classifier import CategoryClassifier
-from .summarizer import TextSummarizer
+import importlib
 
-__all__ = ['CategoryClassifier', 'TextSummarizer']
+_EXPORTS = {
+    'CategoryClassifier': '.classifier',
+    'TextSummarizer': '.summarizer',
+    'ModelRegistry': '.registry',
+    'model_registry': '.registry',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,10 +1,12 @@
 from typing import List, Dict, Optional
 import torch
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
+from transformers import AutoModelForSequenceClassification
 from loguru import logger
 import numpy as np
 
 from ai_service.utils import TextPreprocessor, get_device
+from ai_service.models.registry import model_registry, resolve_precision
+from ai_service.models.onnx_backend import resolve_backend, softmax
 
 class CategoryClassifier:
     """
@@ -29,7 +31,11 @@ class CategoryClassifier:
         self,
         model_name: str = "facebook/bart-large-mnli",
         categories: Optional[List[str]] = None,
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        max_batch_size: int = 16,
+        max_length: int = 512,
+        precision: Optional[str] = None,
+        backend: Optional[str] = None
     ):
         """
         Initialize the classifier
@@ -39,18 +45,32 @@ class CategoryClassifier:
                        Default: valhalla/distilbart-mnli-12-1 (~400MB, more accurate than distilbert)
             categories: List of category labels
             device: Device to run model on ('cuda' or 'cpu')
+            max_batch_size: Maximum number of premise/hypothesis pairs scored
+                            in a single forward pass (long label lists are chunked)
+            max_length: Maximum token length of a premise/hypothesis pair
+            precision: 'fp32', 'bf16' or 'int8' (defaults to the "classifier"
+                       entry of AI_MODEL_PRECISION)
+            backend: 'torch' or 'onnx' (defaults to the "classifier" entry of
+                     AI_INFERENCE_BACKEND)
         """
         self.categories = categories or self.DEFAULT_CATEGORIES
         self.device = device or get_device()
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_length = max_length
+        self.model_name = model_name
+        self.precision = resolve_precision("classifier", precision)
+        self.backend = resolve_backend("classifier", backend)
         self.preprocessor = TextPreprocessor()
         
         logger.info(f"Loading classifier model: {model_name}")
         
         try:
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(model_name, use_safetensors=True)
-            self.model.to(self.device)
-            self.model.eval()
+            # Shared with any other pipeline using the same model on this device
+            self.tokenizer, self.model = model_registry.acquire(
+                model_name, AutoModelForSequenceClassification, self.device, self.precision, self.backend
+            )
+            # The registry runs ONNX models on CPU only and may have loaded torch
+            self.backend = self.model.inference_backend
             
             # Detect entailment index dynamically
             self.entailment_idx = 2 # Default for BART/DistilBART
@@ -102,67 +122,13 @@ class CategoryClassifier:
             # Use provided categories or default ones
             target_categories = categories or self.categories
             
-            # Use zero-shot classification approach
-            scores = []
+            # Zero-shot classification: score every (premise, hypothesis) pair
+            # in padded batches instead of one forward pass per category
+            hypotheses = [hypothesis_template.format(category) for category in target_categories]
+            encoded_pairs = self._encode_pairs([cleaned_text] * len(hypotheses), hypotheses)
+            scores = self._score_pairs(encoded_pairs)
             
-            for category in target_categories:
-                # Create hypothesis for zero-shot classification
-                # Use a more descriptive hypothesis if available
-                hypothesis = hypothesis_template.format(category)
-                
-                # Tokenize
-                inputs = self.tokenizer(
-                    cleaned_text,
-                    hypothesis,
-                    return_tensors="pt",
-                    truncation=True,
-                    max_length=512
-                ).to(self.device)
-                
-                # Get prediction
-                with torch.no_grad():
-                    outputs = self.model(**inputs)
-                    logits = outputs.logits
-                    
-                    # Get entailment score
-                    probs = torch.softmax(logits, dim=1)
-                    entailment_score = probs[0][self.entailment_idx].item()
-                    scores.append(entailment_score)
-                    # logger.debug(f"Label: {category}, Score: {entailment_score:.4f}")
-            
-            # Normalize scores (Softmax over entailment scores for competition between labels)
-            scores = np.array(scores)
-            # Log raw scores for debugging if it's suspicious
-            if scores.max() < 0.2:
-                logger.warning(f"Low confidence classification. Top raw score: {scores.max():.4f}")
-            
-            exp_scores = np.exp(scores - np.max(scores))
-            normalized_scores = exp_scores / exp_scores.sum()
-            
-            # Get top categories
-            top_indices = np.argsort(normalized_scores)[::-1][:top_k]
-            top_categories = [
-                {
-                    "category": target_categories[idx],
-                    "confidence": float(normalized_scores[idx]),
-                    "raw_score": float(scores[idx])
-                }
-                for idx in top_indices
-                if normalized_scores[idx] >= threshold
-            ]
-            
-            # Get primary category
-            primary_idx = top_indices[0]
-            primary_category = target_categories[primary_idx]
-            primary_confidence = float(normalized_scores[primary_idx])
-            
-            logger.info(f"Classified as '{primary_category}' with confidence {primary_confidence:.3f}")
-            
-            return {
-                "category": primary_category,
-                "confidence": primary_confidence,
-                "top_categories": top_categories
-            }
+            return self._build_result(scores, target_categories, top_k, threshold)
             
         except Exception as e:
             logger.error(f"Classification failed: {e}")
@@ -173,30 +139,195 @@ class CategoryClassifier:
                 "error": str(e)
             }
     
+    def _build_result(
+        self,
+        scores: np.ndarray,
+        target_categories: List[str],
+        top_k: int,
+        threshold: float
+    ) -> Dict[str, any]:
+        """
+        Turn raw entailment scores into a classification result
+        
+        Args:
+            scores: Entailment probability per category
+            target_categories: Category labels aligned with scores
+            top_k: Number of top categories to return
+            threshold: Minimum confidence threshold
+            
+        Returns:
+            Dictionary with classification results
+        """
+        # Normalize scores (Softmax over entailment scores for competition between labels)
+        scores = np.array(scores)
+        # Log raw scores for debugging if it's suspicious
+        if scores.max() < 0.2:
+            logger.warning(f"Low confidence classification. Top raw score: {scores.max():.4f}")
+        
+        exp_scores = np.exp(scores - np.max(scores))
+        normalized_scores = exp_scores / exp_scores.sum()
+        
+        # Get top categories
+        top_indices = np.argsort(normalized_scores)[::-1][:top_k]
+        top_categories = [
+            {
+                "category": target_categories[idx],
+                "confidence": float(normalized_scores[idx]),
+                "raw_score": float(scores[idx])
+            }
+            for idx in top_indices
+            if normalized_scores[idx] >= threshold
+        ]
+        
+        # Get primary category
+        primary_idx = top_indices[0]
+        primary_category = target_categories[primary_idx]
+        primary_confidence = float(normalized_scores[primary_idx])
+        
+        logger.info(f"Classified as '{primary_category}' with confidence {primary_confidence:.3f}")
+        
+        return {
+            "category": primary_category,
+            "confidence": primary_confidence,
+            "top_categories": top_categories
+        }
+    
+    def _encode_pairs(self, premises: List[str], hypotheses: List[str]) -> List[Dict[str, List[int]]]:
+        """
+        Tokenize premise/hypothesis pairs in a single tokenizer call.
+        Only the premise is truncated so the hypothesis always survives.
+        
+        Args:
+            premises: Cleaned input texts, aligned with hypotheses
+            hypotheses: Hypothesis sentences, one per pair
+            
+        Returns:
+            List of unpadded model inputs, one per pair
+        """
+        encoded = self.tokenizer(
+            premises,
+            hypotheses,
+            truncation="only_first",
+            max_length=self.max_length
+        )
+        keys = list(encoded.keys())
+        return [
+            {key: encoded[key][i] for key in keys}
+            for i in range(len(premises))
+        ]
+    
+    def _score_pairs(self, encoded_pairs: List[Dict[str, List[int]]]) -> np.ndarray:
+        """
+        Run encoded pairs through the NLI model in padded batches.
+        Pairs are sorted by token length first so each batch pads to a
+        similar length, and the scores are scattered back afterwards.
+        
+        Args:
+            encoded_pairs: Unpadded model inputs from _encode_pairs
+            
+        Returns:
+            Array of entailment probabilities, aligned with encoded_pairs
+        """
+        scores = np.zeros(len(encoded_pairs), dtype=np.float32)
+        order = sorted(range(len(encoded_pairs)), key=lambda i: len(encoded_pairs[i]["input_ids"]))
+        
+        for start in range(0, len(order), self.max_batch_size):
+            chunk_indices = order[start:start + self.max_batch_size]
+            if self.backend == "onnx":
+                inputs = self.tokenizer.pad(
+                    [encoded_pairs[i] for i in chunk_indices],
+                    padding=True,
+                    return_tensors="np"
+                )
+                probs = softmax(self.model(**inputs).logits)
+                scores[chunk_indices] = probs[:, self.entailment_idx]
+                continue
+            
+            inputs = self.tokenizer.pad(
+                [encoded_pairs[i] for i in chunk_indices],
+                padding=True,
+                return_tensors="pt"
+            ).to(self.device)
+            
+            with torch.no_grad():
+                logits = self.model(**inputs).logits
+                probs = torch.softmax(logits.float(), dim=1)
+                scores[chunk_indices] = probs[:, self.entailment_idx].cpu().numpy()
+        
+        return scores
+    
     def batch_classify(
         self,
         texts: List[str],
         top_k: int = 3,
-        threshold: float = 0.1
+        threshold: float = 0.1,
+        categories: Optional[List[str]] = None,
+        hypothesis_template: str = "This text is about {}."
     ) -> List[Dict[str, any]]:
         """
-        Classify multiple texts
+        Classify multiple texts.
+        (text, hypothesis) pairs from every document are flattened into a
+        single length-sorted work list and scored in shared batches.
         
         Args:
             texts: List of texts to classify
             top_k: Number of top categories to return
             threshold: Minimum confidence threshold
+            categories: Optional override of the category labels
+            hypothesis_template: Template used to build each hypothesis
             
         Returns:
             List of classification results
         """
-        results = []
-        for text in texts:
-            result = self.classify(text, top_k=top_k, threshold=threshold)
-            results.append(result)
+        target_categories = categories or self.categories
+        hypotheses = [hypothesis_template.format(category) for category in target_categories]
+        
+        results: List[Optional[Dict[str, any]]] = [None] * len(texts)
+        premises = []
+        doc_indices = []
+        
+        for i, text in enumerate(texts):
+            cleaned_text = self.preprocessor.clean_text(text)
+            if not cleaned_text:
+                logger.warning("Empty text provided for classification")
+                results[i] = {
+                    "category": "Other",
+                    "confidence": 0.0,
+                    "top_categories": []
+                }
+                continue
+            premises.append(cleaned_text)
+            doc_indices.append(i)
+        
+        if not premises:
+            return results
+        
+        try:
+            # Flatten into (premise, hypothesis) pairs, document-major
+            pair_premises = [premise for premise in premises for _ in hypotheses]
+            pair_hypotheses = hypotheses * len(premises)
+            encoded_pairs = self._encode_pairs(pair_premises, pair_hypotheses)
+            scores = self._score_pairs(encoded_pairs).reshape(len(premises), len(hypotheses))
+            
+            for row, doc_idx in enumerate(doc_indices):
+                results[doc_idx] = self._build_result(scores[row], target_categories, top_k, threshold)
+                
+        except Exception as e:
+            logger.error(f"Batch classification failed: {e}")
+            for doc_idx in doc_indices:
+                results[doc_idx] = {
+                    "category": "Other",
+                    "confidence": 0.0,
+                    "top_categories": [],
+                    "error": str(e)
+                }
         
         return results
     
+    def close(self) -> None:
+        """Release this classifier's reference to the shared model"""
+        model_registry.release(self.model_name, AutoModelForSequenceClassification, self.device, self.precision, self.backend)
+    
     def add_category(self, category: str) -> None:
         """
         Add a new category to the classifier
@@ -0,0 +1,34 @@
+"""
+Summary Generation Profiles
+Named decoding settings for TextSummarizer, kept free of torch imports so
+request validation can use them without loading the model stack
+"""
+from typing import Any, Dict
+
+# Named decoding profiles, cheapest first.
+# "extractive" skips the model entirely; "quality" is the original 5-beam setting.
+GENERATION_PROFILES: Dict[str, Dict[str, Any]] = {
+    "extractive": {
+        "extractive": True
+    },
+    "fast": {
+        "num_beams": 1,
+        "max_length_cap": 60,
+        "no_repeat_ngram_size": 3
+    },
+    "balanced": {
+        "num_beams": 2,
+        "length_penalty": 1.0,
+        "early_stopping": True,
+        "no_repeat_ngram_size": 3,
+        "repetition_penalty": 1.2
+    },
+    "quality": {
+        "num_beams": 5,
+        "length_penalty": 1.0,
+        "early_stopping": True,
+        "no_repeat_ngram_size": 3,
+        "repetition_penalty": 1.2
+    }
+}
+DEFAULT_PROFILE = "quality"
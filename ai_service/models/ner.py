@@ -1,10 +1,12 @@
 
 from typing import List, Dict, Optional
 import torch
-from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
+from transformers import AutoModelForTokenClassification, pipeline
 from loguru import logger
 
 from ai_service.utils import TextPreprocessor, get_device
+from ai_service.models.registry import model_registry, resolve_precision
+from ai_service.models.onnx_backend import resolve_backend, softmax, group_token_entities
 
 class EntityExtractor:
     """
@@ -15,7 +17,9 @@ class EntityExtractor:
     def __init__(
         self,
         model_name: str = "dslim/bert-base-NER",
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        precision: Optional[str] = None,
+        backend: Optional[str] = None
     ):
         """
         Initialize the NER model
@@ -24,78 +28,145 @@ class EntityExtractor:
             model_name: BERT-based NER model
                        Default: dslim/bert-base-NER (More accurate than DistilBERT)
             device: Device to run on
+            precision: 'fp32', 'bf16' or 'int8' (defaults to the "ner" entry
+                       of AI_MODEL_PRECISION)
+            backend: 'torch' or 'onnx' (defaults to the "ner" entry of
+                     AI_INFERENCE_BACKEND)
         """
         self.device = device or get_device()
         self.model_device = 0 if self.device == "cuda" else -1
+        self.model_name = model_name
+        self.precision = resolve_precision("ner", precision)
+        self.backend = resolve_backend("ner", backend)
+        self.ner_pipeline = None
         
         logger.info(f"Loading NER model: {model_name}")
         
         try:
-            self.ner_pipeline = pipeline(
-                "ner", 
-                model=model_name, 
-                tokenizer=model_name, 
-                aggregation_strategy="max", 
-                device=self.model_device,
-                model_kwargs={"use_safetensors": True}
+            self.tokenizer, self.model = model_registry.acquire(
+                model_name, AutoModelForTokenClassification, self.device, self.precision, self.backend
             )
+            # The registry runs ONNX models on CPU only and may have loaded torch
+            self.backend = self.model.inference_backend
+            # The ONNX backend decodes entities itself (see _onnx_entities)
+            if self.backend == "torch":
+                self.ner_pipeline = pipeline(
+                    "ner", 
+                    model=self.model, 
+                    tokenizer=self.tokenizer, 
+                    aggregation_strategy="max", 
+                    device=self.model_device
+                )
             logger.info(f"NER model loaded successfully on {self.device}")
         except Exception as e:
             logger.error(f"Failed to load NER model: {e}")
             raise
 
+    def close(self) -> None:
+        """Release this extractor's reference to the shared model"""
+        model_registry.release(
+            self.model_name, AutoModelForTokenClassification, self.device, self.precision, self.backend
+        )
+
+    def _onnx_entities(self, text: str) -> List[Dict]:
+        """Grouped entities from the ONNX model, in the "ner" pipeline's format"""
+        inputs = self.tokenizer(
+            text,
+            return_tensors="np",
+            return_offsets_mapping=True,
+            truncation=True,
+            max_length=512
+        )
+        offsets = inputs.pop("offset_mapping")[0]
+        probs = softmax(self.model(**inputs).logits[0])
+        return group_token_entities(text, offsets, inputs.word_ids(0), probs, self.model.config.id2label)
+
     def extract_entities(self, text: str) -> List[Dict]:
         """
         Extract entities from text and clean results.
         """
-        if not text or len(text.strip()) < 5:
-            return []
+        return self.batch_extract_entities([text])[0]
+
+    def batch_extract_entities(self, texts: List[str], batch_size: int = 8) -> List[List[Dict]]:
+        """
+        Extract entities from several texts.
+        With the torch backend the texts go through the "ner" pipeline
+        together, so the model runs in shared batches.
+        
+        Args:
+            texts: Texts to analyse
+            batch_size: Texts per forward pass
+            
+        Returns:
+            Cleaned entities per text
+        """
+        entities: List[List[Dict]] = [[] for _ in texts]
+        pending = [i for i, text in enumerate(texts) if text and len(text.strip()) >= 5]
+        if not pending:
+            return entities
             
         try:
-            results = self.ner_pipeline(text)
-            entities = []
+            if self.ner_pipeline is not None:
+                raw = self.ner_pipeline([texts[i] for i in pending], batch_size=batch_size)
+            else:
+                raw = [self._onnx_entities(texts[i]) for i in pending]
+            for i, results in zip(pending, raw):
+                entities[i] = self._clean_entities(results)
+        except Exception as e:
+            logger.error(f"NER extraction failed: {e}")
+        return entities
 
-            for res in results:
-                word = res["word"].replace(" ", " ").strip()
-                label = res["entity_group"]
-                
-                # Cleanup common subword artifacts if any remain
-                if word.startswith("##"):
-                    if entities:
-                        entities[-1]["entity"] += word[2:]
-                    continue
-                
-                # Skip artifacts
-                if word in ["[SEP]", "[CLS]", "[PAD]"] or len(word) < 2:
-                    continue
+    @staticmethod
+    def _clean_entities(results: List[Dict]) -> List[Dict]:
+        """Merge subword artifacts and drop duplicate entities"""
+        entities = []
 
-                entities.append({
-                    "entity": word.strip(",. "),
-                    "label": label,
-                    "confidence": float(res["score"]),
-                    "start": res["start"],
-                    "end": res["end"]
-                })
+        for res in results:
+            word = res["word"].replace(" ", " ").strip()
+            label = res["entity_group"]
+            
+            # Cleanup common subword artifacts if any remain
+            if word.startswith("##"):
+                if entities:
+                    entities[-1]["entity"] += word[2:]
+                continue
             
-            # Deduplication logic with position awareness
-            unique_entities = []
-            seen_entities = set()
+            # Skip artifacts
+            if word in ["[SEP]", "[CLS]", "[PAD]"] or len(word) < 2:
+                continue
 
-            for ent in entities:
-                key = (ent["entity"].lower(), ent["label"])
-                if key not in seen_entities:
-                    unique_entities.append(ent)
-                    seen_entities.add(key)
-                    
-            return unique_entities
-        except Exception as e:
-            logger.error(f"NER extraction failed: {e}")
-            return []
+            entities.append({
+                "entity": word.strip(",. "),
+                "label": label,
+                "confidence": float(res["score"]),
+                "start": res["start"],
+                "end": res["end"]
+            })
+        
+        # Deduplication logic with position awareness
+        unique_entities = []
+        seen_entities = set()
 
-    def get_locations(self, text: str) -> List[str]:
-        """Helper to specifically get location entities with cleaning"""
+        for ent in entities:
+            key = (ent["entity"].lower(), ent["label"])
+            if key not in seen_entities:
+                unique_entities.append(ent)
+                seen_entities.add(key)
+                
+        return unique_entities
+
+    def get_locations(self, text: str, entities: Optional[List[Dict]] = None) -> List[str]:
+        """
+        Helper to specifically get location entities with cleaning
+        
+        Args:
+            text: Text to analyse
+            entities: Entities already extracted from the text (extracted
+                      here when omitted)
+        """
         # Start with model entities
-        entities = self.extract_entities(text)
+        if entities is None:
+            entities = self.extract_entities(text)
         raw_locations = [ent["entity"] for ent in entities if ent["label"] in ["LOC", "GPE"]]
         
         # Add regex matches
@@ -0,0 +1,282 @@
+"""
+ONNX Runtime Backend
+Exports transformer models to ONNX once, caches the graphs on disk and runs
+them with ONNX Runtime instead of torch. Encoder classification heads are
+exported whole; for seq2seq models only the encoder is exported and
+decoding stays with transformers' generate().
+"""
+import hashlib
+import importlib.util
+import os
+import re
+import types
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+from loguru import logger
+
+from ai_service.utils import DATA_DIR
+from ai_service.utils.result_cache import model_revision
+
+BACKENDS = ("torch", "onnx")
+DEFAULT_BACKEND = "torch"
+DEFAULT_ONNX_CACHE_DIR = os.path.join(DATA_DIR, "onnx")
+ONNX_OPSET = 17
+
+# Optional dependency, looked up without importing it
+ONNXRUNTIME_AVAILABLE = importlib.util.find_spec("onnxruntime") is not None
+
+# Graph output and whether it has a sequence axis, per model head
+_EXPORT_OUTPUTS = {
+    "AutoModelForSequenceClassification": ("logits", False),
+    "AutoModelForTokenClassification": ("logits", True),
+    "AutoModelForSeq2SeqLM": ("last_hidden_state", True)
+}
+
+
+def resolve_backend(role: str, backend: Optional[str] = None) -> str:
+    """
+    Inference backend a model should run on
+
+    Args:
+        role: Which model this is ("classifier", "summarizer", "ner", "news")
+        backend: Explicit setting; None falls back to AI_INFERENCE_BACKEND,
+                 e.g. "onnx" or "onnx,summarizer=torch"
+
+    Returns:
+        "torch" or "onnx" ("torch" when onnxruntime is not installed)
+    """
+    if backend is None:
+        configured: Dict[str, str] = {}
+        for item in os.getenv("AI_INFERENCE_BACKEND", "").split(","):
+            name, _, value = item.rpartition("=")
+            value = value.strip().lower()
+            if value in BACKENDS:
+                configured[name.strip() or "*"] = value
+            elif value:
+                logger.warning(f"Ignoring unknown inference backend '{item}' (use one of {', '.join(BACKENDS)})")
+        backend = configured.get(role, configured.get("*", DEFAULT_BACKEND))
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Use one of: {', '.join(BACKENDS)}")
+    if backend == "onnx" and not ONNXRUNTIME_AVAILABLE:
+        logger.warning(f"onnxruntime not installed; running the {role} model with torch")
+        return DEFAULT_BACKEND
+    return backend
+
+
+def softmax(logits: np.ndarray, axis: int = -1) -> np.ndarray:
+    """Numerically stable softmax"""
+    exp = np.exp(logits - logits.max(axis=axis, keepdims=True))
+    return exp / exp.sum(axis=axis, keepdims=True)
+
+
+class OnnxModel:
+    """
+    ONNX Runtime session with a model-like call interface.
+    Called with tokenizer outputs (numpy arrays); returns an object whose
+    attributes are the graph outputs, e.g. .logits or .last_hidden_state.
+    """
+
+    def __init__(self, path: str, config: Any, intra_op_threads: int = 0, inter_op_threads: int = 0):
+        """
+        Open an exported graph
+
+        Args:
+            path: .onnx file
+            config: The transformers config of the exported model
+            intra_op_threads: Threads per operator (0 lets ONNX Runtime decide)
+            inter_op_threads: Operators run in parallel (0 lets ONNX Runtime decide)
+        """
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = inter_op_threads
+
+        self.path = path
+        self.config = config
+        self.session = ort.InferenceSession(path, sess_options=options, providers=["CPUExecutionProvider"])
+        self.input_names = [node.name for node in self.session.get_inputs()]
+        self.output_names = [node.name for node in self.session.get_outputs()]
+
+    def __call__(self, **inputs: Any) -> types.SimpleNamespace:
+        feed = {
+            name: np.asarray(inputs[name], dtype=np.int64)
+            for name in self.input_names
+            if name in inputs
+        }
+        outputs = self.session.run(self.output_names, feed)
+        return types.SimpleNamespace(**dict(zip(self.output_names, outputs)))
+
+    def memory_bytes(self) -> int:
+        """Size of the graph's weights (approximated by the file size)"""
+        return os.path.getsize(self.path)
+
+
+def _cache_dir(model_name: str, config: Any) -> str:
+    """Export directory for the current revision of a model"""
+    # model_revision only needs the config, so the weights are not loaded
+    revision = model_revision(model_name, types.SimpleNamespace(config=config))
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name.strip("/"))[-60:]
+    digest = hashlib.sha256(revision.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(os.getenv("AI_ONNX_CACHE_DIR", DEFAULT_ONNX_CACHE_DIR), f"{slug}-{digest}")
+
+
+def _export(model_name: str, model_class: type, tokenizer: Any, path: str) -> None:
+    """Trace a model (or a seq2seq model's encoder) to ONNX"""
+    import torch
+
+    output_name, per_token = _EXPORT_OUTPUTS[model_class.__name__]
+    model = model_class.from_pretrained(model_name, use_safetensors=True, attn_implementation="eager")
+    if model_class.__name__ == "AutoModelForSeq2SeqLM":
+        model = model.get_encoder()
+
+    sample = tokenizer(["A short sample.", "A somewhat longer sample sentence for tracing."], padding=True, return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+
+    class Wrapper(torch.nn.Module):
+        def __init__(self, inner):
+            super().__init__()
+            self.inner = inner
+
+        def forward(self, *args):
+            return getattr(self.inner(**dict(zip(input_names, args))), output_name)
+
+    # The exporter restores the wrapper's training flag afterwards, so the
+    # wrapper itself must be in eval mode for dropout to stay off
+    wrapper = Wrapper(model).eval()
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes[output_name] = {0: "batch", 1: "sequence"} if per_token else {0: "batch"}
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with torch.no_grad():
+        torch.onnx.export(
+            wrapper,
+            tuple(sample[name] for name in input_names),
+            tmp_path,
+            input_names=input_names,
+            output_names=[output_name],
+            dynamic_axes=dynamic_axes,
+            opset_version=ONNX_OPSET,
+            dynamo=False
+        )
+    # Atomic, so concurrent exporters in other workers never see a partial file
+    os.replace(tmp_path, path)
+
+
+def load_onnx_model(model_name: str, model_class: type, precision: str = "fp32"):
+    """
+    Tokenizer and ONNX Runtime model, exporting on first use
+
+    Args:
+        model_name: Hugging Face model name or local path
+        model_class: transformers Auto class the model is used with; for
+                     AutoModelForSeq2SeqLM only the encoder is exported
+        precision: "fp32" or "int8" (ONNX Runtime dynamic quantization);
+                   "bf16" is not supported on CPU and runs as fp32
+
+    Returns:
+        Tuple of (tokenizer, OnnxModel)
+    """
+    from transformers import AutoConfig, AutoTokenizer
+
+    if model_class.__name__ not in _EXPORT_OUTPUTS:
+        raise ValueError(f"No ONNX export for {model_class.__name__}")
+    if precision == "bf16":
+        logger.warning(f"bf16 is not supported by the ONNX backend; running '{model_name}' in fp32")
+        precision = "fp32"
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    config = AutoConfig.from_pretrained(model_name)
+    directory = _cache_dir(model_name, config)
+    os.makedirs(directory, exist_ok=True)
+    kind = "encoder" if model_class.__name__ == "AutoModelForSeq2SeqLM" else "model"
+    path = os.path.join(directory, f"{kind}.onnx")
+
+    if not os.path.exists(path):
+        logger.info(f"Exporting '{model_name}' to ONNX at {path}")
+        _export(model_name, model_class, tokenizer, path)
+
+    if precision == "int8":
+        quantized_path = os.path.join(directory, f"{kind}.int8.onnx")
+        if not os.path.exists(quantized_path):
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            logger.info(f"Quantizing '{model_name}' ONNX graph to int8")
+            tmp_path = f"{quantized_path}.{os.getpid()}.tmp"
+            quantize_dynamic(path, tmp_path, weight_type=QuantType.QInt8)
+            os.replace(tmp_path, quantized_path)
+        path = quantized_path
+
+    model = OnnxModel(
+        path,
+        config=config,
+        intra_op_threads=int(os.getenv("AI_ONNX_THREADS", "0")),
+        inter_op_threads=int(os.getenv("AI_ONNX_INTER_OP_THREADS", "0"))
+    )
+    return tokenizer, model
+
+
+def group_token_entities(
+    text: str,
+    offsets: Sequence[Sequence[int]],
+    word_ids: Sequence[Optional[int]],
+    probs: np.ndarray,
+    id2label: Dict[int, str]
+) -> List[Dict[str, Any]]:
+    """
+    Turn per-token NER probabilities into entity spans, matching the
+    transformers "ner" pipeline with aggregation_strategy="max"
+
+    Args:
+        text: Original text
+        offsets: Character span of each token
+        word_ids: Word index of each token (None for special tokens)
+        probs: Label probabilities, shape (tokens, labels)
+        id2label: Label names by index (BIO scheme, e.g. "B-LOC")
+
+    Returns:
+        Entities with entity_group, score, word, start and end
+    """
+    # Each word takes the label of its most confident token
+    words: List[Dict[str, Any]] = []
+    for index, word_id in enumerate(word_ids):
+        if word_id is None:
+            continue
+        if words and words[-1]["word_id"] == word_id:
+            words[-1]["tokens"].append(index)
+        else:
+            words.append({"word_id": word_id, "tokens": [index]})
+
+    entities: List[Dict[str, Any]] = []
+    current: Optional[Dict[str, Any]] = None
+    for word in words:
+        token_probs = probs[word["tokens"]]
+        best_token = int(token_probs.max(axis=1).argmax())
+        label_id = int(token_probs[best_token].argmax())
+        label = id2label.get(label_id, str(label_id))
+        score = float(token_probs[best_token, label_id])
+        start, end = int(offsets[word["tokens"][0]][0]), int(offsets[word["tokens"][-1]][1])
+
+        prefix, _, tag = label.rpartition("-")
+        if label == "O":
+            current = None
+            continue
+        if current is not None and current["entity_group"] == tag and prefix != "B":
+            current["end"] = end
+            current["scores"].append(score)
+            continue
+        current = {"entity_group": tag, "start": start, "end": end, "scores": [score]}
+        entities.append(current)
+
+    return [
+        {
+            "entity_group": entity["entity_group"],
+            "score": float(np.mean(entity["scores"])),
+            "word": text[entity["start"]:entity["end"]],
+            "start": entity["start"],
+            "end": entity["end"]
+        }
+        for entity in entities
+    ]
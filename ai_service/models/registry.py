@@ -0,0 +1,272 @@
+"""
+Shared Model Registry
+Process-wide store of loaded models so every pipeline reuses one instance
+per (model name, head, device, precision, backend) instead of loading its
+own copy
+"""
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from loguru import logger
+
+# Weight formats a model can be loaded in:
+#   fp32 - full precision (the default)
+#   bf16 - bfloat16 weights and activations, halves memory
+#   int8 - dynamic int8 quantization of the Linear layers (CPU only)
+PRECISIONS = ("fp32", "bf16", "int8")
+DEFAULT_PRECISION = "fp32"
+
+
+def parse_precision_spec(spec: Optional[str]) -> Dict[str, str]:
+    """
+    Parse a precision setting such as "int8" or "bf16,summarizer=fp32"
+
+    Args:
+        spec: Comma-separated items; a bare precision sets the default,
+              "role=precision" overrides one model role (classifier,
+              summarizer, ner, news)
+
+    Returns:
+        Mapping of role to precision, with the default under "*";
+        unknown precisions are skipped
+    """
+    precisions = {}
+    for item in (spec or "").split(","):
+        role, _, value = item.rpartition("=")
+        value = value.strip().lower()
+        if not value:
+            continue
+        if value not in PRECISIONS:
+            logger.warning(f"Ignoring unknown model precision '{item}' (use one of {', '.join(PRECISIONS)})")
+            continue
+        precisions[role.strip() or "*"] = value
+    return precisions
+
+
+def resolve_precision(role: str, precision: Optional[str] = None) -> str:
+    """
+    Precision a model should be loaded in
+
+    Args:
+        role: Which model this is ("classifier", "summarizer", "ner", "news")
+        precision: Explicit setting; None falls back to AI_MODEL_PRECISION
+
+    Returns:
+        One of PRECISIONS
+    """
+    if precision is not None:
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}'. Use one of: {', '.join(PRECISIONS)}")
+        return precision
+    configured = parse_precision_spec(os.getenv("AI_MODEL_PRECISION"))
+    return configured.get(role, configured.get("*", DEFAULT_PRECISION))
+
+
+def _model_bytes(model: Any) -> int:
+    """Bytes held by a model's parameters, buffers and packed int8 weights"""
+    if hasattr(model, "memory_bytes"):
+        return model.memory_bytes()
+    total = sum(p.numel() * p.element_size() for p in model.parameters())
+    total += sum(b.numel() * b.element_size() for b in model.buffers())
+    # Dynamically quantized Linear layers keep their weights outside parameters()
+    for module in model.modules():
+        if hasattr(module, "_packed_params") and callable(getattr(module, "weight", None)):
+            weight = module.weight()
+            total += weight.numel() * weight.element_size()
+            bias = module.bias()
+            if bias is not None:
+                total += bias.numel() * bias.element_size()
+    return total
+
+
+class ModelRegistry:
+    """
+    Reference-counted cache of (tokenizer, model) pairs.
+    Pipelines call acquire() instead of from_pretrained() and release()
+    when they are done; a model is dropped once nobody holds it.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str, str, str, str], Dict[str, Any]] = {}
+        self._key_locks: Dict[Tuple[str, str, str, str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(
+        model_name: str,
+        device: str,
+        precision: str,
+        backend: str,
+        warn: bool = True
+    ) -> Tuple[str, str]:
+        """Fall back to a precision/backend the device supports"""
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}'. Use one of: {', '.join(PRECISIONS)}")
+        fallbacks = []
+        if backend == "onnx" and device != "cpu":
+            fallbacks.append(f"the ONNX backend runs on CPU, using torch for '{model_name}' on {device}")
+            backend = "torch"
+        if precision == "int8" and device != "cpu":
+            fallbacks.append(f"int8 quantization needs CPU, loading '{model_name}' in fp32 on {device}")
+            precision = DEFAULT_PRECISION
+        if precision == "bf16" and backend == "onnx":
+            fallbacks.append(f"bf16 is not supported by the ONNX backend, loading '{model_name}' in fp32")
+            precision = DEFAULT_PRECISION
+        if warn:
+            for message in fallbacks:
+                logger.warning(f"Registry: {message}")
+        return precision, backend
+
+    @staticmethod
+    def _key(
+        model_name: str,
+        model_class: type,
+        device: str,
+        precision: str,
+        backend: str
+    ) -> Tuple[str, str, str, str, str]:
+        return (model_name, model_class.__name__, device, precision, backend)
+
+    @staticmethod
+    def _load(model_name: str, model_class: type, device: str, precision: str, backend: str) -> Tuple[Any, Any]:
+        """Load a tokenizer and model and convert the model to the requested precision"""
+        if backend == "onnx":
+            from ai_service.models.onnx_backend import load_onnx_model
+
+            return load_onnx_model(model_name, model_class, precision)
+
+        import torch
+        from transformers import AutoTokenizer
+
+        load_kwargs = {"use_safetensors": True}
+        if precision == "bf16":
+            load_kwargs["torch_dtype"] = torch.bfloat16
+
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = model_class.from_pretrained(model_name, **load_kwargs)
+        model.to(device)
+        model.eval()
+
+        if precision == "int8":
+            # Weights of every Linear layer are stored as int8 and activations
+            # are quantized on the fly; embeddings and layer norms stay fp32
+            model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return tokenizer, model
+
+    def _key_lock(self, key: Tuple[str, str, str, str, str]) -> threading.Lock:
+        """
+        Lock guarding one key's entry and reference count. One lock per key
+        so concurrent callers for the same model load it once, while
+        different models can still load in parallel; the registry lock only
+        guards the dicts themselves
+        """
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def acquire(
+        self,
+        model_name: str,
+        model_class: type,
+        device: str,
+        precision: str = DEFAULT_PRECISION,
+        backend: str = "torch"
+    ) -> Tuple[Any, Any]:
+        """
+        Get a shared tokenizer and model, loading them on first use
+
+        Args:
+            model_name: Hugging Face model name or local path
+            model_class: transformers Auto class for the model head
+                         (e.g. AutoModelForSequenceClassification)
+            device: Device to place the model on
+            precision: Weight format, one of PRECISIONS (see resolve_precision);
+                       int8 is only supported on CPU and falls back to fp32
+                       elsewhere
+            backend: "torch", or "onnx" for an ONNX Runtime session exported
+                     from the model (see onnx_backend; CPU only)
+
+        Returns:
+            Tuple of (tokenizer, model); the model's inference_precision and
+            inference_backend attributes hold how it was loaded
+        """
+        precision, backend = self._normalize(model_name, device, precision, backend)
+        key = self._key(model_name, model_class, device, precision, backend)
+
+        with self._key_lock(key):
+            entry = self._entries.get(key)
+            if entry is None:
+                logger.info(f"Registry: loading {model_class.__name__} '{model_name}' on {device} ({precision}, {backend})")
+                tokenizer, model = self._load(model_name, model_class, device, precision, backend)
+                model.inference_precision = precision
+                model.inference_backend = backend
+
+                entry = {"tokenizer": tokenizer, "model": model, "refs": 0}
+                with self._lock:
+                    self._entries[key] = entry
+            else:
+                logger.info(f"Registry: reusing '{model_name}' on {device} ({entry['refs']} existing users)")
+
+            entry["refs"] += 1
+            return entry["tokenizer"], entry["model"]
+
+    def release(
+        self,
+        model_name: str,
+        model_class: type,
+        device: str,
+        precision: str = DEFAULT_PRECISION,
+        backend: str = "torch"
+    ) -> None:
+        """
+        Drop one reference to a shared model, unloading it when unused
+
+        Args:
+            model_name: Model name passed to acquire()
+            model_class: Model class passed to acquire()
+            device: Device passed to acquire()
+            precision: Precision passed to acquire()
+            backend: Backend passed to acquire()
+        """
+        precision, backend = self._normalize(model_name, device, precision, backend, warn=False)
+        key = self._key(model_name, model_class, device, precision, backend)
+        # The same lock acquire() takes, so a concurrent acquire never
+        # references an entry this call is removing
+        with self._key_lock(key):
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry["refs"] -= 1
+            if entry["refs"] <= 0:
+                with self._lock:
+                    del self._entries[key]
+                logger.info(f"Registry: unloaded '{model_name}' from {device}")
+
+    def memory_report(self) -> List[Dict[str, Any]]:
+        """
+        Report the memory held by each loaded model
+
+        Returns:
+            One entry per model with its key, reference count and the bytes
+            held by its parameters and buffers
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+
+        report = []
+        for (model_name, class_name, device, precision, backend), entry in entries:
+            memory_bytes = _model_bytes(entry["model"])
+            report.append({
+                "model_name": model_name,
+                "model_class": class_name,
+                "device": device,
+                "precision": precision,
+                "backend": backend,
+                "refs": entry["refs"],
+                "memory_bytes": memory_bytes,
+                "memory_mb": round(memory_bytes / (1024 * 1024), 1)
+            })
+        return report
+
+
+# Process-wide registry shared by all pipelines
+model_registry = ModelRegistry()
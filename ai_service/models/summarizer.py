@@ -4,10 +4,13 @@ Generates concise summaries of reports
 """
 from typing import List, Dict, Optional
 import torch
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+from transformers import AutoModelForSeq2SeqLM
 from loguru import logger
 
 from ai_service.utils import TextPreprocessor, get_device
+from ai_service.models.generation_profiles import GENERATION_PROFILES, DEFAULT_PROFILE
+from ai_service.models.registry import model_registry, resolve_precision
+from ai_service.models.onnx_backend import resolve_backend
 
 
 class TextSummarizer:
@@ -15,10 +18,17 @@ class TextSummarizer:
     Abstractive text summarization using transformer models
     """
     
+    # Named decoding profiles, cheapest first (defined in generation_profiles)
+    GENERATION_PROFILES = GENERATION_PROFILES
+    DEFAULT_PROFILE = DEFAULT_PROFILE
+    
     def __init__(
         self,
         model_name: str = "facebook/bart-large-cnn",
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        max_batch_size: int = 8,
+        precision: Optional[str] = None,
+        backend: Optional[str] = None
     ):
         """
         Initialize the summarizer
@@ -27,17 +37,38 @@ class TextSummarizer:
             model_name: Hugging Face model name for summarization
                        Default: facebook/bart-large-cnn (~1.6GB, state-of-the-art for abstraction)
             device: Device to run model on ('cuda' or 'cpu')
+            max_batch_size: Maximum number of texts per batched generate call
+            precision: 'fp32', 'bf16' or 'int8' (defaults to the "summarizer"
+                       entry of AI_MODEL_PRECISION)
+            backend: 'torch' or 'onnx' (defaults to the "summarizer" entry of
+                     AI_INFERENCE_BACKEND); with 'onnx' the encoder runs in
+                     ONNX Runtime while beam search decoding stays in torch
         """
         self.device = device or get_device()
+        self.max_batch_size = max(1, max_batch_size)
+        self.model_name = model_name
+        self.precision = resolve_precision("summarizer", precision)
+        self.backend = resolve_backend("summarizer", backend)
+        self.encoder = None
         self.preprocessor = TextPreprocessor()
         
         logger.info(f"Loading summarization model: {model_name}")
         
         try:
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name, use_safetensors=True)
-            self.model.to(self.device)
-            self.model.eval()
+            self.tokenizer, self.model = model_registry.acquire(
+                model_name, AutoModelForSeq2SeqLM, self.device, self.precision
+            )
+            if self.backend == "onnx":
+                _, encoder = model_registry.acquire(
+                    model_name, AutoModelForSeq2SeqLM, self.device, self.precision, self.backend
+                )
+                if encoder.inference_backend == "onnx":
+                    self.encoder = encoder
+                else:
+                    # The registry runs ONNX models on CPU only; off CPU it
+                    # handed back the torch model already held above
+                    model_registry.release(model_name, AutoModelForSeq2SeqLM, self.device, self.precision, self.backend)
+                    self.backend = "torch"
             logger.info(f"Summarizer loaded successfully on {self.device}")
         except Exception as e:
             logger.error(f"Failed to load summarization model: {e}")
@@ -48,13 +79,30 @@ class TextSummarizer:
         text: str,
         max_length: int = 200,
         min_length: int = 50,
-        num_beams: int = 5,
-        length_penalty: float = 1.0,
-        early_stopping: bool = True
+        num_beams: Optional[int] = None,
+        length_penalty: Optional[float] = None,
+        early_stopping: Optional[bool] = None,
+        profile: str = DEFAULT_PROFILE
     ) -> Dict[str, any]:
         """
         Generate summary of input text with optimized parameters
+        
+        Args:
+            text: Input text to summarize
+            max_length: Maximum summary length in tokens
+            min_length: Minimum summary length in tokens
+            num_beams: Overrides the profile's beam count
+            length_penalty: Overrides the profile's length penalty
+            early_stopping: Overrides the profile's early stopping flag
+            profile: Name of a decoding profile in GENERATION_PROFILES
+            
+        Returns:
+            Summary result, including the profile that produced it
         """
+        generation_kwargs = self._generation_kwargs(
+            profile, max_length, min_length, num_beams, length_penalty, early_stopping
+        )
+        
         # Preprocess text
         cleaned_text = self.preprocessor.clean_text(text)
         
@@ -64,35 +112,24 @@ class TextSummarizer:
                 "summary": cleaned_text,
                 "original_length": len(cleaned_text),
                 "summary_length": len(cleaned_text),
-                "compression_ratio": 1.0
+                "compression_ratio": 1.0,
+                "profile": profile
             }
         
+        if generation_kwargs is None:
+            return self._build_result(cleaned_text, self.extractive_summary(cleaned_text), profile)
+        
         try:
-            # T5 models need "summarize: " prefix
-            input_text = cleaned_text
-            if "t5" in self.model.config.model_type.lower():
-                input_text = "summarize: " + cleaned_text
-            
             # Tokenize input
             inputs = self.tokenizer(
-                input_text,
+                self._model_input(cleaned_text),
                 max_length=1024,
                 truncation=True,
                 return_tensors="pt"
             ).to(self.device)
             
             # Generate summary
-            with torch.no_grad():
-                summary_ids = self.model.generate(
-                    inputs["input_ids"],
-                    max_length=max_length,
-                    min_length=min_length,
-                    num_beams=num_beams,
-                    length_penalty=length_penalty,
-                    early_stopping=early_stopping,
-                    no_repeat_ngram_size=3,
-                    repetition_penalty=1.2
-                )
+            summary_ids = self._generate(inputs["input_ids"], inputs["attention_mask"], generation_kwargs)
             
             # Decode summary
             summary = self.tokenizer.decode(
@@ -101,19 +138,7 @@ class TextSummarizer:
                 clean_up_tokenization_spaces=True
             ).strip()
             
-            # Calculate metrics
-            original_length = len(cleaned_text)
-            summary_length = len(summary)
-            compression_ratio = summary_length / original_length if original_length > 0 else 0.0
-            
-            logger.info(f"Generated summary: {summary_length} chars from {original_length} chars")
-            
-            return {
-                "summary": summary,
-                "original_length": original_length,
-                "summary_length": summary_length,
-                "compression_ratio": compression_ratio
-            }
+            return self._build_result(cleaned_text, summary, profile)
             
         except Exception as e:
             logger.error(f"Summarization failed: {e}")
@@ -122,37 +147,228 @@ class TextSummarizer:
                 "original_length": len(cleaned_text),
                 "summary_length": 0,
                 "compression_ratio": 0.0,
+                "profile": profile,
                 "error": str(e)
             }
     
+    def _generation_kwargs(
+        self,
+        profile: str,
+        max_length: int,
+        min_length: int,
+        num_beams: Optional[int] = None,
+        length_penalty: Optional[float] = None,
+        early_stopping: Optional[bool] = None
+    ) -> Optional[Dict[str, any]]:
+        """
+        Resolve a decoding profile into model.generate keyword arguments
+        
+        Args:
+            profile: Name of a decoding profile in GENERATION_PROFILES
+            max_length: Requested maximum summary length
+            min_length: Requested minimum summary length
+            num_beams: Optional explicit override
+            length_penalty: Optional explicit override
+            early_stopping: Optional explicit override
+            
+        Returns:
+            generate() kwargs, or None for the extractive profile
+        """
+        if profile not in self.GENERATION_PROFILES:
+            raise ValueError(
+                f"Unknown summarization profile '{profile}'. "
+                f"Available: {', '.join(self.GENERATION_PROFILES)}"
+            )
+        
+        settings = dict(self.GENERATION_PROFILES[profile])
+        if settings.pop("extractive", False):
+            return None
+        
+        # Tight profiles cap the output length to bound decoding time
+        max_length_cap = settings.pop("max_length_cap", None)
+        if max_length_cap:
+            max_length = min(max_length, max_length_cap)
+            min_length = min(min_length, max_length // 2)
+        
+        if num_beams is not None:
+            settings["num_beams"] = num_beams
+        if length_penalty is not None:
+            settings["length_penalty"] = length_penalty
+        if early_stopping is not None:
+            settings["early_stopping"] = early_stopping
+        
+        settings["max_length"] = max_length
+        settings["min_length"] = min_length
+        return settings
+    
+    def _generate(self, input_ids, attention_mask, generation_kwargs: Dict[str, any]):
+        """
+        Run generate(), encoding the input with the ONNX encoder when enabled
+        
+        Args:
+            input_ids: Padded token ids (torch tensor on self.device)
+            attention_mask: Matching attention mask
+            generation_kwargs: Resolved decoding settings
+            
+        Returns:
+            Generated token ids
+        """
+        if self.encoder is not None:
+            from transformers.modeling_outputs import BaseModelOutput
+            
+            hidden = self.encoder(
+                input_ids=input_ids.cpu().numpy(),
+                attention_mask=attention_mask.cpu().numpy()
+            ).last_hidden_state
+            generation_kwargs = {
+                **generation_kwargs,
+                "encoder_outputs": BaseModelOutput(
+                    last_hidden_state=torch.from_numpy(hidden).to(self.device, self.model.dtype)
+                )
+            }
+        
+        with torch.no_grad():
+            return self.model.generate(input_ids, attention_mask=attention_mask, **generation_kwargs)
+    
+    def _model_input(self, cleaned_text: str) -> str:
+        """T5 models need "summarize: " prefix"""
+        if "t5" in self.model.config.model_type.lower():
+            return "summarize: " + cleaned_text
+        return cleaned_text
+    
+    def _build_result(self, cleaned_text: str, summary: str, profile: str) -> Dict[str, any]:
+        """
+        Attach length metrics to a generated summary
+        
+        Args:
+            cleaned_text: Preprocessed source text
+            summary: Generated summary
+            profile: Decoding profile that produced the summary
+            
+        Returns:
+            Summary result dictionary
+        """
+        original_length = len(cleaned_text)
+        summary_length = len(summary)
+        compression_ratio = summary_length / original_length if original_length > 0 else 0.0
+        
+        logger.info(f"Generated summary: {summary_length} chars from {original_length} chars")
+        
+        return {
+            "summary": summary,
+            "original_length": original_length,
+            "summary_length": summary_length,
+            "compression_ratio": compression_ratio,
+            "profile": profile
+        }
+    
     def batch_summarize(
         self,
         texts: List[str],
         max_length: int = 150,
-        min_length: int = 30
+        min_length: int = 30,
+        num_beams: Optional[int] = None,
+        length_penalty: Optional[float] = None,
+        early_stopping: Optional[bool] = None,
+        profile: str = DEFAULT_PROFILE
     ) -> List[Dict[str, any]]:
         """
-        Summarize multiple texts
+        Summarize multiple texts.
+        Inputs are sorted by token length and split into buckets of at most
+        max_batch_size, so each bucket pads to a similar length and needs a
+        single generate call.
         
         Args:
             texts: List of texts to summarize
             max_length: Maximum length of summaries
             min_length: Minimum length of summaries
+            num_beams: Overrides the profile's beam count
+            length_penalty: Overrides the profile's length penalty
+            early_stopping: Overrides the profile's early stopping flag
+            profile: Name of a decoding profile in GENERATION_PROFILES
             
         Returns:
             List of summary results
         """
-        results = []
-        for text in texts:
-            result = self.summarize(
-                text,
-                max_length=max_length,
-                min_length=min_length
-            )
-            results.append(result)
+        generation_kwargs = self._generation_kwargs(
+            profile, max_length, min_length, num_beams, length_penalty, early_stopping
+        )
+        
+        results: List[Optional[Dict[str, any]]] = [None] * len(texts)
+        pending = []
+        
+        for i, text in enumerate(texts):
+            cleaned_text = self.preprocessor.clean_text(text)
+            if not cleaned_text or len(cleaned_text) < 50:
+                logger.warning("Text too short for summarization")
+                results[i] = {
+                    "summary": cleaned_text,
+                    "original_length": len(cleaned_text),
+                    "summary_length": len(cleaned_text),
+                    "compression_ratio": 1.0,
+                    "profile": profile
+                }
+                continue
+            if generation_kwargs is None:
+                results[i] = self._build_result(cleaned_text, self.extractive_summary(cleaned_text), profile)
+                continue
+            pending.append((i, cleaned_text))
+        
+        if not pending:
+            return results
+        
+        encoded = self.tokenizer(
+            [self._model_input(cleaned_text) for _, cleaned_text in pending],
+            max_length=1024,
+            truncation=True
+        )
+        order = sorted(range(len(pending)), key=lambda j: len(encoded["input_ids"][j]))
+        
+        for start in range(0, len(order), self.max_batch_size):
+            bucket = order[start:start + self.max_batch_size]
+            try:
+                inputs = self.tokenizer.pad(
+                    {
+                        "input_ids": [encoded["input_ids"][j] for j in bucket],
+                        "attention_mask": [encoded["attention_mask"][j] for j in bucket]
+                    },
+                    padding=True,
+                    return_tensors="pt"
+                ).to(self.device)
+                
+                summary_ids = self._generate(inputs["input_ids"], inputs["attention_mask"], generation_kwargs)
+                
+                summaries = self.tokenizer.batch_decode(
+                    summary_ids,
+                    skip_special_tokens=True,
+                    clean_up_tokenization_spaces=True
+                )
+                
+                for j, summary in zip(bucket, summaries):
+                    i, cleaned_text = pending[j]
+                    results[i] = self._build_result(cleaned_text, summary.strip(), profile)
+                    
+            except Exception as e:
+                logger.error(f"Batch summarization failed: {e}")
+                for j in bucket:
+                    i, cleaned_text = pending[j]
+                    results[i] = {
+                        "summary": self.extractive_summary(cleaned_text),
+                        "original_length": len(cleaned_text),
+                        "summary_length": 0,
+                        "compression_ratio": 0.0,
+                        "profile": profile,
+                        "error": str(e)
+                    }
         
         return results
     
+    def close(self) -> None:
+        """Release this summarizer's reference to the shared model"""
+        model_registry.release(self.model_name, AutoModelForSeq2SeqLM, self.device, self.precision)
+        if self.encoder is not None:
+            model_registry.release(self.model_name, AutoModelForSeq2SeqLM, self.device, self.precision, self.backend)
+    
     def extractive_summary(
         self,
         text: str,
@@ -3,10 +3,12 @@ Classification Pipeline
 End-to-end pipeline for text classification
 """
 from typing import List, Dict, Optional
+from concurrent.futures import Future
 from loguru import logger
 
-from ai_service.models.classifier import CategoryClassifier
-from ai_service.utils import TextPreprocessor, validate_text_input, ModelCache
+from ai_service.utils import TextPreprocessor, validate_text_input, WARMUP_TEXT
+from ai_service.utils.batching import MicroBatcher
+from ai_service.utils.result_cache import build_result_cache, content_key, model_revision
 
 
 class ClassificationPipeline:
@@ -30,13 +32,21 @@ class ClassificationPipeline:
             use_cache: Whether to cache predictions
             device: Device to run model on
         """
+        # Imported here so importing the pipeline module does not load torch
+        from ai_service.models.classifier import CategoryClassifier
+
         self.classifier = CategoryClassifier(
             model_name=model_name,
             categories=categories,
             device=device
         )
         self.preprocessor = TextPreprocessor()
-        self.cache = ModelCache() if use_cache else None
+        self.cache = build_result_cache(max_size=2000, max_bytes=8 * 1024 * 1024) if use_cache else None
+        self.model_revision = model_revision(model_name, self.classifier.model)
+        self.batcher = MicroBatcher(
+            f"classify:{model_name}",
+            lambda texts, params: self.batch_process(texts, *params)
+        )
         
         logger.info("Classification pipeline initialized")
     
@@ -71,7 +81,7 @@ class ClassificationPipeline:
             }
         
         # Check cache
-        cache_key = f"classify_{hash(text)}_{top_k}_{threshold}"
+        cache_key = self._cache_key(text, top_k, threshold)
         if use_cache and self.cache:
             cached_result = self.cache.get(cache_key)
             if cached_result:
@@ -80,38 +90,13 @@ class ClassificationPipeline:
         
         # Classify (using truncated text for better accuracy on news articles)
         try:
-            # First 1500 chars are usually the most relevant for classification
-            prompt_text = text[:1500] if len(text) > 1500 else text
-            
             result = self.classifier.classify(
-                text=prompt_text,
+                text=self._prompt_text(text),
                 top_k=top_k,
                 threshold=threshold
             )
 
-            # Keyword Boosting: If confidence is low, check for strong keywords
-            if result.get("confidence", 0) < 0.7:
-                lower_text = text.lower()
-                keyword_map = {
-                    "flood": "Flood", 
-                    "inundation": "Flood", 
-                    "landslide": "Landslide", 
-                    "fire": "Fire", 
-                    "earthquake": "Earthquake", 
-                    "quake": "Earthquake",
-                    "storm": "Storm",
-                    "avalanche": "Avalanche"
-                }
-                
-                for keyword, category in keyword_map.items():
-                    # If keyword appears multiple times or is in a short text
-                    if lower_text.count(keyword) >= 2 or (keyword in lower_text and len(text) < 300):
-                        logger.info(f"Boosting category '{category}' based on keyword '{keyword}'")
-                        result["category"] = category
-                        result["confidence"] = 0.85 # Artificial boost
-                        # Update top categories list too
-                        result["top_categories"].insert(0, {"category": category, "confidence": 0.85})
-                        break
+            result = self._apply_keyword_boost(text, result)
             
             # Add metadata
             result["success"] = True
@@ -132,30 +117,158 @@ class ClassificationPipeline:
                 "confidence": 0.0
             }
     
+    def _cache_key(self, text: str, top_k: int, threshold: float) -> str:
+        """Build the cache key for a classification request"""
+        return content_key(
+            "classify", self.model_revision, text,
+            categories=self.classifier.categories, top_k=top_k, threshold=threshold
+        )
+    
+    @staticmethod
+    def _prompt_text(text: str) -> str:
+        """First 1500 chars are usually the most relevant for classification"""
+        return text[:1500] if len(text) > 1500 else text
+    
+    def _apply_keyword_boost(self, text: str, result: Dict[str, any]) -> Dict[str, any]:
+        """
+        Keyword Boosting: If confidence is low, check for strong keywords
+        
+        Args:
+            text: Original input text
+            result: Classifier output
+            
+        Returns:
+            Possibly boosted classification result
+        """
+        if result.get("confidence", 0) < 0.7:
+            lower_text = text.lower()
+            keyword_map = {
+                "flood": "Flood", 
+                "inundation": "Flood", 
+                "landslide": "Landslide", 
+                "fire": "Fire", 
+                "earthquake": "Earthquake", 
+                "quake": "Earthquake",
+                "storm": "Storm",
+                "avalanche": "Avalanche"
+            }
+                
+            for keyword, category in keyword_map.items():
+                # If keyword appears multiple times or is in a short text
+                if lower_text.count(keyword) >= 2 or (keyword in lower_text and len(text) < 300):
+                    logger.info(f"Boosting category '{category}' based on keyword '{keyword}'")
+                    result["category"] = category
+                    result["confidence"] = 0.85 # Artificial boost
+                    # Update top categories list too
+                    result["top_categories"].insert(0, {"category": category, "confidence": 0.85})
+                    break
+            
+        return result
+    
+    def warm_up(self) -> None:
+        """Run one uncached inference so the first request skips lazy initialisation"""
+        self.classifier.batch_classify([WARMUP_TEXT])
+    
+    def submit(self, text: str, top_k: int = 3, threshold: float = 0.1) -> Future:
+        """
+        Queue a text for micro-batched classification.
+        Concurrent callers with the same parameters share one batched
+        forward pass; cached results are returned without queueing.
+        
+        Args:
+            text: Input text to classify
+            top_k: Number of top categories to return
+            threshold: Minimum confidence threshold
+            
+        Returns:
+            Future resolved with the same result process() would return
+        """
+        if self.cache:
+            cached_result = self.cache.get(self._cache_key(text, top_k, threshold))
+            if cached_result:
+                future: Future = Future()
+                future.set_result(cached_result)
+                return future
+        return self.batcher.submit(text, key=(top_k, threshold))
+    
+    def close(self) -> None:
+        """Stop the batcher and release the shared model held by this pipeline"""
+        self.batcher.close()
+        self.classifier.close()
+    
     def batch_process(
         self,
         texts: List[str],
         top_k: int = 3,
-        threshold: float = 0.1
+        threshold: float = 0.1,
+        use_cache: bool = True
     ) -> List[Dict[str, any]]:
         """
-        Process multiple texts through the pipeline
+        Process multiple texts through the pipeline.
+        Cached texts are answered directly; the rest are classified together
+        in a single batched call to the classifier.
         
         Args:
             texts: List of texts to classify
             top_k: Number of top categories to return
             threshold: Minimum confidence threshold
+            use_cache: Whether to use cached results
             
         Returns:
             List of classification results
         """
         logger.info(f"Processing batch of {len(texts)} texts")
         
-        results = []
+        results: List[Optional[Dict[str, any]]] = [None] * len(texts)
+        pending = []
+        
         for i, text in enumerate(texts):
-            logger.debug(f"Processing text {i+1}/{len(texts)}")
-            result = self.process(text, top_k=top_k, threshold=threshold)
-            results.append(result)
+            is_valid, error_msg = validate_text_input(text)
+            if not is_valid:
+                logger.warning(f"Invalid input: {error_msg}")
+                results[i] = {
+                    "success": False,
+                    "error": error_msg,
+                    "category": None,
+                    "confidence": 0.0
+                }
+                continue
+            
+            if use_cache and self.cache:
+                cached_result = self.cache.get(self._cache_key(text, top_k, threshold))
+                if cached_result:
+                    results[i] = cached_result
+                    continue
+            
+            pending.append(i)
+        
+        if pending:
+            logger.debug(f"Classifying {len(pending)} uncached texts ({len(texts) - len(pending)} cache hits)")
+            try:
+                batch_results = self.classifier.batch_classify(
+                    [self._prompt_text(texts[i]) for i in pending],
+                    top_k=top_k,
+                    threshold=threshold
+                )
+                
+                for i, result in zip(pending, batch_results):
+                    result = self._apply_keyword_boost(texts[i], result)
+                    result["success"] = True
+                    result["text_length"] = len(texts[i])
+                    
+                    if use_cache and self.cache:
+                        self.cache.set(self._cache_key(texts[i], top_k, threshold), result)
+                    results[i] = result
+                    
+            except Exception as e:
+                logger.error(f"Batch classification pipeline failed: {e}")
+                for i in pending:
+                    results[i] = {
+                        "success": False,
+                        "error": str(e),
+                        "category": None,
+                        "confidence": 0.0
+                    }
         
         # Add batch statistics
         successful = sum(1 for r in results if r.get("success", False))
@@ -2,28 +2,25 @@
 Clustering Pipeline
 Groups similar reports together using embeddings and clustering algorithms
 """
+import importlib.util
+import os
 from typing import List, Dict, Optional, Tuple
 import numpy as np
 from loguru import logger
-from sentence_transformers import SentenceTransformer
-from sklearn.cluster import KMeans
 
-# Optional imports
-try:
-    import hdbscan
-    HDBSCAN_AVAILABLE = True
-except ImportError:
-    HDBSCAN_AVAILABLE = False
+# sentence_transformers, sklearn, hdbscan and umap are imported where they are
+# used, so importing this module stays cheap; the optional ones are only
+# looked up here
+HDBSCAN_AVAILABLE = importlib.util.find_spec("hdbscan") is not None
+if not HDBSCAN_AVAILABLE:
     logger.warning("hdbscan not available. HDBSCAN clustering will not work.")
 
-try:
-    import umap
-    UMAP_AVAILABLE = True
-except ImportError:
-    UMAP_AVAILABLE = False
+UMAP_AVAILABLE = importlib.util.find_spec("umap") is not None
+if not UMAP_AVAILABLE:
     logger.warning("umap-learn not available. UMAP dimensionality reduction will not work.")
 
-from ai_service.utils import TextPreprocessor, cosine_similarity, get_device
+from ai_service.utils import TextPreprocessor, get_device, WARMUP_TEXT
+from ai_service.utils.embedding_store import EmbeddingStore
 
 
 class ClusteringPipeline:
@@ -34,7 +31,10 @@ class ClusteringPipeline:
     def __init__(
         self,
         embedding_model: str = "all-MiniLM-L6-v2",
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        cache_max_mb: float = 64,
+        cache_dir: Optional[str] = None,
+        cache_disk_max_mb: Optional[float] = None
     ):
         """
         Initialize clustering pipeline
@@ -42,13 +42,23 @@ class ClusteringPipeline:
         Args:
             embedding_model: Sentence transformer model for embeddings
             device: Device to run model on
+            cache_max_mb: Memory budget of the embedding cache in MB
+            cache_dir: Directory for the on-disk embedding cache shared by
+                       workers on this host (defaults to AI_EMBEDDING_CACHE_DIR;
+                       unset keeps the cache in memory only)
+            cache_disk_max_mb: Size cap of the on-disk embedding cache in MB
+                               (defaults to AI_EMBEDDING_CACHE_MAX_MB, then
+                               1024; 0 leaves it unbounded)
         """
         self.device = device or get_device()
+        self.embedding_model_name = embedding_model
         self.preprocessor = TextPreprocessor()
         
         logger.info(f"Loading embedding model: {embedding_model}")
         
         try:
+            from sentence_transformers import SentenceTransformer
+
             self.embedding_model = SentenceTransformer(embedding_model)
             if self.device == "cuda":
                 self.embedding_model = self.embedding_model.to(self.device)
@@ -57,7 +67,18 @@ class ClusteringPipeline:
             logger.error(f"Failed to load embedding model: {e}")
             raise
         
-        self.embeddings_cache = {}
+        if cache_disk_max_mb is None:
+            cache_disk_max_mb = float(os.getenv("AI_EMBEDDING_CACHE_MAX_MB", 1024))
+        self.embedding_store = EmbeddingStore(
+            embedding_model,
+            max_bytes=int(cache_max_mb * 1024 * 1024),
+            disk_path=cache_dir or os.getenv("AI_EMBEDDING_CACHE_DIR"),
+            disk_max_bytes=int(cache_disk_max_mb * 1024 * 1024)
+        )
+    
+    def warm_up(self) -> None:
+        """Run one uncached inference so the first request skips lazy initialisation"""
+        self.embedding_model.encode([WARMUP_TEXT], show_progress_bar=False)
     
     def generate_embeddings(
         self,
@@ -76,19 +97,9 @@ class ClusteringPipeline:
         Returns:
             Numpy array of embeddings
         """
-        embeddings = []
-        texts_to_encode = []
-        indices_to_encode = []
-        
-        for i, text in enumerate(texts):
-            cache_key = hash(text)
-            
-            if use_cache and cache_key in self.embeddings_cache:
-                embeddings.append(self.embeddings_cache[cache_key])
-            else:
-                texts_to_encode.append(text)
-                indices_to_encode.append(i)
-                embeddings.append(None)  # Placeholder
+        embeddings = self.embedding_store.get_many(texts) if use_cache else [None] * len(texts)
+        indices_to_encode = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        texts_to_encode = [texts[i] for i in indices_to_encode]
         
         # Encode uncached texts
         if texts_to_encode:
@@ -102,9 +113,8 @@ class ClusteringPipeline:
             )
             
             # Cache and insert new embeddings
-            for idx, text, embedding in zip(indices_to_encode, texts_to_encode, new_embeddings):
-                cache_key = hash(text)
-                self.embeddings_cache[cache_key] = embedding
+            self.embedding_store.put_many(texts_to_encode, new_embeddings)
+            for idx, embedding in zip(indices_to_encode, new_embeddings):
                 embeddings[idx] = embedding
         
         return np.array(embeddings)
@@ -135,6 +145,8 @@ class ClusteringPipeline:
                 "hdbscan is not installed. Install it with: pip install hdbscan"
             )
         
+        import hdbscan
+
         logger.info(f"Clustering {len(texts)} texts with HDBSCAN")
         
         # Generate embeddings
@@ -146,6 +158,8 @@ class ClusteringPipeline:
                 logger.warning("UMAP not available, skipping dimensionality reduction")
                 embeddings_reduced = embeddings
             else:
+                import umap
+
                 logger.info(f"Applying UMAP reduction to {n_components} dimensions")
                 reducer = umap.UMAP(
                     n_components=min(n_components, len(texts) - 1),
@@ -197,6 +211,8 @@ class ClusteringPipeline:
         embeddings = self.generate_embeddings(texts)
         
         # Cluster with K-Means
+        from sklearn.cluster import KMeans
+
         kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
         cluster_labels = kmeans.fit_predict(embeddings)
         
@@ -274,6 +290,37 @@ class ClusteringPipeline:
         
         return clusters
     
+    @staticmethod
+    def _normalize(embeddings: np.ndarray) -> np.ndarray:
+        """L2-normalise rows so a dot product equals cosine similarity"""
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+        return embeddings / np.maximum(norms, 1e-12)
+    
+    @staticmethod
+    def _top_k(
+        scores: np.ndarray,
+        corpus_texts: List[str],
+        top_k: int,
+        threshold: float
+    ) -> List[Dict[str, any]]:
+        """Select the top_k scores above threshold with argpartition"""
+        k = min(top_k, scores.shape[0])
+        if k == 0:
+            return []
+        best = np.argpartition(scores, -k)[-k:]
+        best = best[np.argsort(scores[best])[::-1]]
+        
+        return [
+            {
+                "text": corpus_texts[i],
+                "index": int(i),
+                "similarity": float(scores[i])
+            }
+            for i in best
+            if scores[i] >= threshold
+        ]
+    
     def find_similar(
         self,
         query_text: str,
@@ -293,22 +340,42 @@ class ClusteringPipeline:
         Returns:
             List of similar texts with scores
         """
+        return self.find_similar_batch([query_text], corpus_texts, top_k=top_k, threshold=threshold)[0]
+    
+    def find_similar_batch(
+        self,
+        query_texts: List[str],
+        corpus_texts: List[str],
+        top_k: int = 5,
+        threshold: float = 0.5
+    ) -> List[List[Dict[str, any]]]:
+        """
+        Find similar texts for several queries at once.
+        Embeddings are normalised once and every query is scored against the
+        corpus in a single matrix product.
+        
+        Args:
+            query_texts: Query texts
+            corpus_texts: List of texts to search
+            top_k: Number of similar texts to return per query
+            threshold: Minimum similarity threshold
+            
+        Returns:
+            One list of similar texts with scores per query
+        """
+        if not query_texts:
+            return []
+        if not corpus_texts:
+            return [[] for _ in query_texts]
+        
         # Generate embeddings
-        query_embedding = self.generate_embeddings([query_text])[0]
-        corpus_embeddings = self.generate_embeddings(corpus_texts)
-        
-        # Calculate similarities
-        similarities = []
-        for i, corpus_embedding in enumerate(corpus_embeddings):
-            similarity = cosine_similarity(query_embedding, corpus_embedding)
-            if similarity >= threshold:
-                similarities.append({
-                    "text": corpus_texts[i],
-                    "index": i,
-                    "similarity": float(similarity)
-                })
-        
-        # Sort by similarity
-        similarities.sort(key=lambda x: x["similarity"], reverse=True)
-        
-        return similarities[:top_k]
+        query_embeddings = self._normalize(self.generate_embeddings(query_texts))
+        corpus_embeddings = self._normalize(self.generate_embeddings(corpus_texts))
+        
+        # (n_queries x dim) @ (dim x n_corpus)
+        similarities = query_embeddings @ corpus_embeddings.T
+        
+        return [
+            self._top_k(row, corpus_texts, top_k, threshold)
+            for row in similarities
+        ]
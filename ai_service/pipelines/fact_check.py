@@ -6,12 +6,12 @@ from typing import Dict, List, Optional
 import time
 from loguru import logger
 from duckduckgo_search import DDGS
-import requests
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 
 from ai_service.utils.source_checker import SourceChecker
 from ai_service.utils import TextPreprocessor
+from ai_service.utils.http_client import HttpClient, http_client
 
 # Reasonable request timeout for external fetches
 REQUEST_TIMEOUT = 5.0
@@ -22,7 +22,13 @@ class FactCheckPipeline:
     Pipeline that searches the web to verify news
     """
 
-    def __init__(self):
+    def __init__(self, http: Optional[HttpClient] = None):
+        """
+        Args:
+            http: Shared HTTP client for page fetches (defaults to the
+                  process-wide one)
+        """
+        self.http = http or http_client
         self.source_checker = SourceChecker()
         self.preprocessor = TextPreprocessor()
         logger.info("FactCheck pipeline initialized")
@@ -44,13 +50,13 @@ class FactCheckPipeline:
 
         try:
             # prefer HEAD to check reachability quickly
-            head = requests.head(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+            head = self.http.head(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
             if head.status_code >= 400:
                 # fallback to GET if HEAD blocked
-                resp = requests.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+                resp = self.http.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
             else:
                 # HEAD okay; try GET but allow quick failure
-                resp = requests.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+                resp = self.http.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
 
             if resp.status_code >= 400:
                 return current_title or "", False
@@ -1,9 +1,8 @@
 from typing import List, Dict, Optional
 from loguru import logger
 
-from ai_service.models.ner import EntityExtractor
-from ai_service.models.classifier import CategoryClassifier
-from ai_service.utils import TextPreprocessor, ModelCache
+from ai_service.utils import TextPreprocessor, WARMUP_TEXT
+from ai_service.utils.result_cache import build_result_cache, content_key, model_revision
 
 class NERPipeline:
     """
@@ -23,25 +22,91 @@ class NERPipeline:
         use_cache: bool = True,
         device: Optional[str] = None
     ):
+        # Imported here so importing the pipeline module does not load torch
+        from ai_service.models.ner import EntityExtractor
+        from ai_service.models.classifier import CategoryClassifier
+
         self.extractor = EntityExtractor(model_name=ner_model, device=device)
         # We reuse the classifier's zero-shot capability to pinpoint disaster type more accurately
+        # (the NLI weights are shared through the model registry with VerificationPipeline)
         self.type_classifier = CategoryClassifier(device=device)
-        self.cache = ModelCache() if use_cache else None
+        self.cache = build_result_cache(max_size=2000, max_bytes=8 * 1024 * 1024) if use_cache else None
+        self.model_revisions = [
+            model_revision(ner_model, self.extractor.model),
+            model_revision(self.type_classifier.model_name, self.type_classifier.model)
+        ]
         
         logger.info("NER pipeline initialized")
 
+    def close(self) -> None:
+        """Release the shared models held by this pipeline"""
+        self.extractor.close()
+        self.type_classifier.close()
+
+    def warm_up(self) -> None:
+        """Run one uncached inference so the first request skips lazy initialisation"""
+        self.extractor.extract_entities(WARMUP_TEXT)
+        self.type_classifier.batch_classify([WARMUP_TEXT], categories=self.DISASTER_TYPES)
+
     def process(self, text: str) -> Dict[str, any]:
         """
         Extract locations and classify disaster type from text
         """
-        cache_key = f"ner_{hash(text)}"
-        if self.cache and (cached := self.cache.get(cache_key)):
-            return cached
+        return self.batch_process([text])[0]
+
+    def batch_process(self, texts: List[str]) -> List[Dict[str, any]]:
+        """
+        Extract locations and classify disaster type for several texts.
+        Cached texts are answered directly; for the rest the NER model and
+        the zero-shot type classifier each run once over all of them.
+        
+        Args:
+            texts: Texts to analyse
+            
+        Returns:
+            One result per text
+        """
+        results: List[Optional[Dict[str, any]]] = [None] * len(texts)
+        pending = []
+        for i, text in enumerate(texts):
+            if self.cache and (cached := self.cache.get(content_key("ner", self.model_revisions, text))):
+                results[i] = cached
+            else:
+                pending.append(i)
+        if not pending:
+            return results
+
+        # 1. Extract entities once per text (locations and metadata both use them)
+        entities = self.extractor.batch_extract_entities([texts[i] for i in pending])
+
+        # 2. Extract specific Disaster Type using Zero-Shot
+        # Using truncated text for better accuracy on news links
+        type_results = self.type_classifier.batch_classify(
+            [texts[i][:1500] for i in pending],
+            categories=self.DISASTER_TYPES,
+            hypothesis_template="This report is about a {}."
+        )
 
-        # 1. Extract Locations (Model based)
-        locations = self.extractor.get_locations(text)
+        for i, text_entities, type_result in zip(pending, entities, type_results):
+            text = texts[i]
+            locations = self.extractor.get_locations(text, entities=text_entities)
+            result = {
+                "locations": self._merge_known_locations(text, locations),
+                "disaster_type": type_result["category"],
+                "type_confidence": type_result["confidence"],
+                "all_entities": text_entities[:10] # Subset for metadata
+            }
+            if self.cache:
+                self.cache.set(content_key("ner", self.model_revisions, text), result)
+            results[i] = result
+            
+        return results
 
-        # 2. Dictionary-based Augmentation for Nepal Locations (Fix for inaccurate NER)
+    @staticmethod
+    def _merge_known_locations(text: str, locations: List[str]) -> List[str]:
+        """
+        Dictionary-based Augmentation for Nepal Locations (Fix for inaccurate NER)
+        """
         nepal_locations = {
             "Kathmandu", "Lalitpur", "Bhaktapur", "Pokhara", "Chitwan", "Biratnagar", "Dharan", 
             "Birgunj", "Butwal", "Hetauda", "Janakpur", "Nepalgunj", "Dhangadhi", "Taplejung", 
@@ -78,27 +143,4 @@ class NERPipeline:
                 final_locs.append(loc)
                 seen.add(loc)
         
-        locations = final_locs[:5] # Keep top 5
-
-        
-        # 2. Extract specific Disaster Type using Zero-Shot
-        # Using truncated text for better accuracy on news links
-        prompt_text = text[:1500] if len(text) > 1500 else text
-        
-        type_result = self.type_classifier.classify(
-            text=prompt_text,
-            categories=self.DISASTER_TYPES,
-            hypothesis_template="This report is about a {}."
-        )
-        
-        result = {
-            "locations": locations,
-            "disaster_type": type_result["category"],
-            "type_confidence": type_result["confidence"],
-            "all_entities": self.extractor.extract_entities(text)[:10] # Subset for metadata
-        }
-        
-        if self.cache:
-            self.cache.set(cache_key, result)
-            
-        return result
+        return final_locs[:5] # Keep top 5
@@ -0,0 +1,67 @@
+"""
+Stage Executor
+Runs the stages of a processing job as a small dependency graph,
+overlapping independent stages on a shared thread pool
+"""
+from typing import Any, Callable, Dict, Sequence, Tuple
+from concurrent.futures import Executor, FIRST_COMPLETED, wait
+import time
+from loguru import logger
+
+# A stage is a callable taking the results of its dependencies, plus those dependency names
+Stage = Tuple[Callable[[Dict[str, Any]], Any], Sequence[str]]
+
+
+def run_stages(
+    executor: Executor,
+    stages: Dict[str, Stage]
+) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """
+    Run stages as soon as their dependencies have finished
+
+    Args:
+        executor: Thread pool the stages are submitted to
+        stages: Mapping of stage name to (callable, dependency names)
+
+    Returns:
+        Tuple of (stage results, per-stage wall time in milliseconds)
+
+    Raises:
+        ValueError: If the dependencies cannot be satisfied
+        Exception: The first exception raised by a stage; stages that
+                   have not started yet are cancelled
+    """
+    results: Dict[str, Any] = {}
+    timings: Dict[str, float] = {}
+    remaining = dict(stages)
+    running = {}
+
+    def timed(name: str, fn: Callable[[Dict[str, Any]], Any], inputs: Dict[str, Any]) -> Any:
+        start = time.perf_counter()
+        try:
+            return fn(inputs)
+        finally:
+            timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    while remaining or running:
+        ready = [name for name, (_, deps) in remaining.items() if all(dep in results for dep in deps)]
+        for name in ready:
+            fn, deps = remaining.pop(name)
+            future = executor.submit(timed, name, fn, {dep: results[dep] for dep in deps})
+            running[future] = name
+
+        if not running:
+            raise ValueError(f"Unresolvable stage dependencies: {', '.join(remaining)}")
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            name = running.pop(future)
+            try:
+                results[name] = future.result()
+            except Exception:
+                logger.error(f"Stage '{name}' failed, cancelling {len(running)} pending stages")
+                for pending in running:
+                    pending.cancel()
+                raise
+
+    return results, timings
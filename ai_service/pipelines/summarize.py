@@ -3,10 +3,13 @@ Summarization Pipeline
 End-to-end pipeline for text summarization
 """
 from typing import List, Dict, Optional
+from concurrent.futures import Future
 from loguru import logger
 
-from ai_service.models.summarizer import TextSummarizer
-from ai_service.utils import TextPreprocessor, validate_text_input, ModelCache
+from ai_service.models.generation_profiles import DEFAULT_PROFILE
+from ai_service.utils import TextPreprocessor, validate_text_input, WARMUP_TEXT
+from ai_service.utils.batching import MicroBatcher
+from ai_service.utils.result_cache import build_result_cache, content_key, model_revision
 
 
 class SummarizationPipeline:
@@ -28,12 +31,22 @@ class SummarizationPipeline:
             use_cache: Whether to cache summaries
             device: Device to run model on
         """
+        # Imported here so importing the pipeline module does not load torch
+        from ai_service.models.summarizer import TextSummarizer
+
         self.summarizer = TextSummarizer(
             model_name=model_name,
             device=device
         )
         self.preprocessor = TextPreprocessor()
-        self.cache = ModelCache() if use_cache else None
+        # Summaries are the largest results, so bound this cache by payload size
+        self.cache = build_result_cache(max_size=None, max_bytes=32 * 1024 * 1024) if use_cache else None
+        self.model_revision = model_revision(model_name, self.summarizer.model)
+        self.batcher = MicroBatcher(
+            f"summarize:{model_name}",
+            lambda texts, params: self.batch_process(texts, *params),
+            max_batch_size=self.summarizer.max_batch_size
+        )
         
         logger.info("Summarization pipeline initialized")
     
@@ -42,7 +55,8 @@ class SummarizationPipeline:
         text: str,
         max_length: int = 150,
         min_length: int = 30,
-        use_cache: bool = True
+        use_cache: bool = True,
+        profile: str = DEFAULT_PROFILE
     ) -> Dict[str, any]:
         """
         Process a single text through the summarization pipeline
@@ -52,6 +66,7 @@ class SummarizationPipeline:
             max_length: Maximum summary length
             min_length: Minimum summary length
             use_cache: Whether to use cached results
+            profile: Decoding profile name (see TextSummarizer.GENERATION_PROFILES)
             
         Returns:
             Summarization results with metadata
@@ -67,7 +82,7 @@ class SummarizationPipeline:
             }
         
         # Check cache
-        cache_key = f"summarize_{hash(text)}_{max_length}_{min_length}"
+        cache_key = self._cache_key(text, max_length, min_length, profile)
         if use_cache and self.cache:
             cached_result = self.cache.get(cache_key)
             if cached_result:
@@ -79,7 +94,8 @@ class SummarizationPipeline:
             result = self.summarizer.summarize(
                 text=text,
                 max_length=max_length,
-                min_length=min_length
+                min_length=min_length,
+                profile=profile
             )
             
             # Add metadata
@@ -99,34 +115,123 @@ class SummarizationPipeline:
                 "summary": ""
             }
     
+    def _cache_key(self, text: str, max_length: int, min_length: int, profile: str) -> str:
+        """Build the cache key for a summarization request"""
+        return content_key(
+            "summarize", self.model_revision, text,
+            max_length=max_length, min_length=min_length, profile=profile
+        )
+    
+    def warm_up(self) -> None:
+        """Run one uncached inference so the first request skips lazy initialisation"""
+        self.summarizer.batch_summarize([WARMUP_TEXT], max_length=30, min_length=5)
+    
+    def submit(
+        self,
+        text: str,
+        max_length: int = 150,
+        min_length: int = 30,
+        profile: str = DEFAULT_PROFILE
+    ) -> Future:
+        """
+        Queue a text for micro-batched summarization.
+        Concurrent callers with the same length limits and profile share one
+        batched generate() call; cached results are returned without queueing.
+        
+        Args:
+            text: Text to summarize
+            max_length: Maximum summary length
+            min_length: Minimum summary length
+            profile: Decoding profile name (see TextSummarizer.GENERATION_PROFILES)
+            
+        Returns:
+            Future resolved with the summarization result
+        """
+        if self.cache:
+            cached_result = self.cache.get(self._cache_key(text, max_length, min_length, profile))
+            if cached_result:
+                future: Future = Future()
+                future.set_result(cached_result)
+                return future
+        return self.batcher.submit(text, key=(max_length, min_length, True, profile))
+    
+    def close(self) -> None:
+        """Stop the batcher and release the shared model held by this pipeline"""
+        self.batcher.close()
+        self.summarizer.close()
+    
     def batch_process(
         self,
         texts: List[str],
         max_length: int = 150,
-        min_length: int = 30
+        min_length: int = 30,
+        use_cache: bool = True,
+        profile: str = DEFAULT_PROFILE
     ) -> List[Dict[str, any]]:
         """
-        Process multiple texts through the pipeline
+        Process multiple texts through the pipeline.
+        Cached texts are answered directly; the rest are summarized with
+        length-bucketed batched generation.
         
         Args:
             texts: List of texts to summarize
             max_length: Maximum summary length
             min_length: Minimum summary length
+            use_cache: Whether to use cached results
+            profile: Decoding profile name (see TextSummarizer.GENERATION_PROFILES)
             
         Returns:
             List of summarization results
         """
         logger.info(f"Processing batch of {len(texts)} texts")
         
-        results = []
+        results: List[Optional[Dict[str, any]]] = [None] * len(texts)
+        pending = []
+        
         for i, text in enumerate(texts):
-            logger.debug(f"Processing text {i+1}/{len(texts)}")
-            result = self.process(
-                text,
-                max_length=max_length,
-                min_length=min_length
-            )
-            results.append(result)
+            is_valid, error_msg = validate_text_input(text, min_length=50)
+            if not is_valid:
+                logger.warning(f"Invalid input: {error_msg}")
+                results[i] = {
+                    "success": False,
+                    "error": error_msg,
+                    "summary": ""
+                }
+                continue
+            
+            if use_cache and self.cache:
+                cached_result = self.cache.get(self._cache_key(text, max_length, min_length, profile))
+                if cached_result:
+                    results[i] = cached_result
+                    continue
+            
+            pending.append(i)
+        
+        if pending:
+            logger.debug(f"Summarizing {len(pending)} uncached texts ({len(texts) - len(pending)} cache hits)")
+            try:
+                batch_results = self.summarizer.batch_summarize(
+                    [texts[i] for i in pending],
+                    max_length=max_length,
+                    min_length=min_length,
+                    profile=profile
+                )
+                
+                for i, result in zip(pending, batch_results):
+                    result["success"] = True
+                    
+                    if use_cache and self.cache:
+                        self.cache.set(self._cache_key(texts[i], max_length, min_length, profile), result)
+                    results[i] = result
+                    
+            except Exception as e:
+                logger.error(f"Batch summarization pipeline failed: {e}")
+                for i in pending:
+                    results[i] = {
+                        "success": False,
+                        "error": str(e),
+                        "summary": ""
+                    }
         
         # Add batch statistics
         successful = sum(1 for r in results if r.get("success", False))
@@ -3,14 +3,64 @@ Verification Pipeline
 Checks credibility of news and validity of civic reports
 """
 from typing import List, Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
 from loguru import logger
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-import torch
+import numpy as np
 
-from ai_service.models.classifier import CategoryClassifier
-from ai_service.utils import TextPreprocessor, validate_text_input, ModelCache, get_device
+from ai_service.models.registry import model_registry, resolve_precision
+from ai_service.models.onnx_backend import resolve_backend, softmax
+from ai_service.utils import TextPreprocessor, validate_text_input, get_device, WARMUP_TEXT
+from ai_service.utils.batching import MicroBatcher
+from ai_service.utils.result_cache import build_result_cache, content_key, model_revision
 from ai_service.utils.source_checker import SourceChecker
 
+
+def news_model_probs(tokenizer, model, texts: List[str], device: str, batch_size: int = 16) -> np.ndarray:
+    """
+    Class probabilities from a fake/real news classifier
+
+    Args:
+        tokenizer: The model's tokenizer
+        model: Sequence classification model (labels: 0 Fake, 1 Real), torch
+               or ONNX Runtime as returned by the model registry
+        texts: Texts to score
+        device: Device the model is on
+        batch_size: Texts per padded forward pass
+
+    Returns:
+        Array of shape (len(texts), num_labels)
+    """
+    probs = []
+    if getattr(model, "inference_backend", "torch") == "onnx":
+        for start in range(0, len(texts), batch_size):
+            inputs = tokenizer(
+                texts[start:start + batch_size],
+                return_tensors="np",
+                truncation=True,
+                padding=True,
+                max_length=512
+            )
+            probs.append(softmax(model(**inputs).logits))
+        return np.concatenate(probs)
+
+    import torch
+
+    for start in range(0, len(texts), batch_size):
+        inputs = tokenizer(
+            texts[start:start + batch_size],
+            return_tensors="pt",
+            truncation=True,
+            padding=True,
+            max_length=512
+        ).to(device)
+
+        with torch.no_grad():
+            outputs = model(**inputs)
+            probs.append(torch.softmax(outputs.logits.float(), dim=1).cpu().numpy())
+    return np.concatenate(probs)
+
+
 class VerificationPipeline:
     """
     Pipeline for verifying content using dedicated models
@@ -29,18 +79,38 @@ class VerificationPipeline:
         news_model_name: str = "hamzab/roberta-fake-news-classification",
         report_model_name: str = "facebook/bart-large-mnli",
         use_cache: bool = True,
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        news_precision: Optional[str] = None,
+        news_backend: Optional[str] = None
     ):
         """
         Initialize verification pipeline
+
+        Args:
+            news_model_name: Fake/real news classifier
+            report_model_name: Zero-shot NLI model for report validity
+            use_cache: Whether to cache verdicts
+            device: Device to run models on
+            news_precision: 'fp32', 'bf16' or 'int8' for the news model
+                            (defaults to the "news" entry of AI_MODEL_PRECISION;
+                            the report classifier uses the "classifier" entry)
+            news_backend: 'torch' or 'onnx' for the news model (defaults to
+                          the "news" entry of AI_INFERENCE_BACKEND)
         """
+        # Imported here so importing the pipeline module does not load torch
+        from transformers import AutoModelForSequenceClassification
+        from ai_service.models.classifier import CategoryClassifier
+
         self.device = device or get_device()
         self.use_cache = use_cache
         self.preprocessor = TextPreprocessor()
-        self.cache = ModelCache() if use_cache else None
+        # Source reputation can change, so verdicts expire after an hour
+        self.cache = build_result_cache(max_size=2000, max_bytes=8 * 1024 * 1024, ttl_seconds=3600) if use_cache else None
         self.source_checker = SourceChecker()
 
         # 1. Initialize Report Classifier (Zero-Shot)
+        # The NLI weights come from the shared registry, so NERPipeline's type
+        # classifier with the same model reuses this instance
         logger.info(f"Loading Report Classifier: {report_model_name}")
         self.report_classifier = CategoryClassifier(
             model_name=report_model_name,
@@ -50,11 +120,14 @@ class VerificationPipeline:
 
         # 2. Initialize News Fake/Real Classifier (Dedicated)
         logger.info(f"Loading News Classifier: {news_model_name}")
+        self.news_model_name = news_model_name
+        self.news_model_class = AutoModelForSequenceClassification
+        self.news_precision = resolve_precision("news", news_precision)
+        self.news_backend = resolve_backend("news", news_backend)
         try:
-            self.news_tokenizer = AutoTokenizer.from_pretrained(news_model_name)
-            self.news_model = AutoModelForSequenceClassification.from_pretrained(news_model_name, use_safetensors=True)
-            self.news_model.to(self.device)
-            self.news_model.eval()
+            self.news_tokenizer, self.news_model = model_registry.acquire(
+                news_model_name, AutoModelForSequenceClassification, self.device, self.news_precision, self.news_backend
+            )
 
             # For Hate-speech-CNERG/roberta-base-fake-news-detector
             # Labels mapping: 0 -> Fake, 1 -> Real
@@ -68,8 +141,29 @@ class VerificationPipeline:
             logger.error(f"Failed to load news classifier: {e}")
             raise
 
+        self.report_revision = model_revision(report_model_name, self.report_classifier.model)
+        self.news_revision = model_revision(news_model_name, self.news_model)
+        self._fact_checker_lock = threading.Lock()
+        self.news_batcher = MicroBatcher(
+            f"verify_news:{news_model_name}",
+            lambda items, _: self.verify_news_batch([text for text, _ in items], [url for _, url in items])
+        )
+
         logger.info("Verification pipeline initialized")
 
+    def close(self) -> None:
+        """Stop the batcher and release the shared models held by this pipeline"""
+        self.news_batcher.close()
+        self.report_classifier.close()
+        model_registry.release(
+            self.news_model_name, self.news_model_class, self.device, self.news_precision, self.news_backend
+        )
+
+
+    def warm_up(self) -> None:
+        """Run one uncached inference so the first request skips lazy initialisation"""
+        self._news_model_probs([WARMUP_TEXT])
+        self.report_classifier.batch_classify([WARMUP_TEXT])
 
     def verify_news(
         self,
@@ -79,202 +173,279 @@ class VerificationPipeline:
         """
         Verify news credibility using dedicated model + source check (auto-search if no URL provided)
         """
-        is_valid, error_msg = validate_text_input(text)
-        if not is_valid:
-            return {"success": False, "error": error_msg}
+        return self.verify_news_batch([text], [source_url])[0]
+
+    def submit_news(self, text: str, source_url: Optional[str] = None) -> Future:
+        """
+        Queue a news text for micro-batched verification.
+        Concurrent callers share the model forward passes; cached results
+        are returned without queueing.
 
-        cache_key = f"news_{hash(text)}_{hash(source_url)}"
+        Args:
+            text: News text to verify
+            source_url: Optional source URL of the article
+
+        Returns:
+            Future resolved with the same result verify_news() would return
+        """
         if self.use_cache and self.cache:
-            if cached := self.cache.get(cache_key): return cached
+            cached = self.cache.get(content_key("news", self.news_revision, text, source_url=source_url))
+            if cached:
+                future: Future = Future()
+                future.set_result(cached)
+                return future
+        return self.news_batcher.submit((text, source_url))
+
+    def verify_news_batch(
+        self,
+        texts: List[str],
+        source_urls: Optional[List[Optional[str]]] = None
+    ) -> List[Dict[str, any]]:
+        """
+        Verify several news texts.
+        The fake-news model and the zero-shot cross-check each run once over
+        all uncached texts; source and fact checks then run per text.
+
+        Args:
+            texts: News texts to verify
+            source_urls: Optional source URL per text
+
+        Returns:
+            One verification result per text
+        """
+        source_urls = source_urls or [None] * len(texts)
+        results: List[Optional[Dict[str, any]]] = [None] * len(texts)
+        pending = []
+
+        for i, (text, source_url) in enumerate(zip(texts, source_urls)):
+            is_valid, error_msg = validate_text_input(text)
+            if not is_valid:
+                results[i] = {"success": False, "error": error_msg}
+                continue
+            if self.use_cache and self.cache:
+                cached = self.cache.get(content_key("news", self.news_revision, text, source_url=source_url))
+                if cached:
+                    results[i] = cached
+                    continue
+            pending.append(i)
+
+        if not pending:
+            return results
 
         try:
             # 1. Content Verification (Model)
-            inputs = self.news_tokenizer(
-                text,
-                return_tensors="pt",
-                truncation=True,
-                max_length=512
-            ).to(self.device)
-
-            with torch.no_grad():
-                outputs = self.news_model(**inputs)
-                probs = torch.softmax(outputs.logits, dim=1)
-                
-                # Model confidence for each class
-                # Labels: 0 (Fake), 1 (Real)
-                prob_fake = probs[0][0].item()
-                prob_real = probs[0][1].item()
-                
-                verdict = "Real" if prob_real > prob_fake else "Fake"
-                content_confidence = max(prob_fake, prob_real)
-
-            # 2. Source & Fact Check Analysis
-            source_score = 0.5 # Neutral
-            fact_check_score = 0.5 # Neutral
-            found_sources = []
-            primary_sources = []
-            explanation = ""
-            verification_method = "Hybrid Analysis"
-
-            if source_url:
-                source_result = self.source_checker.check_source(source_url)
-                s_status = source_result["status"]
-                if s_status == "Trusted":
-                    source_score = 1.0
-                    explanation = f"Verified by trusted source: {source_url}. "
-                elif s_status == "Untrusted":
-                    source_score = 0.0
-                    explanation = f"Source {source_url} is flagged as untrusted. "
-                else:
-                    source_score = 0.5
-                    explanation = f"Source {source_url} is unknown. "
-                
-                primary_sources = [{
-                    "url": source_url,
-                    "status": s_status,
-                    "score": source_score
-                }]
-            else:
-                # Auto-Search (Fact Check)
-                try:
-                    if not hasattr(self, 'fact_checker'):
-                        from ai_service.pipelines.fact_check import FactCheckPipeline
-                        self.fact_checker = FactCheckPipeline()
-
-                    fc_result = self.fact_checker.verify_claim(text)
-                    found_sources = fc_result.get("sources", [])
-                    primary_sources = fc_result.get("primary_sources", [])
-                    explanation = fc_result.get("explanation", "")
-
-                    if fc_result.get("status") == "Verified":
-                        fact_check_score = 1.0
-                    elif fc_result.get("status") == "Fake":
-                        fact_check_score = 0.0
-                    else:
-                        fact_check_score = 0.5
-                except Exception as e:
-                    logger.warning(f"Fact check failed: {e}")
-
-            # 4. Zero-Shot Content Validation
+            # Labels: 0 (Fake), 1 (Real)
+            model_probs = self._news_model_probs([texts[i] for i in pending])
+
             # Specialized models are often biased; DistilBART cross-check provides a robust second opinion.
-            zs_result = self.report_classifier.classify(
-                text=text,
+            zs_results = self.report_classifier.batch_classify(
+                [texts[i] for i in pending],
                 categories=["legitimate news report", "fictional hoax or misinformation", "unverified rumor"],
                 hypothesis_template="This text is {}."
             )
-            # Find the score for 'legitimate news report' and 'hoax'
-            zs_prob_real = 0.5
-            zs_prob_hoax = 0.0
-            for cat in zs_result["top_categories"]:
-                if cat["category"] == "legitimate news report":
-                    zs_prob_real = cat["raw_score"]
-                elif cat["category"] == "fictional hoax or misinformation":
-                    zs_prob_hoax = cat["raw_score"]
-
-            # Combine scores: Weighted average of specialized model and zero-shot model
-            content_score = (prob_real * 0.4) + (zs_prob_real * 0.6)
-            
-            # 5. Weighted Scoring
-            w_content, w_source = 0.4, 0.6
-            source_verified = False
-            
-            if source_url:
-                source_result = self.source_checker.check_source(source_url)
-                if source_result["status"] == "Trusted":
-                    source_verified = True
-                    source_score = 1.0
-                elif source_result["status"] == "Untrusted":
-                    source_score = 0.0
-                else:
-                    source_score = 0.5
-            else:
-                w_content, w_source = 0.8, 0.2
-                source_score = fact_check_score 
-            
-            if prob_real > 0.95 or zs_prob_real > 0.95:
-                w_content = 0.9
-                w_source = 0.1
-                explanation += "Verified by structural report analysis. "
+        except Exception as e:
+            logger.error(f"News verification failed: {e}")
+            for i in pending:
+                results[i] = self._news_error(e)
+            return results
+
+        if any(source_urls[i] is None for i in pending):
+            self._get_fact_checker()
+
+        def score(item):
+            i, probs, zs_result = item
+            try:
+                result = self._score_news(texts[i], source_urls[i], float(probs[1]), zs_result)
+            except Exception as e:
+                logger.error(f"News verification failed: {e}")
+                return self._news_error(e)
+            if self.use_cache and self.cache:
+                self.cache.set(content_key("news", self.news_revision, texts[i], source_url=source_urls[i]), result)
+            return result
 
-            final_score = (content_score * w_content) + (source_score * w_source)
-            
-            # STRENGTH SHIELD: If it's a trusted source OR very high confidence news, dampen penalties
-            penalty_multiplier = 1.0
-            if source_verified:
-                penalty_multiplier = 0.0 # No penalties for trusted sources!
-            elif zs_prob_real > 0.85:
-                penalty_multiplier = 0.3 # 70% reduction in penalties for high-confidence news structure
-                explanation += "Professional reporting style detected. "
-
-            # 6. Double Check Pattern Penalties
-            norm_text = text.lower().replace("-", " ")
-            suspicious_matches = [w for w in self.source_checker.SUSPICIOUS_KEYWORDS if w.replace("-", " ") in norm_text]
+        # Source lookups and web searches are I/O bound, so run them side by side
+        items = list(zip(pending, model_probs, zs_results))
+        if len(items) == 1:
+            scored = [score(items[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(items))) as pool:
+                scored = list(pool.map(score, items))
+        for i, result in zip(pending, scored):
+            results[i] = result
+        return results
+
+    def _news_model_probs(self, texts: List[str], batch_size: int = 16) -> np.ndarray:
+        """Fake/real probabilities from the news model, one row per text"""
+        return news_model_probs(self.news_tokenizer, self.news_model, texts, self.device, batch_size)
+
+    def _get_fact_checker(self):
+        """Create the fact-check pipeline on first use"""
+        with self._fact_checker_lock:
+            if not hasattr(self, 'fact_checker'):
+                from ai_service.pipelines.fact_check import FactCheckPipeline
+                self.fact_checker = FactCheckPipeline()
+        return self.fact_checker
+
+    @staticmethod
+    def _news_error(error: Exception) -> Dict[str, any]:
+        return {
+            "success": False,
+            "error": str(error),
+            "status": "Error",
+            "confidence": 0.0,
+            "is_reliable": False,
+            "details": {}
+        }
+
+    def _score_news(
+        self,
+        text: str,
+        source_url: Optional[str],
+        prob_real: float,
+        zs_result: Dict[str, any]
+    ) -> Dict[str, any]:
+        """Combine model, zero-shot, source and pattern signals into a verdict"""
+        # 2. Source & Fact Check Analysis
+        source_score = 0.5 # Neutral
+        fact_check_score = 0.5 # Neutral
+        found_sources = []
+        primary_sources = []
+        explanation = ""
+        verification_method = "Hybrid Analysis"
+
+        if source_url:
+            source_result = self.source_checker.check_source(source_url)
+            s_status = source_result["status"]
+            if s_status == "Trusted":
+                source_score = 1.0
+                explanation = f"Verified by trusted source: {source_url}. "
+            elif s_status == "Untrusted":
+                source_score = 0.0
+                explanation = f"Source {source_url} is flagged as untrusted. "
+            else:
+                source_score = 0.5
+                explanation = f"Source {source_url} is unknown. "
             
-            if suspicious_matches and penalty_multiplier > 0:
-                penalty = 0.2 * len(set(suspicious_matches[:2])) * penalty_multiplier
-                final_score = max(0.0, final_score - penalty)
-                if penalty > 0.1:
-                    explanation += f"Sensationalist patterns detected: {', '.join(suspicious_matches[:2])}. "
-
-            # 7. Hoax Probability Penalty (More conservative)
-            if zs_prob_hoax > 0.5 and penalty_multiplier > 0:
-                penalty = (zs_prob_hoax - 0.4) * 0.2 * penalty_multiplier
-                final_score = max(0.0, final_score - penalty)
-                explanation += "Tone analysis suggests potential clickbait. "
-
-            # 8. Heuristic Boost
-            # Boost if it looks like a real report, even if it has some suspicious words (if shield is active)
-            if (zs_prob_real > 0.7 or not suspicious_matches):
-                if len(text) > 400 and any(k in text.lower() for k in ["flood", "fire", "landslide", "quake", "death", "injured", "displaced"]):
-                    final_score = max(final_score, 0.7)
-                    explanation += "Detailed disaster context confirmed. "
-
-            # 9. Final Verdict (More Conservative)
-            is_reliable = final_score >= 0.6
-            if final_score > 0.8:
-                final_status = "Verified"
-            elif final_score >= 0.6:
-                final_status = "Likely Real"
-            elif final_score > 0.4:
-                final_status = "Unverified"
+            primary_sources = [{
+                "url": source_url,
+                "status": s_status,
+                "score": source_score
+            }]
+        else:
+            # Auto-Search (Fact Check)
+            try:
+                fc_result = self._get_fact_checker().verify_claim(text)
+                found_sources = fc_result.get("sources", [])
+                primary_sources = fc_result.get("primary_sources", [])
+                explanation = fc_result.get("explanation", "")
+
+                if fc_result.get("status") == "Verified":
+                    fact_check_score = 1.0
+                elif fc_result.get("status") == "Fake":
+                    fact_check_score = 0.0
+                else:
+                    fact_check_score = 0.5
+            except Exception as e:
+                logger.warning(f"Fact check failed: {e}")
+
+        # 4. Zero-Shot Content Validation (computed batched by the caller)
+        # Find the score for 'legitimate news report' and 'hoax'
+        zs_prob_real = 0.5
+        zs_prob_hoax = 0.0
+        for cat in zs_result["top_categories"]:
+            if cat["category"] == "legitimate news report":
+                zs_prob_real = cat["raw_score"]
+            elif cat["category"] == "fictional hoax or misinformation":
+                zs_prob_hoax = cat["raw_score"]
+
+        # Combine scores: Weighted average of specialized model and zero-shot model
+        content_score = (prob_real * 0.4) + (zs_prob_real * 0.6)
+        
+        # 5. Weighted Scoring
+        w_content, w_source = 0.4, 0.6
+        source_verified = False
+        
+        if source_url:
+            source_result = self.source_checker.check_source(source_url)
+            if source_result["status"] == "Trusted":
+                source_verified = True
+                source_score = 1.0
+            elif source_result["status"] == "Untrusted":
+                source_score = 0.0
             else:
-                final_status = "Likely Fake"
-
-            result = {
-                "success": True,
-                "status": final_status,
-                "confidence": final_score,
-                "is_reliable": is_reliable,
+                source_score = 0.5
+        else:
+            w_content, w_source = 0.8, 0.2
+            source_score = fact_check_score 
+        
+        if prob_real > 0.95 or zs_prob_real > 0.95:
+            w_content = 0.9
+            w_source = 0.1
+            explanation += "Verified by structural report analysis. "
+
+        final_score = (content_score * w_content) + (source_score * w_source)
+        
+        # STRENGTH SHIELD: If it's a trusted source OR very high confidence news, dampen penalties
+        penalty_multiplier = 1.0
+        if source_verified:
+            penalty_multiplier = 0.0 # No penalties for trusted sources!
+        elif zs_prob_real > 0.85:
+            penalty_multiplier = 0.3 # 70% reduction in penalties for high-confidence news structure
+            explanation += "Professional reporting style detected. "
+
+        # 6. Double Check Pattern Penalties
+        norm_text = text.lower().replace("-", " ")
+        suspicious_matches = [w for w in self.source_checker.SUSPICIOUS_KEYWORDS if w.replace("-", " ") in norm_text]
+        
+        if suspicious_matches and penalty_multiplier > 0:
+            penalty = 0.2 * len(set(suspicious_matches[:2])) * penalty_multiplier
+            final_score = max(0.0, final_score - penalty)
+            if penalty > 0.1:
+                explanation += f"Sensationalist patterns detected: {', '.join(suspicious_matches[:2])}. "
+
+        # 7. Hoax Probability Penalty (More conservative)
+        if zs_prob_hoax > 0.5 and penalty_multiplier > 0:
+            penalty = (zs_prob_hoax - 0.4) * 0.2 * penalty_multiplier
+            final_score = max(0.0, final_score - penalty)
+            explanation += "Tone analysis suggests potential clickbait. "
+
+        # 8. Heuristic Boost
+        # Boost if it looks like a real report, even if it has some suspicious words (if shield is active)
+        if (zs_prob_real > 0.7 or not suspicious_matches):
+            if len(text) > 400 and any(k in text.lower() for k in ["flood", "fire", "landslide", "quake", "death", "injured", "displaced"]):
+                final_score = max(final_score, 0.7)
+                explanation += "Detailed disaster context confirmed. "
+
+        # 9. Final Verdict (More Conservative)
+        is_reliable = final_score >= 0.6
+        if final_score > 0.8:
+            final_status = "Verified"
+        elif final_score >= 0.6:
+            final_status = "Likely Real"
+        elif final_score > 0.4:
+            final_status = "Unverified"
+        else:
+            final_status = "Likely Fake"
+
+        result = {
+            "success": True,
+            "status": final_status,
+            "confidence": final_score,
+            "is_reliable": is_reliable,
+            "explanation": explanation.strip(),
+            "details": {
+                "method": verification_method,
+                "content_score": content_score,
+                "model_score": prob_real,
+                "zs_score": zs_prob_real,
+                "source_score": source_score,
                 "explanation": explanation.strip(),
-                "details": {
-                    "method": verification_method,
-                    "content_score": content_score,
-                    "model_score": prob_real,
-                    "zs_score": zs_prob_real,
-                    "source_score": source_score,
-                    "explanation": explanation.strip(),
-                    "found_sources": found_sources,
-                    "primary_sources": primary_sources
-                }
+                "found_sources": found_sources,
+                "primary_sources": primary_sources
             }
+        }
 
-            if self.use_cache and self.cache:
-                self.cache.set(cache_key, result)
-
-            return result
-
-        except Exception as e:
-            logger.error(f"News verification failed: {e}")
-            import traceback
-            traceback.print_exc()
-            return {
-                "success": False,
-                "error": str(e),
-                "status": "Error",
-                "confidence": 0.0,
-                "is_reliable": False,
-                "details": {}
-            }
+        return result
 
     def verify_report(
         self,
@@ -283,18 +454,44 @@ class VerificationPipeline:
         """
         Verify civic report validity (Zero-Shot)
         """
-        cache_key = f"report_{hash(text)}"
-        if self.use_cache and self.cache:
-            if cached := self.cache.get(cache_key): return cached
+        return self.verify_report_batch([text])[0]
+
+    def verify_report_batch(self, texts: List[str]) -> List[Dict[str, any]]:
+        """
+        Verify several civic reports with one zero-shot pass over the
+        uncached texts
+
+        Args:
+            texts: Report texts to verify
+
+        Returns:
+            One verification result per text
+        """
+        results: List[Optional[Dict[str, any]]] = [None] * len(texts)
+        pending = []
+        for i, text in enumerate(texts):
+            if self.use_cache and self.cache:
+                if cached := self.cache.get(content_key("report", self.report_revision, text)):
+                    results[i] = cached
+                    continue
+            pending.append(i)
+        if not pending:
+            return results
 
         try:
-            result = self.report_classifier.classify(
-                text=text,
+            classified = self.report_classifier.batch_classify(
+                [texts[i] for i in pending],
                 top_k=1,
                 categories=self.REPORT_CATEGORIES,
                 hypothesis_template="This text describes {}."
             )
+        except Exception as e:
+            logger.error(f"Report verification failed: {e}")
+            for i in pending:
+                results[i] = {"success": False, "error": str(e)}
+            return results
 
+        for i, result in zip(pending, classified):
             verdict = result["category"]
             is_reliable = verdict == "a civic issue"
 
@@ -307,9 +504,6 @@ class VerificationPipeline:
             }
 
             if self.use_cache and self.cache:
-                self.cache.set(cache_key, output)
-            return output
-
-        except Exception as e:
-            logger.error(f"Report verification failed: {e}")
-            return {"success": False, "error": str(e)}
\ No newline at end of file
+                self.cache.set(content_key("report", self.report_revision, texts[i]), output)
+            results[i] = output
+        return results
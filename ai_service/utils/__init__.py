@@ -1,12 +1,28 @@
 """
 Utility functions for AI service
 """
+import json
 import os
 import re
+import sys
+import threading
+import time
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 import numpy as np
-from datetime import datetime
+
+# On-disk state of the service (result cache, vector index, ...), resolved
+# against the package so it does not depend on the working directory
+DATA_DIR = os.getenv("AI_DATA_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data"
+)
+
+# Short disaster report used to warm models up at startup
+WARMUP_TEXT = (
+    "Heavy rainfall triggered a landslide in Sindhupalchok district on Tuesday, "
+    "blocking the Araniko highway and displacing dozens of families."
+)
 
 
 class TextPreprocessor:
@@ -69,38 +85,111 @@ class TextPreprocessor:
 
 
 class ModelCache:
-    """Simple in-memory cache for model predictions"""
+    """
+    In-memory LRU cache for model predictions.
+    Entries are kept in an OrderedDict so lookups, inserts and evictions are
+    O(1). The cache can be bounded by entry count and/or by the serialized
+    size of the stored payloads, and entries can expire after a TTL.
+    """
     
-    def __init__(self, max_size: int = 1000):
-        self.cache: Dict[str, Any] = {}
+    def __init__(
+        self,
+        max_size: Optional[int] = 1000,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None
+    ):
+        """
+        Initialize the cache
+        
+        Args:
+            max_size: Maximum number of entries (None for no limit)
+            max_bytes: Maximum total payload size in bytes (None for no limit)
+            ttl_seconds: Seconds after which an entry expires (None never expires)
+        """
+        self.cache: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
         self.max_size = max_size
-        self.access_times: Dict[str, datetime] = {}
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+    
+    @staticmethod
+    def _payload_size(value: Any) -> int:
+        """Approximate size of a cached payload from its JSON encoding"""
+        try:
+            return len(json.dumps(value, default=str).encode("utf-8"))
+        except (TypeError, ValueError):
+            return sys.getsizeof(value)
+    
+    def _remove(self, key: str) -> None:
+        _, size, _ = self.cache.pop(key)
+        self.total_bytes -= size
     
     def get(self, key: str) -> Optional[Any]:
         """Get cached value"""
-        if key in self.cache:
-            self.access_times[key] = datetime.now()
-            logger.debug(f"Cache hit for key: {key[:50]}...")
-            return self.cache[key]
-        return None
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            
+            value, _, stored_at = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                self._remove(key)
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+            
+            self.cache.move_to_end(key)
+            self._stats["hits"] += 1
+        logger.debug(f"Cache hit for key: {key[:50]}...")
+        return value
     
     def set(self, key: str, value: Any) -> None:
         """Set cached value with LRU eviction"""
-        if len(self.cache) >= self.max_size:
-            # Remove least recently used item
-            oldest_key = min(self.access_times, key=self.access_times.get)
-            del self.cache[oldest_key]
-            del self.access_times[oldest_key]
+        size = self._payload_size(value) if self.max_bytes is not None else 0
         
-        self.cache[key] = value
-        self.access_times[key] = datetime.now()
+        with self._lock:
+            if key in self.cache:
+                self._remove(key)
+            self.cache[key] = (value, size, time.monotonic())
+            self.total_bytes += size
+            
+            # Remove least recently used items until within both budgets
+            while self.cache and (
+                (self.max_size is not None and len(self.cache) > self.max_size)
+                or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+            ):
+                self._remove(next(iter(self.cache)))
+                self._stats["evictions"] += 1
         logger.debug(f"Cached value for key: {key[:50]}...")
     
     def clear(self) -> None:
         """Clear all cached values"""
-        self.cache.clear()
-        self.access_times.clear()
+        with self._lock:
+            self.cache.clear()
+            self.total_bytes = 0
         logger.info("Cache cleared")
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache counters and current size
+        
+        Returns:
+            Hits, misses, evictions, expirations, entry count and payload bytes
+        """
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": len(self.cache),
+                "bytes": self.total_bytes,
+                "max_size": self.max_size,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds
+            }
 
 
 def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
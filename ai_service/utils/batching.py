@@ -0,0 +1,257 @@
+"""
+Micro-Batching Scheduler
+Coalesces concurrent single-item requests for a model into one batched
+forward pass, trading a few milliseconds of queueing for throughput
+"""
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+from loguru import logger
+
+# Batch functions take the items of one batch plus their shared key and
+# return one result per item, in order
+BatchFn = Callable[[List[Any], Hashable], List[Any]]
+
+HISTOGRAM_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+# Serialises resetting batchers inherited by a forked child process
+_fork_lock = threading.Lock()
+
+
+class Histogram:
+    """Counts of observed values in power-of-two buckets"""
+
+    def __init__(self, buckets: Tuple[int, ...] = HISTOGRAM_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0
+        self.sum = 0
+
+    def observe(self, value: int) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"<={bound}" for bound in self.buckets] + [f">{self.buckets[-1]}"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.total,
+            "mean": round(self.sum / self.total, 2) if self.total else 0.0
+        }
+
+
+class MicroBatcher:
+    """
+    Per-model request queue served by one worker thread.
+    The worker takes the oldest pending request, waits until max_batch_size
+    requests with the same key are queued or max_delay_ms has passed since it
+    arrived, runs them through batch_fn together and resolves every caller's
+    future with its own result.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_fn: BatchFn,
+        max_batch_size: Optional[int] = None,
+        max_delay_ms: Optional[float] = None
+    ):
+        """
+        Initialize the batcher
+
+        Args:
+            name: Name shown in metrics, usually "<task>:<model>"
+            batch_fn: Runs one batch; receives the items and their shared key
+            max_batch_size: Largest batch (defaults to AI_MAX_BATCH_SIZE or 16)
+            max_delay_ms: Longest a request waits for companions
+                          (defaults to AI_BATCH_DELAY_MS or 5)
+        """
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size or int(os.getenv("AI_MAX_BATCH_SIZE", "16")))
+        if max_delay_ms is None:
+            max_delay_ms = float(os.getenv("AI_BATCH_DELAY_MS", "5"))
+        self.max_delay = max(0.0, max_delay_ms) / 1000
+
+        self._pending: Dict[Hashable, Deque[Tuple[Any, Future, float]]] = {}
+        self._depth = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        # Process the worker thread runs in; a forked child inherits the
+        # thread object but not the thread
+        self._pid = os.getpid()
+
+        self._batch_sizes = Histogram()
+        self._queue_depths = Histogram()
+        self._stats = {"requests": 0, "batches": 0, "errors": 0, "busy_ms": 0.0}
+
+        register_batcher(self)
+
+    def submit(self, item: Any, key: Hashable = None) -> Future:
+        """
+        Queue one request
+
+        Args:
+            item: Input passed to batch_fn
+            key: Requests are only batched with others of the same key
+                 (e.g. the same generation parameters)
+
+        Returns:
+            Future resolved with this item's result
+        """
+        future: Future = Future()
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"Batcher '{self.name}' is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"batcher-{self.name}", daemon=True
+                )
+                self._pid = os.getpid()
+                self._thread.start()
+
+            self._pending.setdefault(key, deque()).append((item, future, time.monotonic()))
+            self._depth += 1
+            self._stats["requests"] += 1
+            self._queue_depths.observe(self._depth)
+            self._cond.notify()
+        return future
+
+    def _reset_after_fork(self) -> None:
+        """
+        Start afresh in a forked child: the worker thread, its lock and the
+        queued requests all belong to the parent
+        """
+        with _fork_lock:
+            if self._pid == os.getpid():
+                return
+            self._pending = {}
+            self._depth = 0
+            self._cond = threading.Condition()
+            self._thread = None
+            self._pid = os.getpid()
+
+    def _next_batch(self) -> Optional[Tuple[Hashable, List[Tuple[Any, Future, float]]]]:
+        """Block until a batch is due; None once closed and drained"""
+        with self._cond:
+            while True:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return None
+
+                # Serve the key whose oldest request has waited longest
+                key = min(self._pending, key=lambda k: self._pending[k][0][2])
+                queue = self._pending[key]
+                remaining = queue[0][2] + self.max_delay - time.monotonic()
+                if len(queue) >= self.max_batch_size or remaining <= 0 or self._closed:
+                    batch = [queue.popleft() for _ in range(min(self.max_batch_size, len(queue)))]
+                    if not queue:
+                        del self._pending[key]
+                    self._depth -= len(batch)
+                    return key, batch
+                self._cond.wait(timeout=remaining)
+
+    def _run(self) -> None:
+        while True:
+            next_batch = self._next_batch()
+            if next_batch is None:
+                return
+            key, batch = next_batch
+            items = [item for item, _, _ in batch]
+
+            start = time.perf_counter()
+            try:
+                results = self.batch_fn(items, key)
+                if len(results) != len(items):
+                    raise RuntimeError(f"batch_fn returned {len(results)} results for {len(items)} items")
+            except Exception as e:
+                logger.error(f"Batcher '{self.name}' failed a batch of {len(items)}: {e}")
+                with self._cond:
+                    self._stats["errors"] += 1
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                with self._cond:
+                    self._stats["batches"] += 1
+                    self._stats["busy_ms"] = round(self._stats["busy_ms"] + elapsed_ms, 1)
+                    self._batch_sizes.observe(len(items))
+
+            for (_, future, _), result in zip(batch, results):
+                future.set_result(result)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Queue and batch statistics
+
+        Returns:
+            Counters, configuration, current queue depth and the batch-size
+            and queue-depth histograms
+        """
+        with self._cond:
+            return {
+                **self._stats,
+                "max_batch_size": self.max_batch_size,
+                "max_delay_ms": self.max_delay * 1000,
+                "queue_depth": self._depth,
+                "batch_size_histogram": self._batch_sizes.snapshot(),
+                "queue_depth_histogram": self._queue_depths.snapshot()
+            }
+
+    def close(self) -> None:
+        """Run the remaining queued requests and stop the worker thread"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        unregister_batcher(self)
+
+
+_batchers: List[MicroBatcher] = []
+_batchers_lock = threading.Lock()
+
+
+def register_batcher(batcher: MicroBatcher) -> None:
+    with _batchers_lock:
+        _batchers.append(batcher)
+
+
+def unregister_batcher(batcher: MicroBatcher) -> None:
+    with _batchers_lock:
+        if batcher in _batchers:
+            _batchers.remove(batcher)
+
+
+def batching_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Metrics of every live batcher in this process
+
+    Returns:
+        Batcher metrics keyed by batcher name
+    """
+    with _batchers_lock:
+        batchers = list(_batchers)
+    metrics: Dict[str, Dict[str, Any]] = {}
+    for batcher in batchers:
+        name = batcher.name
+        suffix = 2
+        while name in metrics:
+            name = f"{batcher.name}#{suffix}"
+            suffix += 1
+        metrics[name] = batcher.metrics()
+    return metrics
@@ -1,5 +1,4 @@
 
-import requests
 from bs4 import BeautifulSoup
 from pypdf import PdfReader
 from io import BytesIO
@@ -7,13 +6,16 @@ from typing import Optional, Dict
 from loguru import logger
 from urllib.parse import urlparse
 
+from ai_service.utils.http_client import HttpClient, http_client
+
 class ContentExtractor:
     """
     Utility to extract text content from various sources like URLs and PDFs
     """
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, http: Optional[HttpClient] = None):
         self.timeout = timeout
+        self.http = http or http_client
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
@@ -26,7 +28,7 @@ class ContentExtractor:
         """
         try:
             logger.info(f"Extracting content from URL: {url}")
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self.http.get(url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, "html.parser")
@@ -0,0 +1,334 @@
+"""
+Embedding Store
+Content-addressed cache of text embeddings with a byte-budgeted in-memory
+LRU tier and an optional on-disk tier shared by all workers on a host
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from loguru import logger
+
+# Optional imports (file locking is POSIX-only; without it the disk tier
+# is still safe for a single writer process)
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+
+class DiskEmbeddingTier:
+    """
+    Append-only embedding file shared between processes.
+    Vectors are stored back to back as float32 in one data file that readers
+    memory-map; a text index file maps each key to its offset and dimension.
+    Every process tails the index file to pick up entries written by others.
+    With a size cap, a write that would pass it first compacts both files
+    down to the most recently written entries.
+    """
+
+    DATA_FILE = "embeddings.f32"
+    INDEX_FILE = "embeddings.idx"
+    # Never replaced, unlike the other two, so every process locks the same
+    # file; it holds the number of compactions so far
+    LOCK_FILE = "embeddings.lock"
+    # Appended to an index line left unterminated by a crashed writer; the
+    # extra field makes the line invalid, so it is skipped
+    TORN_LINE_END = b" torn\n"
+
+    def __init__(self, path: str, max_bytes: Optional[int] = None):
+        """
+        Args:
+            path: Directory of the tier's files
+            max_bytes: Size cap of the data file; a write that would pass it
+                       first keeps only the most recently written entries
+                       filling half of it (None or 0: unbounded)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(path, exist_ok=True)
+        self.data_path = os.path.join(path, self.DATA_FILE)
+        self.index_path = os.path.join(path, self.INDEX_FILE)
+        self.lock_path = os.path.join(path, self.LOCK_FILE)
+        for file_path in (self.data_path, self.index_path, self.lock_path):
+            open(file_path, "ab").close()
+
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+        self._index_position = 0
+        # Compaction count the offsets were read at; each compaction replaces
+        # the data and index files
+        self._generation: Optional[bytes] = None
+        self._data: Optional[np.memmap] = None
+        self._lock = threading.Lock()
+        self.stats = {"compactions": 0}
+        with self._file_lock(exclusive=False):
+            self._refresh_index()
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        """
+        Cross-process lock: shared while reading, exclusive while appending
+        or compacting, so readers never see one file compacted and the other
+        not. Drops the offsets read before a compaction by another process.
+
+        Yields:
+            The open lock file
+        """
+        with open(self.lock_path, "a+b") as lock_file:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                lock_file.seek(0)
+                generation = lock_file.read()
+                if generation != self._generation:
+                    self._generation = generation
+                    self._offsets = {}
+                    self._index_position = 0
+                    self._data = None
+                yield lock_file
+            finally:
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _refresh_index(self) -> None:
+        """Read index entries appended since the last refresh (file lock held)"""
+        with open(self.index_path, "rb") as f:
+            f.seek(self._index_position)
+            chunk = f.read()
+
+        # Only consume complete lines; a writer may be mid-append
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            fields = line.split()
+            try:
+                key, offset, dim = fields[0].decode("ascii"), int(fields[1]), int(fields[2])
+            except (IndexError, ValueError):
+                continue
+            # Lines cut short by a crash, and vectors written unaligned after a
+            # torn one by older versions, cannot be read back
+            if len(fields) == 3 and offset % 4 == 0:
+                self._offsets[key] = (offset, dim)
+        self._index_position += end
+
+    def _data_view(self, required_bytes: int) -> np.memmap:
+        """Memory map of the data file, remapped when it has grown"""
+        if self._data is None or self._data.shape[0] * 4 < required_bytes:
+            size = os.path.getsize(self.data_path) // 4
+            self._data = np.memmap(self.data_path, dtype=np.float32, mode="r", shape=(size,))
+        return self._data
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock, self._file_lock(exclusive=False):
+            if key not in self._offsets:
+                self._refresh_index()
+            location = self._offsets.get(key)
+            if location is None:
+                return None
+            offset, dim = location
+            data = self._data_view(offset + 4 * dim)
+            start = offset // 4
+            return np.array(data[start:start + dim])
+
+    def put(self, key: str, embedding: np.ndarray) -> None:
+        embedding = np.ascontiguousarray(embedding, dtype=np.float32).ravel()
+
+        with self._lock:
+            if key in self._offsets:
+                return
+            with self._file_lock(exclusive=True) as lock_file:
+                # Another worker may have written it while we waited for the lock
+                self._refresh_index()
+                if key in self._offsets:
+                    return
+                if self.max_bytes and os.path.getsize(self.data_path) + embedding.nbytes > self.max_bytes:
+                    self._compact(self.max_bytes // 2, lock_file)
+
+                with open(self.data_path, "ab") as data_file:
+                    offset = data_file.seek(0, os.SEEK_END)
+                    # A writer that crashed mid-append leaves a partial vector;
+                    # pad past it so every vector starts on a float32 boundary
+                    padding = -offset % 4
+                    data_file.write(b"\0" * padding + embedding.tobytes())
+                    offset += padding
+                with open(self.index_path, "a+b") as index_file:
+                    size = index_file.seek(0, os.SEEK_END)
+                    if size:
+                        index_file.seek(size - 1)
+                        if index_file.read(1) != b"\n":
+                            index_file.write(self.TORN_LINE_END)
+                    index_file.write(f"{key} {offset} {embedding.shape[0]}\n".encode("ascii"))
+                    self._index_position = index_file.tell()
+                self._offsets[key] = (offset, embedding.shape[0])
+
+    def _compact(self, target_bytes: int, lock_file) -> None:
+        """
+        Rewrite both files with the most recently written entries that fit
+        in target_bytes and count the compaction in the held lock file
+        """
+        kept = []
+        total = 0
+        for key, (offset, dim) in sorted(self._offsets.items(), key=lambda item: item[1][0], reverse=True):
+            if total + 4 * dim > target_bytes:
+                break
+            kept.append((key, offset, dim))
+            total += 4 * dim
+
+        data = self._data_view(os.path.getsize(self.data_path))
+        offsets: Dict[str, Tuple[int, int]] = {}
+        data_tmp, index_tmp = f"{self.data_path}.tmp", f"{self.index_path}.tmp"
+        with open(data_tmp, "wb") as data_file, open(index_tmp, "wb") as index_file:
+            for key, offset, dim in reversed(kept):
+                position = data_file.tell()
+                data_file.write(data[offset // 4:offset // 4 + dim].tobytes())
+                index_file.write(f"{key} {position} {dim}\n".encode("ascii"))
+                offsets[key] = (position, dim)
+
+        self._data = None
+        try:
+            os.replace(data_tmp, self.data_path)
+        except OSError as e:
+            # Windows refuses to replace a file another process has mapped
+            logger.warning(f"Embedding disk tier: compaction skipped ({e})")
+            return
+        os.replace(index_tmp, self.index_path)
+        dropped = len(self._offsets) - len(offsets)
+        self._offsets = offsets
+        self._index_position = os.path.getsize(self.index_path)
+        self._generation = str(int(self._generation or 0) + 1).encode("ascii")
+        lock_file.truncate(0)
+        lock_file.write(self._generation)
+        lock_file.flush()
+        self.stats["compactions"] += 1
+        logger.info(f"Embedding disk tier: compacted to {len(offsets)} entries ({total} bytes), dropped {dropped}")
+
+    def size_bytes(self) -> int:
+        """Current size of the data file"""
+        return os.path.getsize(self.data_path)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+
+class EmbeddingStore:
+    """
+    Two-tier embedding cache keyed by (model name, SHA-256 of text).
+    The memory tier evicts least recently used vectors once their total size
+    exceeds max_bytes; the optional disk tier survives restarts and keeps the
+    most recently written vectors within disk_max_bytes.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_path: Optional[str] = None,
+        disk_max_bytes: Optional[int] = None
+    ):
+        """
+        Initialize the store
+
+        Args:
+            model_name: Embedding model name, part of every key
+            max_bytes: Byte budget of the in-memory tier
+            disk_path: Directory for the shared on-disk tier (None disables it)
+            disk_max_bytes: Size cap of the on-disk tier (None: unbounded)
+        """
+        self.model_name = model_name
+        self.max_bytes = max_bytes
+        self.disk = DiskEmbeddingTier(disk_path, disk_max_bytes) if disk_path else None
+
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        if self.disk is not None:
+            logger.info(f"Embedding store using disk tier at {disk_path} ({len(self.disk)} entries)")
+
+    def key(self, text: str) -> str:
+        """Stable content address of a text for this model"""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return hashlib.sha256(f"{self.model_name}:{digest}".encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, embedding: np.ndarray) -> None:
+        """Insert into the memory tier and evict down to the byte budget"""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return
+        self._memory[key] = embedding
+        self._memory_bytes += embedding.nbytes
+        while self._memory_bytes > self.max_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+            self.stats["evictions"] += 1
+
+    def get_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up embeddings for several texts
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Cached embedding per text, or None where there is no entry
+        """
+        results: List[Optional[np.ndarray]] = []
+        for text in texts:
+            key = self.key(text)
+            with self._lock:
+                embedding = self._memory.get(key)
+                if embedding is not None:
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    results.append(embedding)
+                    continue
+
+            embedding = self.disk.get(key) if self.disk is not None else None
+            with self._lock:
+                if embedding is not None:
+                    self.stats["disk_hits"] += 1
+                    self._remember(key, embedding)
+                else:
+                    self.stats["misses"] += 1
+            results.append(embedding)
+        return results
+
+    def put_many(self, texts: List[str], embeddings: np.ndarray) -> None:
+        """
+        Store embeddings for several texts in both tiers
+
+        Args:
+            texts: Texts that were embedded
+            embeddings: One embedding per text
+        """
+        for text, embedding in zip(texts, embeddings):
+            key = self.key(text)
+            embedding = np.asarray(embedding, dtype=np.float32)
+            with self._lock:
+                self._remember(key, embedding)
+            if self.disk is not None:
+                self.disk.put(key, embedding)
+
+    def info(self) -> Dict[str, int]:
+        """Sizes and hit/miss counters of the store"""
+        with self._lock:
+            return {
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "max_bytes": self.max_bytes,
+                "disk_entries": len(self.disk) if self.disk is not None else 0,
+                "disk_bytes": self.disk.size_bytes() if self.disk is not None else 0,
+                "disk_max_bytes": (self.disk.max_bytes or 0) if self.disk is not None else 0,
+                "disk_compactions": self.disk.stats["compactions"] if self.disk is not None else 0,
+                **self.stats
+            }
+
+    def clear(self) -> None:
+        """Drop the in-memory tier (the disk tier is left intact)"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
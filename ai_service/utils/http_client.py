@@ -0,0 +1,238 @@
+"""
+Shared HTTP Client
+Pooled requests sessions shared by every fetcher and page extractor, so
+repeated calls to the same API reuse kept-alive connections instead of
+opening a new TCP+TLS connection each time. The polled data sources each get
+their own session with a retry/backoff policy; arbitrary URLs (user input,
+search results) share one session whose per-host pools are capped. Adds
+compressed transfer negotiation and connection metrics.
+"""
+import importlib.util
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from loguru import logger
+
+# Optional dependency, looked up without importing it; urllib3 decodes
+# brotli responses only when one of these is installed
+BROTLI_AVAILABLE = any(importlib.util.find_spec(name) is not None for name in ("brotli", "brotlicffi"))
+
+ACCEPT_ENCODING = "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
+# Transient statuses worth retrying (rate limiting and gateway errors)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Metrics key of the session serving URLs that are not polled sources
+OTHER_HOSTS = "other"
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={os.getenv(name)!r}")
+        return default
+
+
+class HttpClient:
+    """
+    Pooled sessions with retries and metrics.
+    Each polled source host gets its own session, created on first use; all
+    other URLs go through one shared session that keeps pools for at most
+    pool_size hosts (the least recently used are closed) and never retries,
+    so a slow user-supplied page costs one timeout. Thread-safe; sessions
+    are recreated in a forked worker process, which must not share the
+    parent's sockets.
+    """
+
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        retries: Optional[int] = None,
+        backoff: Optional[float] = None,
+        timeout: Optional[float] = None
+    ):
+        """
+        Args:
+            pool_size: Kept-alive connections per host, and hosts kept by
+                       the shared session (defaults to AI_HTTP_POOL_SIZE,
+                       then 10)
+            retries: Retries of connection errors and RETRY_STATUSES for
+                     polled sources (defaults to AI_HTTP_RETRIES, then 2;
+                     0 disables them)
+            backoff: Backoff factor in seconds between retries, doubled on
+                     each attempt; Retry-After is honoured (defaults to
+                     AI_HTTP_BACKOFF, then 0.5)
+            timeout: Timeout in seconds for calls that do not pass one
+                     (defaults to AI_HTTP_TIMEOUT, then 10)
+        """
+        self.pool_size = int(pool_size if pool_size is not None else _env_number("AI_HTTP_POOL_SIZE", 10))
+        self.retries = int(retries if retries is not None else _env_number("AI_HTTP_RETRIES", 2))
+        self.backoff = backoff if backoff is not None else _env_number("AI_HTTP_BACKOFF", 0.5)
+        self.timeout = timeout if timeout is not None else _env_number("AI_HTTP_TIMEOUT", 10)
+
+        self._lock = threading.Lock()
+        # Sessions by source host, plus the shared one under OTHER_HOSTS
+        self._sessions: Dict[str, requests.Session] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._pid = os.getpid()
+
+    def _retry_policy(self) -> Retry:
+        return Retry(
+            total=self.retries,
+            connect=self.retries,
+            read=self.retries,
+            status=self.retries,
+            backoff_factor=self.backoff,
+            status_forcelist=RETRY_STATUSES,
+            # The only source POSTs are ReliefWeb searches, safe to repeat
+            allowed_methods=frozenset(["GET", "HEAD", "POST"]),
+            respect_retry_after_header=True,
+            # Hand the last response back so callers keep their status handling
+            raise_on_status=False
+        )
+
+    @staticmethod
+    def _key(url: str, source: bool) -> str:
+        """Session and metrics key of a URL"""
+        return "{0.scheme}://{0.netloc}".format(urlsplit(url)) if source else OTHER_HOSTS
+
+    def session(self, url: str, source: bool = False) -> requests.Session:
+        """
+        Pooled session for a URL
+
+        Args:
+            url: Request URL
+            source: Whether the URL is a polled data source (its host gets
+                    a session of its own, with retries)
+        """
+        key = self._key(url, source)
+        with self._lock:
+            if os.getpid() != self._pid:
+                self._sessions.clear()
+                self._pid = os.getpid()
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                if source:
+                    adapter = HTTPAdapter(
+                        pool_connections=1,
+                        pool_maxsize=self.pool_size,
+                        max_retries=self._retry_policy()
+                    )
+                else:
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_size,
+                        pool_maxsize=self.pool_size,
+                        max_retries=0
+                    )
+                for scheme in ("http://", "https://"):
+                    session.mount(scheme, adapter)
+                session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+                self._sessions[key] = session
+                self._stats.setdefault(key, {
+                    "requests": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "compressed": 0,
+                    "bytes": 0,
+                    "latency_ms_total": 0.0,
+                    "status": {}
+                })
+            return session
+
+    def request(self, method: str, url: str, source: bool = False, **kwargs: Any) -> requests.Response:
+        """
+        Send a request through a pooled session
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            source: Whether the URL is a polled data source (see session)
+            **kwargs: As for requests.request; timeout defaults to the
+                      client's
+
+        Returns:
+            The response (after retries, possibly an error status)
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        session = self.session(url, source)
+        host = self._key(url, source)
+        start = time.perf_counter()
+        try:
+            response = session.request(method, url, **kwargs)
+        except requests.RequestException:
+            with self._lock:
+                stats = self._stats[host]
+                stats["requests"] += 1
+                stats["errors"] += 1
+                stats["latency_ms_total"] += 1000 * (time.perf_counter() - start)
+            raise
+
+        retry_state = getattr(response.raw, "retries", None)
+        with self._lock:
+            stats = self._stats[host]
+            stats["requests"] += 1
+            stats["latency_ms_total"] += 1000 * (time.perf_counter() - start)
+            stats["retries"] += len(retry_state.history) if retry_state is not None else 0
+            stats["status"][response.status_code] = stats["status"].get(response.status_code, 0) + 1
+            if response.headers.get("Content-Encoding") in ("gzip", "deflate", "br"):
+                stats["compressed"] += 1
+            if not kwargs.get("stream"):
+                stats["bytes"] += len(response.content)
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("HEAD", url, **kwargs)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Connection and request counters
+
+        Returns:
+            Per source host, and for all other hosts together under
+            "other": requests, connections opened by the pools currently
+            kept (so requests served over a reused connection is their
+            difference), errors, retries,
+            compressed responses, decoded bytes received, mean latency and
+            responses per status code; plus the client's settings
+        """
+        hosts = {}
+        with self._lock:
+            for host, session in self._sessions.items():
+                stats = dict(self._stats[host], status=dict(self._stats[host]["status"]))
+                pools = session.get_adapter("https://").poolmanager.pools
+                stats["connections_opened"] = sum(pools[key].num_connections for key in pools.keys())
+                latency = stats.pop("latency_ms_total")
+                stats["mean_latency_ms"] = round(latency / stats["requests"], 1) if stats["requests"] else 0.0
+                hosts[host] = stats
+        return {
+            "hosts": hosts,
+            "pool_size": self.pool_size,
+            "retries": self.retries,
+            "backoff": self.backoff,
+            "accept_encoding": ACCEPT_ENCODING
+        }
+
+    def close(self) -> None:
+        """Close every pooled connection"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+# Process-wide client shared by all fetchers and extractors
+http_client = HttpClient()
@@ -0,0 +1,161 @@
+"""
+Inference Executor
+Runs blocking model work off the event loop on a bounded thread pool,
+with per-endpoint concurrency limits and load shedding when full
+"""
+import asyncio
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from loguru import logger
+
+
+class ServiceOverloaded(Exception):
+    """Raised when an endpoint or the executor has no free slot"""
+
+    def __init__(self, endpoint: str, retry_after: int):
+        super().__init__(f"Too many concurrent '{endpoint}' requests, retry in {retry_after}s")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+def parse_endpoint_limits(spec: Optional[str]) -> Dict[str, int]:
+    """
+    Parse "endpoint=limit" pairs, e.g. "summarize=4,process=2"
+
+    Args:
+        spec: Comma-separated pairs (None or empty for no overrides)
+
+    Returns:
+        Mapping of endpoint name to limit; malformed pairs are skipped
+    """
+    limits = {}
+    for pair in (spec or "").split(","):
+        name, _, value = pair.partition("=")
+        try:
+            limits[name.strip()] = int(value)
+        except ValueError:
+            if pair.strip():
+                logger.warning(f"Ignoring malformed endpoint limit '{pair}'")
+    return limits
+
+
+class InferenceExecutor:
+    """
+    Dedicated thread pool for model work.
+    Every request takes a slot for its endpoint and one of max_pending
+    global slots before it is queued; when either is exhausted the request
+    is rejected immediately with ServiceOverloaded instead of waiting, so a
+    burst of slow requests cannot stall the worker or grow an unbounded queue.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_pending: int = 32,
+        endpoint_limits: Optional[Dict[str, int]] = None,
+        default_limit: int = 16,
+        retry_after: int = 5
+    ):
+        """
+        Initialize the executor
+
+        Args:
+            max_workers: Threads running model work
+            max_pending: Requests admitted at once across all endpoints
+                         (running plus queued)
+            endpoint_limits: Per-endpoint cap on admitted requests
+            default_limit: Cap for endpoints without an explicit limit
+            retry_after: Seconds suggested to rejected clients
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(self.max_workers, max_pending)
+        self.endpoint_limits = dict(endpoint_limits or {})
+        self.default_limit = default_limit
+        self.retry_after = retry_after
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="inference"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._in_flight: Dict[str, int] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _limit(self, endpoint: str) -> int:
+        return self.endpoint_limits.get(endpoint, self.default_limit)
+
+    def _acquire(self, endpoint: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, {"admitted": 0, "rejected": 0, "failed": 0})
+            in_flight = self._in_flight.get(endpoint, 0)
+            if in_flight >= self._limit(endpoint) or self._pending >= self.max_pending:
+                stats["rejected"] += 1
+                raise ServiceOverloaded(endpoint, self.retry_after)
+            self._in_flight[endpoint] = in_flight + 1
+            self._pending += 1
+            stats["admitted"] += 1
+
+    def _release(self, endpoint: str, failed: bool) -> None:
+        with self._lock:
+            self._in_flight[endpoint] -= 1
+            self._pending -= 1
+            if failed:
+                self._stats[endpoint]["failed"] += 1
+
+    async def run(self, endpoint: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking callable on the inference pool
+
+        Args:
+            endpoint: Name the concurrency limit is tracked under
+            fn: Blocking callable; if it returns a concurrent Future (e.g. a
+                micro-batcher submission) that future is awaited as well
+            args: Positional arguments for fn
+            kwargs: Keyword arguments for fn
+
+        Returns:
+            The callable's (or its future's) result
+
+        Raises:
+            ServiceOverloaded: If no slot is free
+        """
+        self._acquire(endpoint)
+        failed = True
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+            if isinstance(result, Future):
+                result = await asyncio.wrap_future(result)
+            failed = False
+            return result
+        finally:
+            self._release(endpoint, failed)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Admission counters and current load
+
+        Returns:
+            Pool size, pending requests and per-endpoint in-flight, limit,
+            admitted, rejected and failed counts
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "endpoints": {
+                    endpoint: {
+                        **stats,
+                        "in_flight": self._in_flight.get(endpoint, 0),
+                        "limit": self._limit(endpoint)
+                    }
+                    for endpoint, stats in self._stats.items()
+                }
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,180 @@
+"""
+Memory Governor
+Decides when garbage collection and allocator cache clearing are worth
+their cost, instead of forcing them after every request
+"""
+import gc
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+from loguru import logger
+
+# Optional imports
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+def get_rss_mb() -> Optional[float]:
+    """
+    Current resident set size of this process
+
+    Returns:
+        RSS in megabytes, or None if it cannot be determined on this platform
+    """
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+
+    # Linux fallback without psutil
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm", "r") as f:
+                resident_pages = int(f.read().split()[1])
+            return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+        except (OSError, ValueError, IndexError):
+            return None
+    return None
+
+
+def get_allocator_stats() -> Dict[str, float]:
+    """
+    CUDA caching allocator statistics, empty when torch or CUDA is unavailable
+
+    Returns:
+        Allocated and reserved memory in megabytes
+    """
+    torch = sys.modules.get("torch")
+    if torch is None or not torch.cuda.is_available():
+        return {}
+    return {
+        "cuda_allocated_mb": torch.cuda.memory_allocated() / (1024 * 1024),
+        "cuda_reserved_mb": torch.cuda.memory_reserved() / (1024 * 1024)
+    }
+
+
+class MemoryGovernor:
+    """
+    Memory-pressure policy for long-running workers.
+    Collection runs only when RSS crosses a high-water mark or every N
+    requests, and every decision is counted so the thresholds can be tuned.
+    """
+
+    def __init__(
+        self,
+        high_water_mb: Optional[float] = 4096,
+        collect_every: Optional[int] = 100,
+        high_water_cooldown: int = 10
+    ):
+        """
+        Initialize the governor
+
+        Args:
+            high_water_mb: Collect when RSS is at or above this many MB (None disables)
+            collect_every: Collect at least every N requests (None disables)
+            high_water_cooldown: Minimum requests between two high-water collections,
+                                 so a worker whose baseline sits above the mark does
+                                 not collect on every request
+        """
+        self.high_water_mb = high_water_mb
+        self.collect_every = collect_every
+        self.high_water_cooldown = max(1, high_water_cooldown)
+        self._lock = threading.Lock()
+        self._requests_since_collect = 0
+        self._stats = {
+            "requests_seen": 0,
+            "collections": 0,
+            "collections_high_water": 0,
+            "collections_interval": 0,
+            "collections_manual": 0,
+            "skipped": 0,
+            "total_collect_ms": 0.0,
+            "last_collect_ms": 0.0,
+            "last_rss_mb": None,
+            "peak_rss_mb": None
+        }
+
+    def maybe_collect(self, n: int = 1) -> Optional[str]:
+        """
+        Record finished requests and collect if the policy says so
+
+        Args:
+            n: Requests finished, e.g. the reports of one batched call
+
+        Returns:
+            The reason collection ran ("high_water" or "interval"), or None if skipped
+        """
+        rss_mb = get_rss_mb()
+
+        with self._lock:
+            self._stats["requests_seen"] += n
+            self._requests_since_collect += n
+            if rss_mb is not None:
+                self._stats["last_rss_mb"] = round(rss_mb, 1)
+                peak = self._stats["peak_rss_mb"]
+                self._stats["peak_rss_mb"] = round(max(rss_mb, peak or 0.0), 1)
+
+            reason = None
+            over_high_water = (
+                self.high_water_mb is not None and rss_mb is not None and rss_mb >= self.high_water_mb
+            )
+            if over_high_water and self._requests_since_collect >= self.high_water_cooldown:
+                reason = "high_water"
+            elif self.collect_every and self._requests_since_collect >= self.collect_every:
+                reason = "interval"
+
+            if reason is None:
+                self._stats["skipped"] += 1
+                return None
+
+        self.collect(reason)
+        return reason
+
+    def collect(self, reason: str = "manual") -> float:
+        """
+        Run garbage collection and clear the CUDA allocator cache
+
+        Args:
+            reason: Why collection was triggered, used for the metrics
+
+        Returns:
+            Time spent collecting in milliseconds
+        """
+        start = time.perf_counter()
+        gc.collect()
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            self._requests_since_collect = 0
+            self._stats["collections"] += 1
+            self._stats[f"collections_{reason}"] = self._stats.get(f"collections_{reason}", 0) + 1
+            self._stats["last_collect_ms"] = round(elapsed_ms, 2)
+            self._stats["total_collect_ms"] = round(self._stats["total_collect_ms"] + elapsed_ms, 2)
+
+        logger.debug(f"Memory collection ({reason}) took {elapsed_ms:.1f} ms")
+        return elapsed_ms
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Snapshot of the governor's decisions and current memory usage
+
+        Returns:
+            Counters, thresholds, RSS and allocator statistics
+        """
+        with self._lock:
+            snapshot = dict(self._stats)
+            snapshot["requests_since_collect"] = self._requests_since_collect
+
+        snapshot["high_water_mb"] = self.high_water_mb
+        snapshot["collect_every"] = self.collect_every
+        snapshot["high_water_cooldown"] = self.high_water_cooldown
+        rss_mb = get_rss_mb()
+        snapshot["rss_mb"] = round(rss_mb, 1) if rss_mb is not None else None
+        snapshot.update({k: round(v, 1) for k, v in get_allocator_stats().items()})
+        return snapshot
@@ -0,0 +1,327 @@
+"""
+Process-Pool Inference
+Serving mode where the parent process loads the pipelines once and forks
+worker processes that share the model weights copy-on-write. The parent
+runs no inference before forking (thread pools of torch/OpenMP are not
+fork-safe); each worker warms its pipelines up after the fork.
+Jobs are dispatched to the workers over local multiprocessing queues.
+"""
+import gc
+import itertools
+import multiprocessing as mp
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+
+def get_process_memory(pid: int) -> Dict[str, float]:
+    """
+    Resident and proportional memory of a process (Linux only)
+
+    Args:
+        pid: Process id
+
+    Returns:
+        rss_mb, pss_mb (resident memory with shared pages split between
+        their users) and shared_mb; empty when /proc is unavailable
+    """
+    fields = {"Rss": "rss_mb", "Pss": "pss_mb", "Shared_Clean": "shared_mb", "Shared_Dirty": "shared_mb"}
+    memory: Dict[str, float] = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name in fields:
+                    key = fields[name]
+                    memory[key] = memory.get(key, 0.0) + int(value.split()[0]) / 1024
+    except (OSError, ValueError, IndexError):
+        return {}
+    return {key: round(value, 1) for key, value in memory.items()}
+
+
+def _worker_main(
+    targets: Dict[str, Any],
+    tasks: "mp.Queue",
+    results: "mp.Queue",
+    threads: int,
+    warm_up: bool = True
+) -> None:
+    """
+    Worker loop: warm up the inherited pipelines, report it (a message with
+    job id None), then run jobs against them.
+    Jobs run on a few threads so the pipelines' micro-batchers can still
+    coalesce concurrent requests inside the worker.
+    """
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        # N workers x all cores would oversubscribe the CPU
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) // max(1, threads)))
+
+    errors: Dict[str, str] = {}
+    if warm_up:
+        for name, target in targets.items():
+            if hasattr(target, "warm_up"):
+                try:
+                    target.warm_up()
+                except Exception as e:
+                    errors[name] = f"{type(e).__name__}: {e}"
+    results.put((None, not errors, {"pid": os.getpid(), "errors": errors}))
+
+    def run(job_id: int, target: str, method: str, args: tuple, kwargs: dict) -> None:
+        try:
+            result = getattr(targets[target], method)(*args, **kwargs)
+            if isinstance(result, Future):
+                result = result.result()
+            results.put((job_id, True, result))
+        except Exception as e:
+            results.put((job_id, False, f"{type(e).__name__}: {e}"))
+
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="pool-job") as executor:
+        while True:
+            job = tasks.get()
+            if job is None:
+                break
+            executor.submit(run, *job)
+
+
+class ProcessInferencePool:
+    """
+    Fork-based worker pool over already-loaded pipelines.
+    start() must be called before the parent starts any threads of its own
+    (including micro-batcher and inference executor threads) or runs any
+    inference, since only the forking thread survives in the children.
+    CPU only: CUDA cannot be used across fork.
+    """
+
+    def __init__(
+        self,
+        targets: Dict[str, Any],
+        workers: int = 2,
+        threads_per_worker: int = 4,
+        warm_up: bool = True
+    ):
+        """
+        Initialize the pool
+
+        Args:
+            targets: Objects jobs can call, by name (e.g. {"classify": pipeline})
+            workers: Number of worker processes
+            threads_per_worker: Concurrent jobs per worker
+            warm_up: Run each target's warm_up() in every worker after the fork
+        """
+        self.targets = targets
+        self.num_workers = max(1, workers)
+        self.threads_per_worker = max(1, threads_per_worker)
+        self.warm_up = warm_up
+        self._ctx = mp.get_context("fork")
+        self._results = self._ctx.Queue()
+        self._workers: List[Dict[str, Any]] = []
+        self._futures: Dict[int, Future] = {}
+        self._job_worker: Dict[int, int] = {}
+        self._job_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._reader: Optional[threading.Thread] = None
+        self._closed = False
+        # Warm-up reports of the workers by pid, set once every worker reported or died
+        self._warm_reports: Dict[int, Dict[str, str]] = {}
+        self._warm = threading.Event()
+
+    def start(self) -> None:
+        """Fork the workers and start collecting their results"""
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_available() and torch.cuda.is_initialized():
+            raise RuntimeError("Process-pool serving needs CPU models; CUDA cannot be shared across fork")
+
+        # Move everything allocated so far out of the collector's reach, so
+        # garbage collection in the children does not touch (and copy) the
+        # parent's pages
+        gc.collect()
+        gc.freeze()
+
+        for index in range(self.num_workers):
+            tasks = self._ctx.Queue()
+            process = self._ctx.Process(
+                target=_worker_main,
+                args=(self.targets, tasks, self._results, self.threads_per_worker, self.warm_up),
+                name=f"inference-worker-{index}",
+                daemon=True
+            )
+            process.start()
+            self._workers.append({"process": process, "tasks": tasks, "in_flight": 0, "jobs": 0, "alive": True})
+
+        gc.unfreeze()
+        self._reader = threading.Thread(target=self._read_results, name="pool-results", daemon=True)
+        self._reader.start()
+        logger.info(f"Started {self.num_workers} inference worker processes sharing {', '.join(self.targets)}")
+
+    def submit(self, target: str, method: str, *args: Any, **kwargs: Any) -> Future:
+        """
+        Run target.method(*args, **kwargs) in the least busy worker
+
+        Args:
+            target: Name of an object passed to the pool
+            method: Method to call on it
+            args: Positional arguments (must be picklable)
+            kwargs: Keyword arguments (must be picklable)
+
+        Returns:
+            Future resolved with the method's result
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Inference pool is closed")
+            candidates = [i for i, worker in enumerate(self._workers) if worker["alive"]]
+            if not candidates:
+                raise RuntimeError("No live inference workers")
+            index = min(candidates, key=lambda i: self._workers[i]["in_flight"])
+            job_id = next(self._job_ids)
+            self._futures[job_id] = future
+            self._job_worker[job_id] = index
+            self._workers[index]["in_flight"] += 1
+            self._workers[index]["jobs"] += 1
+        self._workers[index]["tasks"].put((job_id, target, method, args, kwargs))
+        return future
+
+    def _finish(self, job_id: int) -> Optional[Future]:
+        with self._lock:
+            future = self._futures.pop(job_id, None)
+            index = self._job_worker.pop(job_id, None)
+            if index is not None:
+                self._workers[index]["in_flight"] -= 1
+        return future
+
+    def _read_results(self) -> None:
+        while not self._closed:
+            try:
+                job_id, ok, payload = self._results.get(timeout=1.0)
+            except queue.Empty:
+                self._check_workers()
+                continue
+            except (EOFError, OSError):
+                return
+            if job_id is None:
+                self._record_warm_up(payload)
+                continue
+            future = self._finish(job_id)
+            if future is None:
+                continue
+            if ok:
+                future.set_result(payload)
+            else:
+                future.set_exception(RuntimeError(payload))
+
+    def _record_warm_up(self, report: Dict[str, Any]) -> None:
+        for name, error in report["errors"].items():
+            logger.error(f"Inference worker {report['pid']} failed to warm up '{name}': {error}")
+        with self._lock:
+            self._warm_reports[report["pid"]] = report["errors"]
+        self._check_warm()
+
+    def _check_warm(self) -> None:
+        with self._lock:
+            settled = all(
+                worker["process"].pid in self._warm_reports or not worker["alive"]
+                for worker in self._workers
+            )
+        if settled:
+            self._warm.set()
+
+    def wait_warm(self, timeout: Optional[float] = None) -> Dict[str, str]:
+        """
+        Wait until every worker has warmed up its pipelines
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            Warm-up errors by target name (from any worker)
+
+        Raises:
+            TimeoutError: When the workers are still warming up
+        """
+        if not self._warm.wait(timeout):
+            raise TimeoutError("Inference workers are still warming up")
+        with self._lock:
+            errors: Dict[str, str] = {}
+            for worker_errors in self._warm_reports.values():
+                errors.update(worker_errors)
+            if not any(worker["alive"] for worker in self._workers):
+                errors = {name: "no live inference workers" for name in self.targets}
+            return errors
+
+    def _check_workers(self) -> None:
+        """Fail the jobs of workers that died"""
+        for index, worker in enumerate(self._workers):
+            if not worker["alive"] or worker["process"].is_alive():
+                continue
+            worker["alive"] = False
+            logger.error(f"Inference worker {worker['process'].pid} exited with code {worker['process'].exitcode}")
+            with self._lock:
+                lost = [job_id for job_id, i in self._job_worker.items() if i == index]
+            for job_id in lost:
+                future = self._finish(job_id)
+                if future is not None:
+                    future.set_exception(RuntimeError("Inference worker died"))
+            self._check_warm()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Per-worker load and memory
+
+        Returns:
+            Parent memory plus, per worker, pid, liveness, in-flight and total
+            jobs, and RSS/PSS/shared memory
+        """
+        with self._lock:
+            workers = [
+                {
+                    "pid": worker["process"].pid,
+                    "alive": worker["alive"] and worker["process"].is_alive(),
+                    "warm": worker["process"].pid in self._warm_reports,
+                    "in_flight": worker["in_flight"],
+                    "jobs": worker["jobs"],
+                    **get_process_memory(worker["process"].pid)
+                }
+                for worker in self._workers
+            ]
+        return {"parent": {"pid": os.getpid(), **get_process_memory(os.getpid())}, "workers": workers}
+
+    def close(self) -> None:
+        """Stop the workers after their queued jobs"""
+        with self._lock:
+            self._closed = True
+        for worker in self._workers:
+            if worker["process"].is_alive():
+                worker["tasks"].put(None)
+        for worker in self._workers:
+            worker["process"].join(timeout=10)
+
+
+class RemotePipeline:
+    """
+    Stand-in for a pipeline that lives in the pool's workers.
+    Method calls block until a worker returns the result, so existing
+    call sites work unchanged; attributes are not proxied.
+    """
+
+    cache = None
+    embedding_store = None
+
+    def __init__(self, pool: ProcessInferencePool, target: str):
+        self._pool = pool
+        self._target = target
+
+    def __getattr__(self, method: str):
+        if method.startswith("_"):
+            raise AttributeError(method)
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self._pool.submit(self._target, method, *args, **kwargs).result()
+
+        call.__name__ = method
+        return call
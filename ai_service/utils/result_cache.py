@@ -0,0 +1,341 @@
+"""
+Result Cache
+Restart-stable cache of pipeline results shared by all workers on a host.
+Keys are SHA-256 digests of the content, model revision and parameters;
+values live in a SQLite file with optional in-memory front caches per process.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+from ai_service.utils import DATA_DIR, ModelCache
+
+DEFAULT_RESULT_CACHE_PATH = os.path.join(DATA_DIR, "result_cache.sqlite")
+
+
+# SQLite stores whose per-thread connections a forked child must not reuse
+_fork_sensitive_stores: "weakref.WeakSet" = weakref.WeakSet()
+# Connections inherited from the parent. Closing them in the child could
+# checkpoint or remove the parent's WAL, so they are kept open and unused
+_inherited_connections: List[sqlite3.Connection] = []
+
+
+def _reset_connections_after_fork() -> None:
+    for store in list(_fork_sensitive_stores):
+        inherited = getattr(store._local, "conn", None)
+        if inherited is not None:
+            _inherited_connections.append(inherited)
+        store._local = threading.local()
+
+
+def reconnect_after_fork(store: Any) -> None:
+    """
+    Give a store with per-thread SQLite connections (in store._local.conn)
+    fresh connections in forked child processes
+    """
+    _fork_sensitive_stores.add(store)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_connections_after_fork)
+
+
+def _json_default(value: Any) -> Any:
+    """Encode numpy scalars/arrays as plain numbers and anything else as text"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+def content_key(namespace: str, *parts: Any, **params: Any) -> str:
+    """
+    Stable cache key for a pipeline call
+
+    Args:
+        namespace: Kind of result (e.g. "classify"), keeps pipelines apart
+        parts: Content the result depends on (text, model revision, ...)
+        params: Call parameters the result depends on
+
+    Returns:
+        Hex SHA-256 digest, identical across processes and restarts
+    """
+    payload = json.dumps([namespace, parts, params], sort_keys=True, default=_json_default)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def model_revision(model_name: str, model: Any = None) -> str:
+    """
+    Identify the exact weights a result was produced with
+
+    Args:
+        model_name: Hugging Face model name or local path
+        model: Loaded model; its config carries the hub commit hash
+
+    Returns:
+        "name@revision", where revision is the hub commit hash, the
+        modification time of a local checkpoint, or "unknown"; models loaded
+        in reduced precision or run through ONNX Runtime get a suffix such as
+        "+int8" or "+onnx" since their outputs differ slightly
+    """
+    suffix = ""
+    precision = getattr(model, "inference_precision", None)
+    if precision and precision != "fp32":
+        suffix += f"+{precision}"
+    backend = getattr(model, "inference_backend", None)
+    if backend and backend != "torch":
+        suffix += f"+{backend}"
+
+    commit = getattr(getattr(model, "config", None), "_commit_hash", None)
+    if commit:
+        return f"{model_name}@{commit}{suffix}"
+
+    # Local checkpoints are retrained in place, so their mtime is the revision
+    config_path = os.path.join(model_name, "config.json")
+    if os.path.exists(config_path):
+        return f"{model_name}@{int(os.path.getmtime(config_path))}{suffix}"
+    return f"{model_name}@unknown{suffix}"
+
+
+class SQLiteResultStore:
+    """
+    Single-file key/value store for JSON-serialisable results.
+    SQLite in WAL mode lets several worker processes read and write the same
+    file concurrently; each thread keeps its own connection.
+    """
+
+    def __init__(self, path: str, max_rows: int = 100_000):
+        """
+        Open (or create) the store
+
+        Args:
+            path: SQLite database file
+            max_rows: Rows kept before the oldest entries are pruned
+        """
+        self.path = path
+        self.max_rows = max_rows
+        self._local = threading.local()
+        reconnect_after_fork(self)
+        self._writes = 0
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "errors": 0}
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS results_created ON results(created)")
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        Read a stored result
+
+        Args:
+            key: Cache key
+            max_age: Ignore entries older than this many seconds
+
+        Returns:
+            The stored value, or None if missing, expired or unreadable
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT value, created FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache read failed: {e}")
+            self._count("errors")
+            return None
+
+        if row is None or (max_age is not None and time.time() - row[1] > max_age):
+            self._count("misses")
+            return None
+        self._count("hits")
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a result, pruning the oldest rows every few hundred writes
+
+        Args:
+            key: Cache key
+            value: JSON-serialisable result
+        """
+        try:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, created) VALUES (?, ?, ?)",
+                (key, json.dumps(value, default=_json_default), time.time())
+            )
+            conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Result cache write failed: {e}")
+            self._count("errors")
+            return
+
+        with self._lock:
+            self._stats["writes"] += 1
+            self._writes += 1
+            prune = self._writes % 500 == 0
+        if prune:
+            self._prune()
+
+    def _prune(self) -> None:
+        """Delete the oldest rows beyond max_rows"""
+        try:
+            conn = self._connection()
+            conn.execute(
+                "DELETE FROM results WHERE key IN ("
+                "SELECT key FROM results ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                (self.max_rows,)
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache prune failed: {e}")
+
+    def clear(self) -> None:
+        conn = self._connection()
+        conn.execute("DELETE FROM results")
+        conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        try:
+            rows = self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        except sqlite3.Error:
+            rows = None
+        with self._lock:
+            return {**self._stats, "rows": rows, "path": self.path}
+
+
+class TieredResultCache:
+    """
+    In-memory ModelCache in front of a shared SQLiteResultStore.
+    Exposes the same get/set/clear/stats interface as ModelCache, so
+    pipelines can use either.
+    """
+
+    def __init__(
+        self,
+        front: Optional[ModelCache] = None,
+        store: Optional[SQLiteResultStore] = None,
+        ttl_seconds: Optional[float] = None
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            front: Per-process in-memory tier (None to always read the store)
+            store: Shared on-disk tier (None to keep results in memory only)
+            ttl_seconds: Age after which entries of the shared tier are ignored
+        """
+        self.front = front
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        if self.front is not None:
+            value = self.front.get(key)
+            if value is not None:
+                return value
+        if self.store is None:
+            return None
+
+        value = self.store.get(key, max_age=self.ttl_seconds)
+        if value is not None and self.front is not None:
+            self.front.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if self.front is not None:
+            self.front.set(key, value)
+        if self.store is not None:
+            self.store.set(key, value)
+
+    def clear(self) -> None:
+        """Clear the in-memory tier (the shared tier belongs to all workers)"""
+        if self.front is not None:
+            self.front.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.front.stats() if self.front is not None else {}
+        if self.store is not None:
+            stats["shared"] = self.store.stats()
+        return stats
+
+
+_stores: Dict[str, SQLiteResultStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_result_store(path: Optional[str] = None) -> Optional[SQLiteResultStore]:
+    """
+    Process-wide shared store for a database file
+
+    Args:
+        path: SQLite file (defaults to AI_RESULT_CACHE_PATH, then
+              DEFAULT_RESULT_CACHE_PATH; an empty value disables the store)
+
+    Returns:
+        The store, or None when disabled or the file cannot be opened
+    """
+    if path is None:
+        path = os.getenv("AI_RESULT_CACHE_PATH", DEFAULT_RESULT_CACHE_PATH)
+    if not path:
+        return None
+
+    with _stores_lock:
+        if path not in _stores:
+            try:
+                _stores[path] = SQLiteResultStore(path)
+                logger.info(f"Shared result cache at {path}")
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Shared result cache unavailable ({e}); using memory only")
+                return None
+        return _stores[path]
+
+
+def build_result_cache(
+    max_size: Optional[int] = 1000,
+    max_bytes: Optional[int] = None,
+    ttl_seconds: Optional[float] = None,
+    path: Optional[str] = None
+) -> TieredResultCache:
+    """
+    Result cache with an in-memory front and the shared on-disk tier
+
+    Args:
+        max_size: Entry limit of the in-memory tier
+        max_bytes: Byte budget of the in-memory tier
+        ttl_seconds: Expiry applied to both tiers
+        path: SQLite file of the shared tier (see get_result_store)
+
+    Returns:
+        A TieredResultCache
+    """
+    return TieredResultCache(
+        front=ModelCache(max_size=max_size, max_bytes=max_bytes, ttl_seconds=ttl_seconds),
+        store=get_result_store(path),
+        ttl_seconds=ttl_seconds
+    )
@@ -0,0 +1,312 @@
+"""
+Persistent Vector Index
+Append-only, memory-mapped store of report embeddings with inner-product
+top-k search. Pure numpy, so it works offline without FAISS or a vector DB.
+"""
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+import numpy as np
+from loguru import logger
+
+# Optional imports (file locking is POSIX-only; without it the index is
+# still safe for a single writer process)
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+
+class VectorIndex:
+    """
+    Flat inner-product index over L2-normalised float32 vectors.
+    Vectors live in a raw float32 file that is memory-mapped for search;
+    report ids and summaries live in a JSON-lines file alongside it, each
+    record carrying the row of its vector. Several processes can share one
+    index: appends are serialised with a file lock and every process tails
+    the metadata file to pick up rows added by the others.
+    With nlist > 0 the index switches to an IVF-style partitioned mode once
+    enough vectors are stored: vectors are bucketed by nearest centroid and
+    a query only scans the nprobe closest buckets.
+    """
+
+    VECTORS_FILE = "vectors.f32"
+    METADATA_FILE = "metadata.jsonl"
+    HEADER_FILE = "header.json"
+    CENTROIDS_FILE = "centroids.npy"
+
+    def __init__(
+        self,
+        path: str,
+        dim: Optional[int] = None,
+        model_name: Optional[str] = None,
+        nlist: int = 0,
+        nprobe: int = 4,
+        train_size: Optional[int] = None
+    ):
+        """
+        Open (or create) an index directory
+
+        Args:
+            path: Directory holding the index files
+            dim: Vector dimension; inferred from the first vector if not given
+            model_name: Embedding model name, stored so vectors from a different
+                        model are never mixed into the same index
+            nlist: Number of partitions for IVF mode (0 keeps a flat index)
+            nprobe: Partitions scanned per query in IVF mode
+            train_size: Vectors needed before partitions are trained
+                        (default 16 * nlist)
+        """
+        self.path = path
+        self.dim = dim
+        self.model_name = model_name
+        self.nlist = nlist
+        self.nprobe = max(1, nprobe)
+        self.train_size = train_size or 16 * nlist
+        self.count = 0
+        # Metadata by vector row; rows without metadata (an interrupted append) are skipped
+        self.metadata: Dict[int, Dict[str, Any]] = {}
+        self._metadata_position = 0
+        self._metadata_lines = 0
+
+        self._lock = threading.Lock()
+        self._vectors: Optional[np.ndarray] = None
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+
+        os.makedirs(path, exist_ok=True)
+        self._load()
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _load(self) -> None:
+        """Read the header, metadata and centroids of an existing index"""
+        if not self._read_header():
+            return
+        self._refresh()
+        logger.info(f"Vector index loaded from {self.path}: {len(self.metadata)} vectors")
+
+    def _read_header(self) -> bool:
+        """Take the dimension and model from the header, if the index has one"""
+        header_path = self._file(self.HEADER_FILE)
+        if not os.path.exists(header_path):
+            return False
+
+        with open(header_path, "r", encoding="utf-8") as f:
+            header = json.load(f)
+
+        stored_model = header.get("model_name")
+        if self.model_name and stored_model and stored_model != self.model_name:
+            raise ValueError(
+                f"Vector index at {self.path} was built with '{stored_model}', not '{self.model_name}'"
+            )
+        self.model_name = self.model_name or stored_model
+        self.dim = header["dim"]
+        return True
+
+    def _vector_rows(self) -> int:
+        path = self._file(self.VECTORS_FILE)
+        return os.path.getsize(path) // (4 * self.dim) if os.path.exists(path) else 0
+
+    def _refresh(self) -> None:
+        """Read metadata records appended since the last refresh, by this or another process"""
+        metadata_path = self._file(self.METADATA_FILE)
+        if self.dim is None or not os.path.exists(metadata_path):
+            return
+        with open(metadata_path, "rb") as f:
+            f.seek(self._metadata_position)
+            chunk = f.read()
+
+        # Only consume complete lines; a writer may be mid-append
+        end = chunk.rfind(b"\n") + 1
+        if end:
+            vector_rows = self._vector_rows()
+            for line in chunk[:end].splitlines():
+                if not line.strip():
+                    continue
+                # Records written before rows were stored pair up with vectors by position
+                legacy_row = self._metadata_lines
+                self._metadata_lines += 1
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn line left by a crashed writer
+                row = entry.pop("row", legacy_row)
+                # A crash between the two appends can leave metadata without its vector
+                if row < vector_rows:
+                    self.metadata[row] = entry
+            self._metadata_position += end
+        self._sync_rows()
+
+    def _sync_rows(self) -> None:
+        """Extend the row count and partition assignments to the known metadata"""
+        self.count = max(self.count, max(self.metadata, default=-1) + 1)
+        if self.nlist and self._centroids is None and os.path.exists(self._file(self.CENTROIDS_FILE)):
+            # Partitions trained by another process
+            self._centroids = np.load(self._file(self.CENTROIDS_FILE))
+            self._assignments = np.zeros(0, dtype=np.int32)
+        if self._centroids is not None and len(self._assignments) < self.count:
+            new_rows = np.asarray(self._matrix()[len(self._assignments):])
+            self._assignments = np.append(self._assignments, self._assign(new_rows))
+
+    def _write_header(self) -> None:
+        with open(self._file(self.HEADER_FILE), "w", encoding="utf-8") as f:
+            json.dump({"dim": self.dim, "model_name": self.model_name}, f)
+
+    def _matrix(self) -> np.ndarray:
+        """Memory-mapped view of the stored vectors"""
+        if self.count == 0:
+            return np.zeros((0, self.dim or 0), dtype=np.float32)
+        if self._vectors is None or self._vectors.shape[0] != self.count:
+            self._vectors = np.memmap(
+                self._file(self.VECTORS_FILE),
+                dtype=np.float32,
+                mode="r",
+                shape=(self.count, self.dim)
+            )
+        return self._vectors
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def add(self, vector: np.ndarray, report_id: str, summary: str = "", **extra: Any) -> None:
+        """
+        Append one report embedding to the index
+
+        Args:
+            vector: Embedding of the report
+            report_id: Id returned with search results
+            summary: Summary returned with search results
+            extra: Additional JSON-serialisable metadata to store
+        """
+        vector = self._normalize(np.ravel(vector))
+
+        with self._lock, open(self._file(self.METADATA_FILE), "ab") as metadata_file:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(metadata_file, fcntl.LOCK_EX)
+            try:
+                # Another process may have created the index or appended rows
+                if not self._read_header():
+                    self.dim = self.dim or vector.shape[0]
+                    self._write_header()
+                if vector.shape[0] != self.dim:
+                    raise ValueError(f"Expected vector of dimension {self.dim}, got {vector.shape[0]}")
+                self._refresh()
+
+                with open(self._file(self.VECTORS_FILE), "ab") as f:
+                    offset = f.seek(0, os.SEEK_END)
+                    row = -(-offset // (4 * self.dim))
+                    # Pad over a torn vector so rows stay aligned
+                    f.write(b"\0" * (row * 4 * self.dim - offset))
+                    f.write(vector.tobytes())
+
+                entry = {"report_id": report_id, "summary": summary, **extra}
+                if os.fstat(metadata_file.fileno()).st_size > self._metadata_position:
+                    # Terminate a torn line left by a crashed writer
+                    metadata_file.write(b"\n")
+                metadata_file.write((json.dumps({**entry, "row": row}) + "\n").encode("utf-8"))
+                metadata_file.flush()
+                self._metadata_position = os.fstat(metadata_file.fileno()).st_size
+                self._metadata_lines += 1
+
+                self.metadata[row] = entry
+                self._sync_rows()
+                if self.nlist and self._centroids is None and len(self.metadata) >= self.train_size:
+                    self._train()
+            finally:
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(metadata_file, fcntl.LOCK_UN)
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """Nearest centroid for each vector"""
+        return np.argmax(vectors @ self._centroids.T, axis=1).astype(np.int32)
+
+    def _train(self, iterations: int = 10) -> None:
+        """Spherical k-means over the stored vectors to build the IVF partitions"""
+        matrix = np.asarray(self._matrix())
+        rng = np.random.default_rng(0)
+        centroids = matrix[rng.choice(self.count, size=self.nlist, replace=False)].copy()
+
+        for _ in range(iterations):
+            assignments = np.argmax(matrix @ centroids.T, axis=1)
+            for c in range(self.nlist):
+                members = matrix[assignments == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+            centroids = self._normalize(centroids)
+
+        self._centroids = centroids
+        self._assignments = self._assign(matrix)
+        np.save(self._file(self.CENTROIDS_FILE), centroids)
+        logger.info(f"Vector index trained {self.nlist} partitions over {self.count} vectors")
+
+    def search(
+        self,
+        query: np.ndarray,
+        top_k: int = 5,
+        threshold: float = 0.0,
+        exclude_ids: Optional[set] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the stored reports most similar to a query embedding
+
+        Args:
+            query: Query embedding
+            top_k: Number of neighbours to return
+            threshold: Minimum cosine similarity
+            exclude_ids: Report ids to leave out of the results
+
+        Returns:
+            Matches with report_id, similarity_score and summary, best first
+        """
+        with self._lock:
+            self._refresh()
+            if self.count == 0:
+                return []
+            query = self._normalize(np.ravel(query))
+            matrix = self._matrix()
+
+            if self._centroids is not None:
+                n_probe = min(self.nprobe, self.nlist)
+                probe = np.argpartition(self._centroids @ query, -n_probe)[-n_probe:]
+                candidates = np.flatnonzero(np.isin(self._assignments, probe))
+                scores = matrix[candidates] @ query
+            else:
+                candidates = None
+                scores = matrix @ query
+
+            # argpartition needs 0 < k <= len(scores); probed partitions can be empty
+            if top_k <= 0 or scores.size == 0:
+                return []
+            k = min(top_k + len(exclude_ids or ()), scores.shape[0])
+            best = np.argpartition(scores, -k)[-k:]
+            best = best[np.argsort(scores[best])[::-1]]
+
+            results = []
+            for idx in best:
+                score = float(scores[idx])
+                if score < threshold:
+                    break
+                row = int(candidates[idx]) if candidates is not None else int(idx)
+                entry = self.metadata.get(row)
+                if entry is None:
+                    continue
+                if exclude_ids and entry["report_id"] in exclude_ids:
+                    continue
+                results.append({
+                    "report_id": entry["report_id"],
+                    "similarity_score": round(score, 4),
+                    "summary": entry.get("summary", "")
+                })
+                if len(results) >= top_k:
+                    break
+            return results
+
+    def __len__(self) -> int:
+        return len(self.metadata)
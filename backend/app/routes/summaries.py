@@ -27,13 +27,15 @@ def get_summaries(db: Session = Depends(get_db)):
     
     print(f"DEBUG: Grouped reports categories: {list(grouped_reports.keys())}")
     
-    for category, category_reports in grouped_reports.items():
-        if not category_reports:
-            continue
-
+    # Summarize every category in one batch request instead of one request per category
+    categories = [category for category, category_reports in grouped_reports.items() if category_reports]
+    category_summaries = ai_pipeline.summarize_report_groups(
+        [[r.text for r in grouped_reports[category]] for category in categories]
+    )
+    
+    for category, summary_text in zip(categories, category_summaries):
+        category_reports = grouped_reports[category]
         print(f"DEBUG: Processing category: {category}")
-        report_texts = [r.text for r in category_reports]
-        summary_text = ai_pipeline.summarize_reports(report_texts)
         
         # Simple reputation score calculation based on verified count
         verified_count = sum(1 for r in category_reports if r.is_verified)
@@ -60,6 +60,44 @@ class AIPipeline:
             print(f"Error calling AI service (summarize): {e}")
             return ""
 
+    def summarize_report_groups(self, groups: list[list[str]]) -> list[str]:
+        """
+        Generates one summary per group of report texts with a single batch call to the AI Service.
+        """
+        summaries = [""] * len(groups)
+        combined_texts = [" ".join(texts) for texts in groups]
+        
+        # Texts under the service's 50 char minimum are returned as is, like summarize_reports.
+        pending = []
+        for i, combined_text in enumerate(combined_texts):
+            if len(combined_text) < 50:
+                summaries[i] = combined_text
+            else:
+                pending.append(i)
+        
+        if not pending:
+            return summaries
+        
+        try:
+            payload = {
+                "texts": [combined_texts[i] for i in pending],
+                "max_length": 150,
+                "min_length": 30
+            }
+            
+            response = requests.post(f"{self.base_url}/api/summarize/batch", json=payload)
+            response.raise_for_status()
+            results = response.json().get("results", [])
+            
+            for i, result in zip(pending, results):
+                if result.get("success") and result.get("summary"):
+                    summaries[i] = result["summary"]
+            return summaries
+            
+        except Exception as e:
+            print(f"Error calling AI service (summarize batch): {e}")
+            return summaries
+
     def verify_news(self, text: str, source_url: str = None) -> dict:
         """
         Verifies news credibility via AI Service.
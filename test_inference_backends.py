@@ -0,0 +1,124 @@
+"""
+Inference Backend Test
+Builds tiny random classification, NER and seq2seq models on disk and checks
+that the classifier, entity extractor and summarizer follow the backend the
+model registry actually loaded: when AI_INFERENCE_BACKEND asks for ONNX on a
+device the registry only runs torch on, each must fall back to its torch
+path instead of feeding numpy inputs to a torch model.
+
+Usage:
+    python test_inference_backends.py
+"""
+import os
+import sys
+import tempfile
+
+from transformers import (
+    BartConfig,
+    BartForConditionalGeneration,
+    BertConfig,
+    BertForSequenceClassification,
+    BertForTokenClassification,
+    BertTokenizer
+)
+
+from ai_service.models.classifier import CategoryClassifier
+from ai_service.models.ner import EntityExtractor
+from ai_service.models.registry import ModelRegistry, model_registry
+from ai_service.models.summarizer import TextSummarizer
+
+WORDS = ["flood", "in", "saptari", "road", "blocked", "by", "landslide", "near", "kathmandu", "public", "safety"]
+TEXT = "Flood in Saptari . Road blocked by landslide near Kathmandu ."
+
+
+def save_model(directory, model):
+    """Save a model with the shared tiny tokenizer"""
+    os.makedirs(directory)
+    vocab_path = os.path.join(directory, "vocab.txt")
+    with open(vocab_path, "w") as f:
+        f.write("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "."] + WORDS))
+    model.save_pretrained(directory)
+    BertTokenizer(vocab_path).save_pretrained(directory)
+    return directory
+
+
+def make_models(root):
+    """Tiny random models for each head, by role"""
+    bert = dict(vocab_size=32, hidden_size=16, num_hidden_layers=1, num_attention_heads=2, intermediate_size=32)
+    bart = dict(
+        vocab_size=32, d_model=16, encoder_layers=1, decoder_layers=1, encoder_attention_heads=2,
+        decoder_attention_heads=2, encoder_ffn_dim=32, decoder_ffn_dim=32, max_position_embeddings=128,
+        pad_token_id=0, bos_token_id=2, eos_token_id=3, decoder_start_token_id=2, forced_eos_token_id=3
+    )
+    return {
+        "classifier": save_model(os.path.join(root, "classifier"), BertForSequenceClassification(BertConfig(
+            num_labels=3, label2id={"contradiction": 0, "neutral": 1, "entailment": 2},
+            id2label={0: "contradiction", 1: "neutral", 2: "entailment"}, **bert
+        ))),
+        "ner": save_model(os.path.join(root, "ner"), BertForTokenClassification(BertConfig(
+            num_labels=3, id2label={0: "O", 1: "B-LOC", 2: "I-LOC"}, label2id={"O": 0, "B-LOC": 1, "I-LOC": 2}, **bert
+        ))),
+        "summarizer": save_model(os.path.join(root, "summarizer"), BartForConditionalGeneration(BartConfig(**bart)))
+    }
+
+
+def check_onnx_off_cpu_falls_back_to_torch(models):
+    # Make the registry apply its fallbacks as if every model were on a GPU
+    normalize = ModelRegistry._normalize
+    ModelRegistry._normalize = staticmethod(
+        lambda model_name, device, precision, backend, warn=True: normalize(model_name, "cuda", precision, backend, warn)
+    )
+    try:
+        classifier = CategoryClassifier(models["classifier"], categories=["Public Safety", "Environment"], device="cpu", backend="onnx")
+        extractor = EntityExtractor(models["ner"], device="cpu", backend="onnx")
+        summarizer = TextSummarizer(models["summarizer"], device="cpu", backend="onnx")
+
+        assert classifier.backend == "torch", classifier.backend
+        result = classifier.classify(TEXT)
+        assert "error" not in result and result["category"] in ("Public Safety", "Environment"), result
+
+        assert extractor.backend == "torch" and extractor.ner_pipeline is not None, extractor.backend
+        extractor.ner_pipeline(TEXT)
+
+        assert summarizer.backend == "torch" and summarizer.encoder is None, summarizer.backend
+        result = summarizer.summarize(TEXT, max_length=8, min_length=1)
+        assert "error" not in result, result
+
+        # The summarizer's second acquire must have been handed back
+        refs = {entry["model_name"]: entry["refs"] for entry in model_registry.memory_report()}
+        assert refs == {models[role]: 1 for role in models}, refs
+        for model in (classifier, extractor, summarizer):
+            model.close()
+        assert model_registry.memory_report() == []
+    finally:
+        ModelRegistry._normalize = staticmethod(normalize)
+
+
+def check_cpu_keeps_requested_backend(models):
+    classifier = CategoryClassifier(models["classifier"], categories=["Public Safety"], device="cpu", backend="torch")
+    try:
+        assert classifier.backend == "torch" and classifier.model.inference_backend == "torch"
+    finally:
+        classifier.close()
+
+
+def main():
+    tests = [
+        check_onnx_off_cpu_falls_back_to_torch,
+        check_cpu_keeps_requested_backend
+    ]
+    failures = 0
+    with tempfile.TemporaryDirectory() as root:
+        models = make_models(root)
+        for test in tests:
+            try:
+                test(models)
+                print(f"✅ {test.__name__}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {test.__name__}: {e}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
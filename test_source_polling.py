@@ -0,0 +1,309 @@
+"""
+Source Polling Test
+Runs MultiSourceFetcher against a local stub HTTP server that plays the
+USGS, BIPAD, ReliefWeb and NewsData APIs, and checks that the sources are
+polled concurrently, that each respects its deadline, that a slow or
+failing source leaves the others' results intact, that repeated polls
+are incremental (conditional requests, cursors, no re-analysis of seen
+articles), that polls reuse pooled keep-alive connections, and that a
+caller's NewsData key is used for that one cycle only.
+
+Usage:
+    python test_source_polling.py
+"""
+import copy
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from ai_service.fetchers.orchestrator import MultiSourceFetcher
+from ai_service.utils.http_client import HttpClient
+
+USGS_FEED = {
+    "features": [
+        {
+            "id": "us7000abcd",
+            "geometry": {"coordinates": [85.3, 27.7, 10.0]},
+            "properties": {"mag": 5.1, "place": "10 km N of Kathmandu, Nepal", "time": 1760000000000}
+        },
+        {
+            "id": "us7000efgh",
+            "geometry": {"coordinates": [139.7, 35.6, 30.0]},
+            "properties": {"mag": 6.0, "place": "Tokyo, Japan", "time": 1760000000000}
+        }
+    ]
+}
+BIPAD_INCIDENTS = {
+    "results": [
+        {"id": 1, "incident_type": {"name": "Flood"}, "district": "Saptari", "created_on": "2025-12-24", "title": "Flood in Saptari"},
+        {"id": 2, "incident_type": {"name": "Landslide"}, "district": "Taplejung", "created_on": "2025-12-25", "title": "Landslide in Taplejung"}
+    ]
+}
+RELIEFWEB_REPORTS = {
+    "data": [
+        {"id": 99, "fields": {"title": "Nepal: Monsoon Floods Situation Report", "date": {"created": "2025-12-24"}, "url": "https://reliefweb.int/r/99"}}
+    ]
+}
+NEWS_RESULTS = {
+    "results": [
+        {
+            "article_id": "n1",
+            "title": "Koshi river crosses danger mark",
+            "description": "Flood alert issued in Saptari.",
+            "content": "Evacuation centers are being prepared in Nepal.",
+            "link": "https://news.example/koshi",
+            "pubDate": "2025-12-24 14:15:00"
+        }
+    ]
+}
+PAYLOADS = {"/usgs": USGS_FEED, "/bipad": BIPAD_INCIDENTS, "/reliefweb": RELIEFWEB_REPORTS, "/news": NEWS_RESULTS}
+
+
+class StubAPIs(BaseHTTPRequestHandler):
+    """
+    Serves PAYLOADS with an ETag (answering 304 to a matching If-None-Match);
+    behaviour[path] = {"delay": seconds, "status": code} alters a route.
+    requests records (method, path, request body) of every call and
+    news_keys the API key of every NewsData call.
+    """
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real APIs
+    behaviour = {}
+    requests = []
+    news_keys = []
+
+    def _respond(self, request_body=None):
+        path = self.path.split("?")[0]
+        self.requests.append((self.command, path, request_body))
+        if path == "/news":
+            self.news_keys.extend(parse_qs(urlsplit(self.path).query).get("apikey", []))
+        settings = self.behaviour.get(path, {})
+        time.sleep(settings.get("delay", 0))
+        status = settings.get("status", 200)
+        body = json.dumps(PAYLOADS.get(path, {}) if status == 200 else {"error": "stub failure"}).encode("utf-8")
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        self._respond(json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"null"))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubProcessor:
+    """Stands in for UnifiedProcessor so the test needs no models; analysed records its input texts"""
+
+    def __init__(self):
+        self.analysed = []
+
+    def process_reports(self, texts, source_urls=None, **kwargs):
+        self.analysed.extend(texts)
+        return [
+            {
+                "success": True,
+                "primary_category": "Flood",
+                "disaster_type": "Flood",
+                "location_entities": ["Saptari"],
+                "verification": {"status": "Likely Real", "is_reliable": True},
+                "summary": text[:60]
+            }
+            for text in texts
+        ]
+
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubAPIs)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_fetcher(base_url, deadlines=None, state_path=None, http=None):
+    # A fresh poll state per fetcher unless a check shares one between polls
+    state_path = state_path or os.path.join(tempfile.mkdtemp(), "poll_state.sqlite")
+    fetcher = MultiSourceFetcher(
+        news_api_key="stub-key",
+        source_deadlines=deadlines,
+        processor=StubProcessor(),
+        state_path=state_path,
+        http=http or HttpClient(retries=0)
+    )
+    fetcher.usgs.URL = f"{base_url}/usgs"
+    fetcher.bipad.BASE_URL = f"{base_url}/bipad"
+    fetcher.relief.BASE_URL = f"{base_url}/reliefweb"
+    fetcher.news.BASE_URL = f"{base_url}/news"
+    return fetcher
+
+
+def check_all_sources_ok(base_url):
+    StubAPIs.behaviour = {}
+    payload = make_fetcher(base_url).poll_all_sources()
+    assert [entry["status"] for entry in payload["sources"].values()] == ["ok"] * 4, payload["sources"]
+    assert len(payload["triggers"]) == 1  # the Tokyo quake is outside Nepal
+    assert len(payload["official_incidents"]) == 2
+    assert len(payload["context"]) == 1
+    assert payload["sources"]["news"]["items"] == 1
+    assert payload["news_intelligence"][0]["status"] == "Verified (Official Confirmation)"
+
+
+def check_sources_polled_concurrently(base_url):
+    StubAPIs.behaviour = {path: {"delay": 0.6} for path in PAYLOADS}
+    start = time.perf_counter()
+    results, sources = make_fetcher(base_url).fetch_sources()
+    elapsed = time.perf_counter() - start
+    # Sequential polling would take 4 x 0.6s plus a second NewsData query
+    assert elapsed < 1.8, f"poll took {elapsed:.2f}s"
+    assert all(entry["latency_ms"] >= 600 for entry in sources.values()), sources
+
+
+def check_slow_source_misses_deadline(base_url):
+    StubAPIs.behaviour = {"/bipad": {"delay": 3}}
+    start = time.perf_counter()
+    payload = make_fetcher(base_url, deadlines={"bipad": 0.5}).poll_all_sources()
+    elapsed = time.perf_counter() - start
+    assert elapsed < 2, f"poll waited {elapsed:.2f}s for the slow source"
+    assert payload["sources"]["bipad"]["status"] == "timeout"
+    assert payload["official_incidents"] == []
+    assert payload["sources"]["usgs"]["status"] == "ok" and len(payload["triggers"]) == 1
+    # Without the anchor the news stays unverified but is still delivered
+    assert payload["news_intelligence"][0]["status"] == "Unverified (Volunteer Source)"
+
+
+def check_failing_source_gives_partial_results(base_url):
+    StubAPIs.behaviour = {"/reliefweb": {"status": 500}, "/usgs": {"status": 503}}
+    payload = make_fetcher(base_url).poll_all_sources()
+    assert payload["sources"]["reliefweb"]["status"] == "error"
+    assert "500" in payload["sources"]["reliefweb"]["error"]
+    assert payload["sources"]["usgs"]["status"] == "error"
+    assert payload["context"] == [] and payload["triggers"] == []
+    assert payload["sources"]["bipad"]["status"] == "ok" and len(payload["official_incidents"]) == 2
+    assert payload["sources"]["news"]["status"] == "ok"
+
+
+def check_repeat_poll_is_incremental(base_url):
+    StubAPIs.behaviour = {}
+    fetcher = make_fetcher(base_url)
+    first = fetcher.poll_all_sources()
+    assert len(fetcher.ai.analysed) == 1
+
+    StubAPIs.requests = []
+    second = fetcher.poll_all_sources()
+    # USGS and BIPAD answered 304 and their last snapshot was served
+    assert second["sources"]["usgs"]["not_modified"] and second["sources"]["bipad"]["not_modified"]
+    assert second["triggers"] == first["triggers"] and second["official_incidents"] == first["official_incidents"]
+    # ReliefWeb was asked only for reports since the last one seen
+    reliefweb_body = next(body for method, path, body in StubAPIs.requests if path == "/reliefweb")
+    assert {"field": "date.created", "value": {"from": "2025-12-24"}} in reliefweb_body["filter"]["conditions"]
+    assert len(second["context"]) == 1
+    # The unchanged article was not analysed again but is still in the snapshot
+    assert len(fetcher.ai.analysed) == 1, fetcher.ai.analysed
+    assert fetcher.status()["news_reused"] == 1
+    assert [item["title"] for item in second["news_intelligence"]] == [item["title"] for item in first["news_intelligence"]]
+    assert second["news_intelligence"][0]["status"] == "Verified (Official Confirmation)"
+
+
+def check_changed_items_are_reprocessed(base_url):
+    StubAPIs.behaviour = {}
+    state_path = os.path.join(tempfile.mkdtemp(), "poll_state.sqlite")
+    make_fetcher(base_url, state_path=state_path).poll_all_sources()
+
+    original_news, original_reports = copy.deepcopy(NEWS_RESULTS), copy.deepcopy(RELIEFWEB_REPORTS)
+    try:
+        NEWS_RESULTS["results"][0]["content"] = "Update: water level receding in Saptari, Nepal."
+        RELIEFWEB_REPORTS["data"] = [
+            {"id": 100, "fields": {"title": "Nepal: Floods Update", "date": {"created": "2025-12-26"}, "url": "https://reliefweb.int/r/100"}}
+        ]
+        # A new fetcher on the same state file, as after a restart
+        fetcher = make_fetcher(base_url, state_path=state_path)
+        payload = fetcher.poll_all_sources()
+    finally:
+        NEWS_RESULTS.update(original_news)
+        RELIEFWEB_REPORTS.update(original_reports)
+
+    assert len(fetcher.ai.analysed) == 1 and "receding" in fetcher.ai.analysed[0]
+    # The new ReliefWeb report is merged into the stored snapshot
+    assert [item["id"] for item in payload["context"]] == ["100", "99"]
+
+
+def check_connections_are_reused(base_url):
+    StubAPIs.behaviour = {}
+    http = HttpClient(retries=0)
+    fetcher = make_fetcher(base_url, http=http)
+    fetcher.poll_all_sources()
+    fetcher.poll_all_sources()
+    host = http.metrics()["hosts"][base_url]
+    # 2 polls x (USGS, BIPAD, ReliefWeb, 2 NewsData queries) over at most 4 concurrent connections
+    assert host["requests"] == 10, host
+    assert host["connections_opened"] <= 4, host
+
+
+def check_transient_errors_are_retried(base_url):
+    StubAPIs.behaviour = {"/usgs": {"status": 503}}
+    StubAPIs.requests = []
+    http = HttpClient(retries=2, backoff=0.01)
+    results, sources = make_fetcher(base_url, http=http).fetch_sources()
+    assert sum(path == "/usgs" for method, path, body in StubAPIs.requests) == 3
+    assert sources["usgs"]["status"] == "error" and "503" in sources["usgs"]["error"]
+    assert http.metrics()["hosts"][base_url]["retries"] == 2
+
+
+def check_news_key_applies_to_one_cycle(base_url):
+    StubAPIs.behaviour = {}
+    fetcher = make_fetcher(base_url)
+    StubAPIs.news_keys = []
+    fetcher.poll_all_sources(news_api_key="caller-key")
+    assert set(StubAPIs.news_keys) == {"caller-key"}, StubAPIs.news_keys
+    StubAPIs.news_keys = []
+    fetcher.poll_all_sources()
+    assert set(StubAPIs.news_keys) == {"stub-key"}, StubAPIs.news_keys
+
+
+def main():
+    server = start_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    tests = [
+        check_all_sources_ok,
+        check_sources_polled_concurrently,
+        check_slow_source_misses_deadline,
+        check_failing_source_gives_partial_results,
+        check_repeat_poll_is_incremental,
+        check_changed_items_are_reprocessed,
+        check_connections_are_reused,
+        check_transient_errors_are_retried,
+        check_news_key_applies_to_one_cycle
+    ]
+    failures = 0
+    try:
+        for test in tests:
+            try:
+                test(base_url)
+                print(f"✅ {test.__name__}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {test.__name__}: {e}")
+    finally:
+        server.shutdown()
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
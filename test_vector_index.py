@@ -0,0 +1,75 @@
+"""
+Vector Index Test
+Builds small VectorIndex directories and checks that search returns the
+nearest reports, and returns nothing (instead of everything, or an error)
+for top_k=0 and when the probed IVF partitions hold no vectors.
+
+Usage:
+    python test_vector_index.py
+"""
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from ai_service.utils.vector_index import VectorIndex
+
+DIM = 8
+
+
+def make_index(nlist=0, nprobe=4):
+    """Ten reports close to the first axis, one along the second"""
+    path = tempfile.mkdtemp()
+    index = VectorIndex(path, dim=DIM, nlist=nlist, nprobe=nprobe, train_size=1000)
+    rng = np.random.default_rng(0)
+    for i in range(10):
+        index.add(np.eye(DIM)[0] + 0.05 * rng.standard_normal(DIM), f"r{i}", f"summary {i}")
+    index.add(np.eye(DIM)[1], "other", "other summary")
+    return index
+
+
+def check_search_returns_nearest():
+    index = make_index()
+    results = index.search(np.eye(DIM)[1], top_k=1)
+    assert [r["report_id"] for r in results] == ["other"], results
+    results = index.search(np.eye(DIM)[0], top_k=3, exclude_ids={"other"})
+    assert len(results) == 3 and all(r["report_id"].startswith("r") for r in results), results
+
+
+def check_zero_top_k_returns_nothing():
+    index = make_index()
+    assert index.search(np.eye(DIM)[0], top_k=0) == []
+    assert index.search(np.eye(DIM)[0], top_k=0, exclude_ids={"r1"}) == []
+    assert index.search(np.eye(DIM)[0], top_k=-1) == []
+
+
+def check_empty_probed_partition_returns_nothing():
+    path = make_index().path
+    # Partitions as another process could have trained them: every report
+    # falls in the first, none in the second
+    np.save(os.path.join(path, VectorIndex.CENTROIDS_FILE), np.stack([np.eye(DIM)[0], -np.eye(DIM)[0]]).astype(np.float32))
+    index = VectorIndex(path, nlist=2, nprobe=1, train_size=1000)
+    assert index.search(-np.eye(DIM)[0], top_k=5) == []
+    assert len(index.search(np.eye(DIM)[0], top_k=5)) == 5
+
+
+def main():
+    tests = [
+        check_search_returns_nearest,
+        check_zero_top_k_returns_nothing,
+        check_empty_probed_partition_returns_nothing
+    ]
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()